@@ -0,0 +1,39 @@
+"""Add a byte-order index on agent_sessions.session_id for per-user listing.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 00:00:00.000000
+
+agent_sessions is created by the Agents SDK on first use, so the index is
+only added here when the table already exists. On a fresh deployment the
+table does not exist yet; synaptiq.agents.session creates the index right
+after the SDK creates the table.
+"""
+
+from alembic import op
+
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # session_id is "<user_id>:<session_id>"; a "C"-collated index lets
+    # list_user_sessions range-scan one user's prefix
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('agent_sessions') IS NOT NULL THEN
+                CREATE INDEX IF NOT EXISTS ix_agent_sessions_session_id_c
+                ON agent_sessions (session_id COLLATE "C");
+            END IF;
+        END
+        $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_agent_sessions_session_id_c")
@@ -26,6 +26,7 @@ setup(
         "rich>=13.7.0",
         "python-dotenv>=1.0.0",
         "httpx>=0.26.0",
+        "orjson>=3.9.0",
         "tiktoken>=0.6.0",
         "tenacity>=8.2.0",
         "structlog>=24.1.0",
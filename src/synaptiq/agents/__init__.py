@@ -5,9 +5,9 @@ LLM-powered query agents using OpenAI Agents SDK for knowledge graph
 and vector store retrieval.
 """
 
-from .query_agent import QueryAgent
+from .query_agent import QueryAgent, warm_query_embedder
 from .context import AgentContext
-from .session import get_session, create_session_engine
+from .session import get_session, create_session_engine, warm_session_engine
 from .schemas import (
     IntentType,
     IntentClassification,
@@ -19,9 +19,11 @@ from .schemas import (
 
 __all__ = [
     "QueryAgent",
+    "warm_query_embedder",
     "AgentContext",
     "get_session",
     "create_session_engine",
+    "warm_session_engine",
     "IntentType",
     "IntentClassification",
     "RetrievalStrategy",
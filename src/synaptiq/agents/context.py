@@ -4,16 +4,17 @@ Agent context for dependency injection.
 The context is passed to all agents, tools, and handoffs during execution.
 """
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from synaptiq.storage.fuseki import FusekiStore
     from synaptiq.storage.qdrant import QdrantStore
-    from synaptiq.processors.embeddings import EmbeddingGenerator
+    from synaptiq.processors.embedder import BatchingEmbedder, EmbeddingGenerator
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentContext:
     """
     Context passed to all agents and tools during execution.
@@ -23,19 +24,25 @@ class AgentContext:
     - Store references for data access
     - Ontology schema for SPARQL generation
     
+    Immutable once built; one instance is created per request, so
+    `tool_limit` caps how many tool calls from one request's agents (which
+    may fan out in parallel) hit the embedding API and stores at once.
+    
     Attributes:
         user_id: User identifier for graph scoping
         fuseki_store: SPARQL client for knowledge graph
         qdrant_store: Vector store client for embeddings
-        embedding_generator: OpenAI embeddings generator
+        embedding_generator: Query embedder (batches concurrent calls)
         ontology_schema: TTL content for SPARQL agent prompt
+        tool_limit: Semaphore bounding concurrent tool backend calls
     """
     
     user_id: str
     fuseki_store: "FusekiStore"
     qdrant_store: "QdrantStore"
-    embedding_generator: "EmbeddingGenerator"
+    embedding_generator: "BatchingEmbedder | EmbeddingGenerator"
     ontology_schema: str
+    tool_limit: asyncio.Semaphore = field(default_factory=lambda: asyncio.Semaphore(8))
     
     def get_user_graph_uri(self) -> str:
         """Get the named graph URI for this user."""
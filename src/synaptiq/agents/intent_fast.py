@@ -0,0 +1,244 @@
+"""
+Rule-based intent fast path.
+
+Recognizes the short, unambiguous query shapes described in the intent
+taxonomy ("list all my concepts", "what is X", "hi") so they can skip LLM
+classification. Anything that does not match a rule cleanly is classified
+by the orchestrator as part of its retrieval tool call.
+"""
+
+import re
+from typing import Callable, Optional
+
+import structlog
+
+from .schemas import IntentClassification, IntentType
+
+logger = structlog.get_logger(__name__)
+
+# Minimum confidence for a fast-path result to skip LLM classification
+FAST_PATH_CONFIDENCE = 0.85
+
+# Longest entity (in words) accepted from a rule; longer captures are
+# usually full clauses the LLM should extract from
+_MAX_ENTITY_WORDS = 5
+
+_FLAGS = re.IGNORECASE
+
+_GREETING = re.compile(
+    r"^(hi|hello|hey|yo|thanks|thank you|thx|good (morning|afternoon|evening))"
+    r"( there)?[\s!.]*$",
+    _FLAGS,
+)
+
+_INVENTORY = re.compile(
+    r"^("
+    r"(list|show)( me)? (all|every(thing)?)( of)?( my| the)?( concepts| topics| knowledge)?"
+    r"|what (concepts|topics) (have i|do i know|did i)\b.*"
+    r"|what have i learned( so far)?"
+    r"|show( me)? everything i know"
+    r"|how many (concepts|topics|sources)\b.*"
+    r"|(give me )?(an )?overview of (my|everything)\b.*"
+    r")[\s?.!]*$",
+    _FLAGS,
+)
+
+_SOURCE_RECALL = re.compile(
+    r"^(what did i (learn|read|watch|note) (from|in)"
+    r"|(show|list)( me)?( my)? notes from"
+    r"|notes from) (?P<source>.+?)[\s?.!]*$",
+    _FLAGS,
+)
+
+_RELATIONSHIP = re.compile(
+    r"^(how (does|do|is|are) (?P<a>.+?) (relate|related|connect|connected) (to|with)"
+    r" (?P<b>.+?)"
+    r"|(what is the )?(connection|relationship|link) between (?P<c>.+?) and (?P<d>.+?))"
+    r"[\s?.!]*$",
+    _FLAGS,
+)
+
+_EXPLORATION = re.compile(
+    r"^(what do i know about|tell me about my notes on|what are my notes on)"
+    r" (?P<topic>.+?)[\s?.!]*$",
+    _FLAGS,
+)
+
+_SEMANTIC_SEARCH = re.compile(
+    r"^(find|search for|search|look for)( my)?( notes)?( about| on| for)? (?P<terms>.+?)[\s?.!]*$",
+    _FLAGS,
+)
+
+_DEFINITION = re.compile(
+    r"^(what is|what's|what are|define|explain) (an? |the )?(?P<term>.+?)[\s?.!]*$",
+    _FLAGS,
+)
+
+# Subjects a definition cannot have: pronouns that point back into the
+# conversation ("what is it?"), comparisons between several terms, and
+# time-dependent questions about the outside world
+_NON_DEFINITION_TERM = re.compile(
+    r"\b(it|this|that|these|those|they|them|he|she|him|her"
+    r"|difference|differences|between|versus|vs|compared?|and|or"
+    r"|today|tonight|tomorrow|yesterday|now|current|currently|latest"
+    r"|weather|time|date|news)\b",
+    _FLAGS,
+)
+
+# Longest term (in words) accepted as a definition subject
+_MAX_DEFINITION_WORDS = 3
+
+# Personal-knowledge markers that turn a "what is X" into something richer
+_PERSONAL = re.compile(r"\b(i|my|me|i've|i'm)\b", _FLAGS)
+
+
+def _entity(text: str) -> Optional[str]:
+    """Normalize a captured entity, rejecting empty or clause-length captures."""
+    entity = text.strip(" \t\"'").lower()
+    if not entity or len(entity.split()) > _MAX_ENTITY_WORDS:
+        return None
+    return entity
+
+
+class IntentFastClassifier:
+    """
+    Regex classifier for common, obvious query shapes.
+
+    Returns an IntentClassification with a confidence reflecting how
+    specific the matching rule is, or None when no rule applies. Keeps
+    running hit counts so the fast-path rate can be logged.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.hits = 0
+        self._rules: list[Callable[[str], Optional[IntentClassification]]] = [
+            self._greeting,
+            self._inventory,
+            self._source_recall,
+            self._relationship,
+            self._exploration,
+            self._semantic_search,
+            self._definition,
+        ]
+
+    def classify(self, query: str) -> Optional[IntentClassification]:
+        """
+        Classify a query without an LLM call.
+
+        Args:
+            query: Natural language query
+
+        Returns:
+            IntentClassification when a rule matches, else None
+        """
+        text = " ".join(query.split())
+        for rule in self._rules:
+            result = rule(text)
+            if result is not None:
+                return result
+        return None
+
+    def record(self, hit: bool) -> None:
+        """Track whether the fast path skipped LLM classification."""
+        self.total += 1
+        if hit:
+            self.hits += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of classified queries served by the fast path."""
+        return self.hits / self.total if self.total else 0.0
+
+    @staticmethod
+    def _greeting(text: str) -> Optional[IntentClassification]:
+        if not _GREETING.match(text):
+            return None
+        return IntentClassification(
+            intent=IntentType.GENERAL,
+            requires_personal_knowledge=False,
+            confidence=0.95,
+        )
+
+    @staticmethod
+    def _inventory(text: str) -> Optional[IntentClassification]:
+        if not _INVENTORY.match(text):
+            return None
+        return IntentClassification(intent=IntentType.INVENTORY, confidence=0.9)
+
+    @staticmethod
+    def _source_recall(text: str) -> Optional[IntentClassification]:
+        match = _SOURCE_RECALL.match(text)
+        if not match:
+            return None
+        source = match.group("source").strip(" \t\"'")
+        if not source:
+            return None
+        return IntentClassification(
+            intent=IntentType.SOURCE_RECALL,
+            source_filter=source,
+            confidence=0.9,
+        )
+
+    @staticmethod
+    def _relationship(text: str) -> Optional[IntentClassification]:
+        match = _RELATIONSHIP.match(text)
+        if not match:
+            return None
+        first = _entity(match.group("a") or match.group("c") or "")
+        second = _entity(match.group("b") or match.group("d") or "")
+        if not first or not second:
+            return None
+        return IntentClassification(
+            intent=IntentType.RELATIONSHIP,
+            entities=[first, second],
+            confidence=0.9,
+        )
+
+    @staticmethod
+    def _exploration(text: str) -> Optional[IntentClassification]:
+        match = _EXPLORATION.match(text)
+        if not match:
+            return None
+        topic = _entity(match.group("topic"))
+        if not topic:
+            return None
+        return IntentClassification(
+            intent=IntentType.EXPLORATION,
+            entities=[topic],
+            confidence=0.9,
+        )
+
+    @staticmethod
+    def _semantic_search(text: str) -> Optional[IntentClassification]:
+        match = _SEMANTIC_SEARCH.match(text)
+        if not match:
+            return None
+        terms = _entity(match.group("terms"))
+        if not terms:
+            return None
+        return IntentClassification(
+            intent=IntentType.SEMANTIC_SEARCH,
+            entities=[terms],
+            confidence=0.88,
+        )
+
+    @staticmethod
+    def _definition(text: str) -> Optional[IntentClassification]:
+        match = _DEFINITION.match(text)
+        if not match or _PERSONAL.search(text):
+            return None
+        term = _entity(match.group("term"))
+        if (
+            not term
+            or len(term.split()) > _MAX_DEFINITION_WORDS
+            or _NON_DEFINITION_TERM.search(term)
+        ):
+            return None
+        # Short "what is X" may still be general knowledge; DEFINITION's
+        # graph-first strategy falls back to the LLM when the graph is empty.
+        return IntentClassification(
+            intent=IntentType.DEFINITION,
+            entities=[term],
+            confidence=0.87,
+        )
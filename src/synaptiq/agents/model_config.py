@@ -7,6 +7,7 @@ and handles Agent construction for both OpenAI and Anthropic models.
 
 from __future__ import annotations
 
+import hashlib
 import os
 from dataclasses import dataclass
 from typing import Optional
@@ -107,3 +108,46 @@ def resolve_model_for_agent(
             return MODEL_MAP[DEFAULT_MODEL_ID].model_name
 
     return info.model_name
+
+
+def prompt_cache_settings(
+    model,
+    cache_key: str,
+    instructions: Optional[str] = None,
+):
+    """
+    Return ``ModelSettings`` that let the provider cache an agent's static prefix.
+
+    Agent instructions are static, so every call shares the same system
+    prompt prefix. OpenAI caches matching prefixes automatically; a stable
+    ``prompt_cache_key`` per agent routes its calls to the same cache.
+    Anthropic (via LiteLLM) only caches blocks marked with ``cache_control``,
+    so the system message is marked explicitly. The choice follows the model
+    the agent actually runs on, so an Anthropic selection that fell back to
+    OpenAI (litellm missing) never receives LiteLLM-only arguments.
+
+    When ``instructions`` are given, a digest of them is appended to the
+    cache key, so a prompt change starts a fresh cache instead of sharing
+    one with processes still running the old prompt.
+
+    Args:
+        model: The agent's ``model``: a model name, or a LitellmModel as
+            returned by resolve_model_for_agent
+        cache_key: Stable name of the agent the settings are for
+        instructions: The agent's system prompt, used to version the key
+    """
+    from agents import ModelSettings
+
+    if not isinstance(model, str):
+        return ModelSettings(
+            extra_args={
+                "cache_control_injection_points": [
+                    {"location": "message", "role": "system"},
+                ],
+            },
+        )
+
+    if instructions is not None:
+        digest = hashlib.blake2b(instructions.encode(), digest_size=4).hexdigest()
+        cache_key = f"{cache_key}-{digest}"
+    return ModelSettings(extra_body={"prompt_cache_key": f"synaptiq-{cache_key}"})
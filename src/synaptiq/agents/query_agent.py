@@ -5,9 +5,14 @@ Coordinates intent classification, strategy selection, retrieval execution,
 and response synthesis using OpenAI Agents SDK.
 """
 
+import asyncio
+import functools
+import hashlib
+import io
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, AsyncIterator, Any
+from typing import Final, Optional, AsyncIterator, Any
 import structlog
 
 from config.settings import get_settings
@@ -18,12 +23,14 @@ _settings = get_settings()
 if not os.environ.get("OPENAI_API_KEY"):
     os.environ["OPENAI_API_KEY"] = _settings.openai_api_key
 
-from agents import Agent, Runner
+from agents import Agent, RunContextWrapper, Runner, function_tool
 from agents.result import RunResultStreaming
+from openai.types.responses import ResponseTextDeltaEvent
 
-from synaptiq.storage.fuseki import FusekiStore
-from synaptiq.storage.qdrant import QdrantStore
-from synaptiq.processors.embedder import EmbeddingGenerator
+from synaptiq.core.cache import MISSING, TTLCache
+from synaptiq.storage.fuseki import IRI, FusekiStore, escape_literal
+from synaptiq.storage.qdrant import QdrantBatchCoalescer, QdrantStore
+from synaptiq.processors.embedder import BatchingEmbedder, EmbeddingGenerator
 from synaptiq.ontology.namespaces import get_sparql_prefixes, expand_synonyms
 
 from .context import AgentContext
@@ -36,32 +43,337 @@ from .schemas import (
     RetrievalMetadata,
 )
 from .prompts import (
-    INTENT_CLASSIFIER_SYSTEM_PROMPT,
     RESPONSE_SYNTHESIZER_SYSTEM_PROMPT,
     ORCHESTRATOR_SYSTEM_PROMPT,
 )
 from .tools import vector_search, get_concept_details
 from .sparql_agent import create_sparql_agent, load_ontology_schema
-from .session import get_session
+from .session import get_session, warm_session_engine
+from .response_cache import SemanticResponseCache
+from .intent_fast import FAST_PATH_CONFIDENCE, IntentFastClassifier
 from .model_config import (
     resolve_model_for_agent,
+    prompt_cache_settings,
     get_model_info,
     DEFAULT_MODEL_ID,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Shared across per-request QueryAgent instances so hit-rate stats accumulate
+_fast_classifier = IntentFastClassifier()
+
+# Intents the orchestrator classified, keyed by (model, prompt version,
+# normalized query digest); a repeated query skips the classification turn
+_intent_cache = TTLCache(maxsize=10_000, ttl=3600)
+_INTENT_PROMPT_VERSION: Final = hashlib.blake2b(
+    ORCHESTRATOR_SYSTEM_PROMPT.encode(), digest_size=8
+).hexdigest()
+
+# Intent -> retrieval strategy; unmapped intents use HYBRID
+_STRATEGY_MAP: Final[dict[IntentType, RetrievalStrategy]] = {
+    IntentType.DEFINITION: RetrievalStrategy.GRAPH_FIRST,
+    IntentType.EXPLORATION: RetrievalStrategy.GRAPH_FIRST,
+    IntentType.RELATIONSHIP: RetrievalStrategy.GRAPH_ONLY,
+    IntentType.SOURCE_RECALL: RetrievalStrategy.GRAPH_FIRST,
+    IntentType.SEMANTIC_SEARCH: RetrievalStrategy.VECTOR_FIRST,
+    IntentType.INVENTORY: RetrievalStrategy.GRAPH_ONLY,
+    IntentType.GENERAL: RetrievalStrategy.LLM_ONLY,
+}
+
+# Caps applied to graph results before they reach the synthesizer prompt
+MAX_CHUNKS_PER_CONCEPT = 3
+MAX_RELATIONSHIPS = 20
+
+# Payload keys the pipeline reads from vector hits (display, citations and
+# graph enrichment); other keys are left on the Qdrant server
+_VECTOR_PAYLOAD_FIELDS: Final = [
+    "text",
+    "source_title",
+    "source_url",
+    "source_type",
+    "timestamp_start_ms",
+    "concepts",
+]
+
+# Lengths of the excerpts written into the synthesizer prompt
+DISPLAY_TEXT_CHARS = 500
+DISPLAY_SNIPPET_CHARS = 200
+
+
+@dataclass(slots=True, frozen=True)
+class FieldSelection:
+    """How much of each retrieved item the synthesizer prompt includes."""
+
+    relationships: int = 5
+    chunks: int = 3
+    # Vector results listed in vector sections; None lists all of them
+    vectors: Optional[int] = None
+
+
+_DEFAULT_FIELDS: Final = FieldSelection()
+
+# Intents whose answers only need part of each result. A definition
+# rests on the definition text, so sibling relationships are noise; a
+# relationship answer needs the edges more than the passages.
+_FIELDS_BY_INTENT: Final[dict[IntentType, FieldSelection]] = {
+    IntentType.DEFINITION: FieldSelection(relationships=0, chunks=1, vectors=3),
+    IntentType.RELATIONSHIP: FieldSelection(relationships=10, chunks=1),
+    IntentType.SEMANTIC_SEARCH: FieldSelection(relationships=0, chunks=2, vectors=5),
+}
+
+
+def _select_fields_for_intent(intent: IntentClassification) -> FieldSelection:
+    """Return the prompt section limits for an intent."""
+    return _FIELDS_BY_INTENT.get(intent.intent, _DEFAULT_FIELDS)
+
+
+# Strong references to fire-and-forget tasks (cache writes, pool warmup)
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _spawn_background(coro) -> None:
+    """Run a coroutine without awaiting it, keeping it referenced until done."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+_ERROR_ANSWER: Final = (
+    "I apologize, but I encountered an error while processing your query. "
+    "Please try again."
+)
+
+
+def _error_response() -> QueryResponse:
+    """Fallback returned when query() fails; built fresh, as callers may mutate it."""
+    return QueryResponse(
+        answer=_ERROR_ANSWER,
+        citations=[],
+        concepts_referenced=[],
+        confidence=0.0,
+        source_type="error",
+        retrieval_metadata=RetrievalMetadata(
+            retrieval_source="error",
+            fallback_chain=[],
+            has_citations=False,
+            confidence=0.0,
+        ),
+    )
+
+
+# Identical retrievals (same user, strategy, intent and query) share one
+# backend round-trip while in flight, and their result for a few seconds
+# after; keys start with the user ID so graph writes invalidate them
+RETRIEVAL_CACHE_TTL_SECONDS = 5.0
+_inflight_retrievals: dict[tuple, "asyncio.Task[dict]"] = {}
+_retrieval_cache = TTLCache(maxsize=512, ttl=RETRIEVAL_CACHE_TTL_SECONDS)
+
+
+def _normalize_query(query: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    return " ".join(query.lower().split()).rstrip(" ?!.")
+
+
+# QueryAgent is built per request, so the source-scope cache lives at module
+# level. Keys are (user_id, graph version, normalized filter): ingestion in
+# any process bumps the version (FusekiStore.graph_version), so a newly
+# ingested source is picked up at once; entries expire after 5 minutes.
+_source_document_ids_cache = TTLCache(maxsize=2048, ttl=300)
+
+
+# Process-wide vector search coalescer so concurrent requests share
+# batched Qdrant round-trips; created lazily with its own long-lived store
+@functools.cache
+def _get_search_coalescer() -> QdrantBatchCoalescer:
+    """Return the shared coalescer, creating it on first use."""
+    return QdrantBatchCoalescer(QdrantStore())
+
+
+# Process-wide embedding batcher: query embeddings from concurrent requests
+# and parallel tool calls share one embeddings API call per window
+@functools.cache
+def _get_embedding_batcher() -> BatchingEmbedder:
+    """Return the shared embedding batcher, creating it on first use."""
+    return BatchingEmbedder(EmbeddingGenerator())
+
+
+async def warm_query_embedder() -> None:
+    """Open the shared query embedder's API connection (call at startup)."""
+    await _get_embedding_batcher().embedder.warmup()
+
+
+def _payload_to_source(payload: dict) -> dict:
+    """Build a citation source entry from a vector search payload."""
+    return {
+        "title": payload.get("source_title", ""),
+        "url": payload.get("source_url", ""),
+        "type": payload.get("source_type", ""),
+        "text": (payload.get("text") or "")[:200],
+        "timestamp": payload.get("timestamp_start_ms"),
+    }
+
+
+@dataclass(slots=True)
+class GraphConcept:
+    """A concept returned by graph retrieval (entity lookup, recall or inventory)."""
+
+    uri: str
+    entity: str
+    details: dict
+    relationships: list
+    chunk_texts: list
+    # Synthesis-input block, filled in by QueryAgent._prepare_display
+    rendered: str = ""
+
+
+def _graph_detail_to_source(result: GraphConcept) -> dict:
+    """Build a citation source entry from a graph concept result."""
+    details = result.details or {}
+    definition = details.get("definitionText")
+    return {
+        "title": details.get("sourceTitle", "") or result.entity,
+        "url": details.get("sourceUrl", ""),
+        "type": "graph",
+        "text": definition[:200] if definition else "",
+    }
+
 
 class QueryAgent:
     """
     Main query agent that orchestrates the retrieval pipeline.
     
     Components:
-    1. Intent Classifier - Determines query type
-    2. Strategy Selector - Maps intent to retrieval strategy
-    3. SPARQL Agent - Queries knowledge graph
-    4. Vector Tool - Searches embeddings
-    5. Response Synthesizer - Generates final response
+    1. Intent Fast Path - Rule-based classification of obvious queries
+    2. Orchestrator - Classifies other queries via its retrieve_knowledge
+       tool call and answers in the same run
+    3. Strategy Selector - Maps intent to retrieval strategy
+    4. SPARQL Agent - Queries knowledge graph
+    5. Vector Tool - Searches embeddings
+    6. Response Synthesizer - Generates the response for fast-path queries
+    """
+
+    # SPARQL templates. Per-request values are passed to FusekiStore.query
+    # as initial_bindings, so the query text itself never changes.
+    # `text:` templates require a jena-text index (FusekiStore.has_text_index).
+    # That index spans every user's graph and its hit limit is applied before
+    # the FROM scoping, so other tenants' matches could use it up: text
+    # lookups ask for up to 10000 hits and the query's own LIMIT applies
+    # after scoping.
+    _SPARQL_SOURCE_DOCUMENT_IDS = """
+    SELECT DISTINCT ?documentId
+    WHERE {
+        ?source a syn:Source ;
+                syn:sourceTitle ?sourceTitle ;
+                syn:documentId ?documentId .
+        FILTER(CONTAINS(LCASE(?sourceTitle), ?sourceTerm))
+    }
+    LIMIT 100
+    """
+
+    _SPARQL_SOURCE_DOCUMENT_IDS_TEXT = """
+    PREFIX text: <http://jena.apache.org/text#>
+    SELECT DISTINCT ?documentId
+    WHERE {
+        ?source text:query (syn:sourceTitle ?sourceQuery 10000) .
+        ?source a syn:Source ;
+                syn:documentId ?documentId .
+    }
+    LIMIT 100
+    """
+
+    # Slots: {prefix}, {source_match}, {entity_match}, {entity_filter},
+    # {limit}, {max_chars}. Chunk text is truncated server-side so only the
+    # part the prompt can use crosses the wire.
+    _SPARQL_SOURCE_RECALL = """
+    {prefix}
+    SELECT ?concept ?label ?definitionText ?sourceTitle ?sourceUrl ?linkType
+           (SUBSTR(?fullText, 1, {max_chars}) AS ?chunkText)
+    WHERE {{
+        {source_match}
+        {entity_match}
+        ?source a syn:Source ;
+                syn:sourceTitle ?sourceTitle .
+        OPTIONAL {{ ?source syn:sourceUrl ?sourceUrl }}
+
+        ?chunk syn:derivedFrom ?source .
+        {{
+            ?concept syn:definedIn ?chunk .
+            BIND("defined" AS ?linkType)
+        }}
+        UNION
+        {{
+            ?concept syn:mentionedIn ?chunk .
+            BIND("mentioned" AS ?linkType)
+        }}
+
+        ?concept a syn:Concept ;
+                 syn:label ?label .
+        OPTIONAL {{
+            ?concept syn:hasDefinition ?def .
+            ?def syn:definitionText ?definitionText .
+        }}
+        OPTIONAL {{ ?chunk syn:chunkText ?fullText }}
+        {entity_filter}
+    }}
+    ORDER BY ?label
+    LIMIT {limit}
+    """
+
+    _SOURCE_MATCH_CONTAINS = "FILTER(CONTAINS(LCASE(?sourceTitle), ?sourceTerm))"
+
+    _SOURCE_MATCH_TEXT = "?source text:query (syn:sourceTitle ?sourceQuery 10000) ."
+
+    _ENTITY_MATCH_TEXT = """{
+            ?concept text:query (syn:label ?entityQuery 10000) .
+        }
+        UNION
+        {
+            ?matchedDef text:query (syn:definitionText ?entityQuery 10000) .
+            ?concept syn:hasDefinition ?matchedDef .
+        }"""
+
+    # Slots: {limit}, {max_chars}
+    _SPARQL_FETCH_CHUNKS = """
+    SELECT ?concept ?sourceTitle ?sourceUrl ?linkType
+           (SUBSTR(?fullText, 1, {max_chars}) AS ?chunkText)
+    WHERE {{
+        {{
+            ?concept syn:definedIn ?chunk .
+            BIND("defined" AS ?linkType)
+        }}
+        UNION
+        {{
+            ?concept syn:mentionedIn ?chunk .
+            BIND("mentioned" AS ?linkType)
+        }}
+        ?chunk syn:chunkText ?fullText .
+        OPTIONAL {{
+            ?chunk syn:derivedFrom ?source .
+            ?source syn:sourceTitle ?sourceTitle .
+            OPTIONAL {{ ?source syn:sourceUrl ?sourceUrl }}
+        }}
+    }}
+    LIMIT {limit}
+    """
+
+    _SPARQL_INVENTORY = """
+    SELECT DISTINCT ?label ?definitionText ?sourceTitle
+    WHERE {
+        ?concept a syn:Concept .
+        ?concept syn:label ?label .
+        OPTIONAL {
+            ?concept syn:hasDefinition ?def .
+            ?def syn:definitionText ?definitionText .
+        }
+        OPTIONAL {
+            ?concept syn:definedIn ?chunk .
+            ?chunk syn:derivedFrom ?source .
+            ?source syn:sourceTitle ?sourceTitle .
+        }
+    }
+    ORDER BY ?label
+    LIMIT 50
     """
     
     def __init__(
@@ -84,9 +396,27 @@ class QueryAgent:
         """
         self.fuseki = fuseki_store or FusekiStore()
         self.qdrant = qdrant_store or QdrantStore()
-        self.embedder = embedding_generator or EmbeddingGenerator()
+        # Query embeddings go through a batcher; an injected generator gets
+        # its own, otherwise the process-wide one (and its client) is reused
+        self._embedding_batcher = (
+            _get_embedding_batcher()
+            if embedding_generator is None
+            else BatchingEmbedder(embedding_generator)
+        )
+        self.embedder = self._embedding_batcher.embedder
+        # An injected store may point elsewhere, so it gets its own coalescer
+        self._search_coalescer = (
+            _get_search_coalescer()
+            if qdrant_store is None
+            else QdrantBatchCoalescer(self.qdrant)
+        )
         self._model_id = model_id or DEFAULT_MODEL_ID
         self._anthropic_api_key = anthropic_api_key
+        self._response_cache = (
+            SemanticResponseCache(self.qdrant)
+            if _settings.response_cache_enabled
+            else None
+        )
         
         # Load ontology schema
         self.ontology_schema = load_ontology_schema()
@@ -104,14 +434,6 @@ class QueryAgent:
             anthropic_api_key=self._anthropic_api_key,
         )
 
-        # Intent Classifier
-        self.intent_classifier = Agent[AgentContext](
-            name="Intent Classifier",
-            instructions=INTENT_CLASSIFIER_SYSTEM_PROMPT,
-            model=resolved,
-            output_type=IntentClassification,
-        )
-        
         # SPARQL Agent
         self.sparql_agent = create_sparql_agent(
             ontology_schema=self.ontology_schema,
@@ -123,14 +445,22 @@ class QueryAgent:
             name="Response Synthesizer",
             instructions=RESPONSE_SYNTHESIZER_SYSTEM_PROMPT,
             model=resolved,
+            model_settings=prompt_cache_settings(
+                resolved, "synthesizer", RESPONSE_SYNTHESIZER_SYSTEM_PROMPT
+            ),
             output_type=QueryResponse,
         )
         
-        # Main Orchestrator
+        # Main Orchestrator: classifies queries the fast path misses by
+        # calling retrieve_knowledge (added per query, see _orchestrator_for)
+        # and answers in the same run
         self.orchestrator = Agent[AgentContext](
             name="Query Orchestrator",
             instructions=ORCHESTRATOR_SYSTEM_PROMPT,
             model=resolved,
+            model_settings=prompt_cache_settings(
+                resolved, "orchestrator", ORCHESTRATOR_SYSTEM_PROMPT
+            ),
             tools=[
                 vector_search,
                 get_concept_details,
@@ -139,6 +469,7 @@ class QueryAgent:
                     tool_description="Query the user's knowledge graph using SPARQL. Use this for definitions, relationships, and source-based lookups.",
                 ),
             ],
+            output_type=QueryResponse,
         )
     
     def _create_context(self, user_id: str) -> AgentContext:
@@ -147,22 +478,232 @@ class QueryAgent:
             user_id=user_id,
             fuseki_store=self.fuseki,
             qdrant_store=self.qdrant,
-            embedding_generator=self.embedder,
+            embedding_generator=self._embedding_batcher,
             ontology_schema=self.ontology_schema,
+            tool_limit=asyncio.Semaphore(max(1, _settings.agent_tool_max_concurrency)),
+        )
+    
+    def _fast_intent(self, query: str) -> Optional[IntentClassification]:
+        """
+        Classify intent with the rule-based fast path or the intent cache.
+        
+        Returns None when no rule is confident enough and the query was not
+        classified before; the orchestrator then classifies the query
+        through its retrieve_knowledge call.
+        """
+        fast = _fast_classifier.classify(query)
+        hit = fast is not None and fast.confidence > FAST_PATH_CONFIDENCE
+        _fast_classifier.record(hit)
+        logger.debug(
+            "Intent fast path",
+            hit=hit,
+            hit_rate=round(_fast_classifier.hit_rate, 3),
+        )
+        if hit:
+            return fast
+
+        cached = _intent_cache.get(self._intent_cache_key(query))
+        if cached is not MISSING:
+            logger.debug("Intent cache hit", intent=cached.intent.value)
+            return cached
+        return None
+
+    def _intent_cache_key(self, query: str) -> tuple[str, str, bytes]:
+        """Key a query's intent by model, prompt version and normalized text."""
+        digest = hashlib.blake2b(
+            _normalize_query(query).encode(), digest_size=16
+        ).digest()
+        return (self._model_id, _INTENT_PROMPT_VERSION, digest)
+
+    def _remember_intent(
+        self,
+        query: str,
+        intent: Optional[IntentClassification],
+    ) -> None:
+        """
+        Cache an orchestrator-classified intent for repeats of `query`.
+        
+        Only intents whose entities all appear in the query are cached; the
+        orchestrator sees conversation history, so "tell me more about it"
+        may resolve to entities that are specific to one conversation.
+        """
+        if intent is None:
+            return
+        text = query.lower()
+        if all(entity.lower() in text for entity in intent.entities):
+            _intent_cache.set(self._intent_cache_key(query), intent)
+
+    def _orchestrator_for(
+        self,
+        query: str,
+        query_vector: Optional[list[float]],
+        capture: dict,
+        output_type: Any = QueryResponse,
+        speculative_vector: Optional["asyncio.Task[list[dict]]"] = None,
+    ) -> Agent[AgentContext]:
+        """
+        Build the orchestrator for one query, with a retrieve_knowledge tool
+        bound to it.
+        
+        The tool's arguments are the intent classification, so classifying
+        and retrieving take one tool call instead of a separate classifier
+        run. The intent and retrieval results it produces are stored in
+        `capture` for citation enrichment and caching. A `speculative_vector`
+        search started before the run is reused when the chosen strategy
+        would run the same search.
+        """
+        agent = self
+
+        @function_tool
+        async def retrieve_knowledge(
+            ctx: RunContextWrapper[AgentContext],
+            intent: IntentType,
+            entities: list[str],
+            source_filter: Optional[str] = None,
+        ) -> str:
+            """
+            Retrieve context for the user's question from their knowledge base.
+            
+            Args:
+                intent: The classified intent type
+                entities: Actual concept names from the question (empty for INVENTORY/SOURCE_RECALL)
+                source_filter: Source the user refers to, if any (e.g. a video or course title)
+                
+            Returns:
+                Retrieved context formatted for answering
+            """
+            classification = IntentClassification(
+                intent=intent,
+                entities=entities,
+                requires_personal_knowledge=intent != IntentType.GENERAL,
+                source_filter=source_filter,
+                confidence=0.5,
+            )
+            retrieval_results = await agent._retrieve(
+                query,
+                ctx.context,
+                classification,
+                query_vector,
+                speculative_vector=speculative_vector,
+            )
+            capture["intent"] = classification
+            capture["retrieval"] = retrieval_results
+            return agent._format_synthesis_input(
+                query, classification, retrieval_results
+            )
+
+        return self.orchestrator.clone(
+            tools=[retrieve_knowledge, *self.orchestrator.tools],
+            output_type=output_type,
         )
     
+    def _start_speculative_vector(
+        self,
+        query: str,
+        context: AgentContext,
+        query_vector: Optional[list[float]],
+    ) -> Optional["asyncio.Task[list[dict]]"]:
+        """
+        Start the unscoped vector search for `query` before its intent is known.
+        
+        Every strategy except GRAPH_ONLY/LLM_ONLY runs this exact search when
+        the query has no source filter, so it can overlap with the
+        orchestrator's classification call instead of following it.
+        """
+        if not _settings.speculative_retrieval_enabled:
+            return None
+        return asyncio.create_task(
+            self._query_vector(query, context, query_vector=query_vector)
+        )
+
     def _select_strategy(self, intent: IntentClassification) -> RetrievalStrategy:
         """Map intent to retrieval strategy."""
-        mapping = {
-            IntentType.DEFINITION: RetrievalStrategy.GRAPH_FIRST,
-            IntentType.EXPLORATION: RetrievalStrategy.GRAPH_FIRST,
-            IntentType.RELATIONSHIP: RetrievalStrategy.GRAPH_ONLY,
-            IntentType.SOURCE_RECALL: RetrievalStrategy.GRAPH_FIRST,
-            IntentType.SEMANTIC_SEARCH: RetrievalStrategy.VECTOR_FIRST,
-            IntentType.INVENTORY: RetrievalStrategy.GRAPH_ONLY,
-            IntentType.GENERAL: RetrievalStrategy.LLM_ONLY,
-        }
-        return mapping.get(intent.intent, RetrievalStrategy.HYBRID)
+        return _STRATEGY_MAP.get(intent.intent, RetrievalStrategy.HYBRID)
+
+    async def _retrieve(
+        self,
+        query: str,
+        context: AgentContext,
+        intent: IntentClassification,
+        query_vector: Optional[list[float]] = None,
+        speculative_vector: Optional["asyncio.Task[list[dict]]"] = None,
+    ) -> dict:
+        """Select and execute the retrieval strategy for a classified query."""
+        logger.info(
+            "Intent classified",
+            intent=intent.intent.value,
+            entities=intent.entities,
+            confidence=intent.confidence,
+        )
+        
+        strategy = self._select_strategy(intent)
+        logger.info("Strategy selected", strategy=strategy.value)
+        
+        retrieval_results = await self._execute_strategy(
+            strategy,
+            query,
+            context,
+            intent,
+            query_vector=query_vector,
+            speculative_vector=speculative_vector,
+        )
+        
+        raw_results = retrieval_results.get("results", [])
+        if isinstance(raw_results, dict):
+            result_count = sum(
+                len(v) for v in raw_results.values() if isinstance(v, list)
+            )
+        else:
+            result_count = len(raw_results)
+        
+        logger.info(
+            "Retrieval complete",
+            source=retrieval_results.get("source"),
+            result_count=result_count,
+        )
+        
+        return retrieval_results
+
+    @staticmethod
+    def _prepare_display(
+        retrieval_results: dict,
+        fields: FieldSelection = _DEFAULT_FIELDS,
+    ) -> None:
+        """
+        Precompute the excerpts and labels the synthesis formatter writes.
+        
+        Done once inside the (possibly shared) retrieval, before its result
+        is handed out or cached, so `_format_synthesis_input` only writes
+        prepared strings: `display_text` on vector results and
+        chunk texts, `link_label` on chunk texts, `display_definition`
+        on concept details, and each concept's `rendered` block limited by
+        `fields` (see `_select_fields_for_intent`).
+        """
+        results = retrieval_results.get("results", [])
+        if isinstance(results, dict):
+            graph = results.get("graph", [])
+            vector = results.get("vector", [])
+        elif retrieval_results.get("source") == "vector":
+            graph, vector = [], results
+        else:
+            graph, vector = results, []
+        
+        for r in graph:
+            details = r.details
+            if details:
+                details["display_definition"] = (
+                    details.get("definitionText") or "No definition"
+                )[:DISPLAY_SNIPPET_CHARS]
+            for ct in r.chunk_texts:
+                # Already cut to DISPLAY_TEXT_CHARS by the SPARQL query
+                ct["display_text"] = ct.get("text") or ""
+                ct["link_label"] = (
+                    "Defines" if ct.get("link_type") == "defined" else "Mentions"
+                )
+            r.rendered = QueryAgent._render_concept(r, fields)
+        
+        for r in vector:
+            r["display_text"] = r.get("payload", {}).get("text", "")[:DISPLAY_TEXT_CHARS]
     
     async def _execute_strategy(
         self,
@@ -170,15 +711,99 @@ class QueryAgent:
         query: str,
         context: AgentContext,
         intent: IntentClassification,
+        query_vector: Optional[list[float]] = None,
+        speculative_vector: Optional["asyncio.Task[list[dict]]"] = None,
     ) -> dict:
         """
         Execute the selected retrieval strategy with fallbacks.
         
+        If `query_vector` is given (e.g. from the response cache probe) it is
+        reused instead of embedding the query again. A `speculative_vector`
+        search (see `_start_speculative_vector`) stands in for the vector
+        search when the intent has no source filter.
+        
         Returns dict with:
         - source: 'graph', 'vector', or 'llm_knowledge'
         - results: Retrieved data
         - fallback_chain: List of sources tried
+        
+        Concurrent identical retrievals are coalesced into one, and the
+        result is reused for RETRIEVAL_CACHE_TTL_SECONDS. A retrieval that
+        uses the caller's speculative search runs on its own, though it
+        still joins a shared one already in flight. Results come back
+        already prepared for display (see `_prepare_display`). Each caller
+        gets its own top-level dict, but the result lists and concepts in
+        it are shared and must be treated as read-only.
         """
+        if strategy == RetrievalStrategy.LLM_ONLY:
+            return await self._execute_strategy_uncoalesced(
+                strategy, query, context, intent
+            )
+
+        key = (
+            context.user_id,
+            strategy,
+            intent.intent,
+            tuple(sorted(entity.lower() for entity in intent.entities)),
+            (intent.source_filter or "").lower(),
+            # Graph-only retrieval depends on the intent, not the query text
+            "" if strategy == RetrievalStrategy.GRAPH_ONLY else _normalize_query(query),
+        )
+        cached = _retrieval_cache.get(key)
+        if cached is not MISSING:
+            logger.debug("Retrieval cache hit", strategy=strategy.value)
+            return dict(cached)
+
+        task = _inflight_retrievals.get(key)
+        if task is not None:
+            logger.debug("Joined in-flight retrieval", strategy=strategy.value)
+            # Shielded so one caller giving up does not cancel the shared work
+            return dict(await asyncio.shield(task))
+
+        if speculative_vector is not None:
+            # The speculative search belongs to this caller, which cancels it
+            # once its query finishes, so work depending on it is not shared
+            result = await self._execute_strategy_uncoalesced(
+                strategy,
+                query,
+                context,
+                intent,
+                query_vector=query_vector,
+                speculative_vector=speculative_vector,
+            )
+            _retrieval_cache.set(key, result)
+            return dict(result)
+
+        task = asyncio.create_task(
+            self._execute_strategy_uncoalesced(
+                strategy,
+                query,
+                context,
+                intent,
+                query_vector=query_vector,
+            )
+        )
+        _inflight_retrievals[key] = task
+
+        def _settle(done: "asyncio.Task[dict]") -> None:
+            _inflight_retrievals.pop(key, None)
+            if not done.cancelled() and done.exception() is None:
+                _retrieval_cache.set(key, done.result())
+
+        task.add_done_callback(_settle)
+
+        return dict(await asyncio.shield(task))
+
+    async def _execute_strategy_uncoalesced(
+        self,
+        strategy: RetrievalStrategy,
+        query: str,
+        context: AgentContext,
+        intent: IntentClassification,
+        query_vector: Optional[list[float]] = None,
+        speculative_vector: Optional["asyncio.Task[list[dict]]"] = None,
+    ) -> dict:
+        """Execute the selected retrieval strategy with fallbacks."""
         fallback_chain = []
         
         if strategy == RetrievalStrategy.LLM_ONLY:
@@ -188,9 +813,65 @@ class QueryAgent:
                 "fallback_chain": fallback_chain,
             }
 
-        vector_document_ids = await self._resolve_vector_document_scope(
-            context, intent
-        )
+        # Start embedding the query and resolving the source scope right
+        # away so both overlap with the graph lookups below; they are only
+        # awaited when a vector search actually runs. GRAPH_ONLY never
+        # touches the vector store, so it skips both entirely.
+        embedding_task = None
+        doc_scope_task = None
+        if intent.source_filter:
+            # A scoped search differs from the speculative unscoped one
+            speculative_vector = None
+        if query_vector is not None:
+            embedding_task = asyncio.get_running_loop().create_future()
+            embedding_task.set_result(query_vector)
+        elif strategy != RetrievalStrategy.GRAPH_ONLY and speculative_vector is None:
+            embedding_task = asyncio.create_task(
+                context.embedding_generator.generate_single(query)
+            )
+        if strategy != RetrievalStrategy.GRAPH_ONLY and intent.source_filter:
+            doc_scope_task = asyncio.create_task(
+                self._resolve_vector_document_scope(context, intent)
+            )
+        try:
+            retrieval_results = await self._run_strategy(
+                strategy,
+                query,
+                context,
+                intent,
+                embedding_task,
+                doc_scope_task,
+                speculative_vector,
+            )
+            # Prepared here, before the result can be shared or cached; the
+            # field limits depend only on intent.intent, part of the key
+            self._prepare_display(retrieval_results, _select_fields_for_intent(intent))
+            return retrieval_results
+        finally:
+            for task in (embedding_task, doc_scope_task):
+                if task is None:
+                    continue
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Mark a failed, unused result as retrieved
+                    task.exception()
+
+    async def _run_strategy(
+        self,
+        strategy: RetrievalStrategy,
+        query: str,
+        context: AgentContext,
+        intent: IntentClassification,
+        embedding_task: Optional["asyncio.Future[list[float]]"],
+        doc_scope_task: Optional["asyncio.Task[Optional[list[str]]]"],
+        speculative_vector: Optional["asyncio.Task[list[dict]]"] = None,
+    ) -> dict:
+        """
+        Dispatch a non-LLM_ONLY strategy, reusing the pre-computed query
+        embedding, vector document scope and speculative vector search.
+        """
+        fallback_chain = []
         
         if strategy in (RetrievalStrategy.GRAPH_FIRST, RetrievalStrategy.GRAPH_ONLY):
             # Try graph first
@@ -201,10 +882,8 @@ class QueryAgent:
                 # GRAPH_FIRST: also query vector to supplement with actual content
                 if strategy == RetrievalStrategy.GRAPH_FIRST:
                     fallback_chain.append("vector")
-                    vector_results = await self._query_vector(
-                        query,
-                        context,
-                        document_ids=vector_document_ids,
+                    vector_results = await self._strategy_vector_search(
+                        query, context, embedding_task, doc_scope_task, speculative_vector
                     )
                     
                     return {
@@ -226,10 +905,8 @@ class QueryAgent:
             # Fallback to vector (unless GRAPH_ONLY)
             if strategy == RetrievalStrategy.GRAPH_FIRST:
                 fallback_chain.append("vector")
-                vector_results = await self._query_vector(
-                    query,
-                    context,
-                    document_ids=vector_document_ids,
+                vector_results = await self._strategy_vector_search(
+                    query, context, embedding_task, doc_scope_task, speculative_vector
                 )
                 
                 if vector_results:
@@ -242,10 +919,8 @@ class QueryAgent:
         elif strategy == RetrievalStrategy.VECTOR_FIRST:
             # Try vector first
             fallback_chain.append("vector")
-            vector_results = await self._query_vector(
-                query,
-                context,
-                document_ids=vector_document_ids,
+            vector_results = await self._strategy_vector_search(
+                query, context, embedding_task, doc_scope_task, speculative_vector
             )
             
             if vector_results:
@@ -274,15 +949,27 @@ class QueryAgent:
                 }
         
         elif strategy == RetrievalStrategy.HYBRID:
-            # Execute both in parallel (simplified - sequential for now)
+            # The two lookups are independent, so run them concurrently and
+            # keep whichever side succeeded
             fallback_chain.extend(["graph", "vector"])
             
-            graph_results = await self._query_graph(query, context, intent)
-            vector_results = await self._query_vector(
-                query,
-                context,
-                document_ids=vector_document_ids,
+            graph_results, vector_results = await asyncio.gather(
+                self._query_graph(query, context, intent),
+                self._strategy_vector_search(
+                    query, context, embedding_task, doc_scope_task, speculative_vector
+                ),
+                return_exceptions=True,
             )
+            # Cancellation is not a failed lookup; only errors degrade to empty
+            for outcome in (graph_results, vector_results):
+                if isinstance(outcome, asyncio.CancelledError):
+                    raise outcome
+            if isinstance(graph_results, Exception):
+                logger.warning("Hybrid graph lookup failed", error=str(graph_results))
+                graph_results = []
+            if isinstance(vector_results, Exception):
+                logger.warning("Hybrid vector lookup failed", error=str(vector_results))
+                vector_results = []
             
             if graph_results or vector_results:
                 return {
@@ -307,7 +994,7 @@ class QueryAgent:
         query: str,
         context: AgentContext,
         intent: IntentClassification,
-    ) -> list[dict]:
+    ) -> list[GraphConcept]:
         """
         Query the knowledge graph based on intent and entities.
         
@@ -316,8 +1003,6 @@ class QueryAgent:
         rich textual evidence (not just labels and relationship names).
         """
         try:
-            results = []
-            
             # Special handling for INVENTORY intent - list all concepts
             if intent.intent == IntentType.INVENTORY:
                 return await self._query_inventory(context)
@@ -330,18 +1015,22 @@ class QueryAgent:
                     entity_terms=intent.entities,
                 )
             
-            # Look up each entity, expanding synonyms at query time
-            for entity in intent.entities:
-                concept_uri = None
-                
-                # Try the original term and all its synonyms
-                search_terms = expand_synonyms(entity)
-                for term in search_terms:
-                    concept_uri = await context.fuseki_store.concept_exists(
-                        context.user_id, term
-                    )
-                    if concept_uri:
-                        break
+            # Expand synonyms for every entity up front and resolve the
+            # unique terms in one lookup instead of one query per term
+            all_terms = {
+                entity: expand_synonyms(entity) for entity in intent.entities
+            }
+            known = await context.fuseki_store.concepts_exist_batch(
+                context.user_id, set().union(*all_terms.values())
+            )
+            
+            async def resolve(entity: str) -> Optional[tuple]:
+                # Try the original term first, then its synonyms
+                search_terms = all_terms[entity]
+                concept_uri = next(
+                    (known[term] for term in search_terms if known.get(term)),
+                    None,
+                )
                 
                 if not concept_uri:
                     # Try fuzzy match as last resort
@@ -353,40 +1042,72 @@ class QueryAgent:
                             concept_uri = similar[0].get("concept")
                             break
                 
-                if concept_uri:
-                    details = await context.fuseki_store.get_concept_with_definition(
+                if not concept_uri:
+                    return None
+                
+                # Definition and relationships are independent lookups
+                details, relationships = await asyncio.gather(
+                    context.fuseki_store.get_concept_with_definition(
                         context.user_id, concept_uri
-                    )
-                    relationships = await context.fuseki_store.get_concept_relationships(
+                    ),
+                    context.fuseki_store.get_concept_relationships(
                         context.user_id, concept_uri
-                    )
-                    
-                    # Fetch chunk text linked to this concept for richer context
-                    chunk_texts = await self._fetch_concept_chunks(
-                        context, concept_uri
-                    )
-                    
-                    results.append({
-                        "uri": concept_uri,
-                        "entity": entity,
-                        "details": details,
-                        "relationships": relationships,
-                        "chunk_texts": chunk_texts,
-                    })
+                    ),
+                    return_exceptions=True,
+                )
+                for outcome in (details, relationships):
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+                return concept_uri, entity, details, relationships
             
-            return results
+            resolved = [
+                item
+                for item in await asyncio.gather(
+                    *(resolve(entity) for entity in intent.entities)
+                )
+                if item is not None
+            ]
+            
+            # Fetch chunk text for all resolved concepts in one round-trip
+            chunks_by_concept = await self._fetch_concept_chunks_batch(
+                context, [concept_uri for concept_uri, _, _, _ in resolved]
+            )
+            
+            return [
+                GraphConcept(
+                    uri=concept_uri,
+                    entity=entity,
+                    details=details,
+                    relationships=relationships[:MAX_RELATIONSHIPS],
+                    chunk_texts=self._cap_chunk_texts(
+                        chunks_by_concept.get(concept_uri, [])
+                    ),
+                )
+                for concept_uri, entity, details, relationships in resolved
+            ]
             
         except Exception as e:
             logger.error("Graph query failed", error=str(e))
             return []
 
     @staticmethod
-    def _escape_sparql_literal(value: str) -> str:
-        """Escape a string so it is safe inside SPARQL quoted literals."""
-        return (
-            value.replace("\\", "\\\\")
-            .replace('"', '\\"')
-            .replace("\n", "\\n")
+    def _cap_chunk_texts(chunk_texts: list[dict]) -> list[dict]:
+        """
+        Keep the top chunks ("defined" first), bounding the size of each
+        concept in the synthesis prompt. The SPARQL queries already cut
+        each text to DISPLAY_TEXT_CHARS.
+        """
+        return sorted(
+            chunk_texts,
+            key=lambda chunk: 0 if chunk.get("link_type") == "defined" else 1,
+        )[:MAX_CHUNKS_PER_CONCEPT]
+
+    @staticmethod
+    def _lucene_phrase_query(terms: list[str]) -> str:
+        """Build a Lucene query matching any of `terms` as a phrase."""
+        return " OR ".join(
+            '"' + term.replace("\\", "\\\\").replace('"', '\\"') + '"'
+            for term in terms
         )
 
     async def _resolve_source_document_ids(
@@ -395,26 +1116,31 @@ class QueryAgent:
         source_filter: str,
     ) -> list[str]:
         """Find document IDs in the user's graph whose source title matches a filter."""
-        if not source_filter.strip():
+        normalized_filter = source_filter.lower().strip()
+        if not normalized_filter:
             return []
 
-        source_term = self._escape_sparql_literal(source_filter.lower().strip())
-        sparql = f"""
-        SELECT DISTINCT ?documentId
-        WHERE {{
-            ?source a syn:Source ;
-                    syn:sourceTitle ?sourceTitle ;
-                    syn:documentId ?documentId .
-            FILTER(CONTAINS(LCASE(?sourceTitle), "{source_term}"))
-        }}
-        LIMIT 100
-        """
+        version = await context.fuseki_store.graph_version(context.user_id)
+        cache_key = (context.user_id, version, normalized_filter)
+        cached = _source_document_ids_cache.get(cache_key)
+        if cached is not MISSING:
+            return list(cached)
+
+        if context.fuseki_store.has_text_index:
+            sparql = self._SPARQL_SOURCE_DOCUMENT_IDS_TEXT
+            bindings = {"sourceQuery": self._lucene_phrase_query([normalized_filter])}
+        else:
+            sparql = self._SPARQL_SOURCE_DOCUMENT_IDS
+            bindings = {"sourceTerm": normalized_filter}
 
         rows = await context.fuseki_store.query(
             user_id=context.user_id,
             sparql=sparql,
+            initial_bindings=bindings,
         )
-        return [row["documentId"] for row in rows if row.get("documentId")]
+        document_ids = [row["documentId"] for row in rows if row.get("documentId")]
+        _source_document_ids_cache.set(cache_key, tuple(document_ids))
+        return document_ids
 
     async def _resolve_vector_document_scope(
         self,
@@ -457,95 +1183,94 @@ class QueryAgent:
         source_filter: str,
         entity_terms: list[str],
         limit: int = 30,
-    ) -> list[dict[str, Any]]:
-        """Query concepts/chunks that came from sources matching `source_filter`."""
-        source_term = self._escape_sparql_literal(source_filter.lower().strip())
-        entity_filters: list[str] = []
-        for term in entity_terms:
-            normalized = term.lower().strip()
-            if not normalized:
-                continue
-            escaped = self._escape_sparql_literal(normalized)
-            entity_filters.append(f'CONTAINS(LCASE(?label), "{escaped}")')
-            entity_filters.append(
-                f'CONTAINS(LCASE(COALESCE(?definitionText, "")), "{escaped}")'
-            )
-
-        entity_filter_clause = ""
-        if entity_filters:
-            entity_filter_clause = f"FILTER({' || '.join(entity_filters)})"
+    ) -> list[GraphConcept]:
+        """
+        Query concepts/chunks that came from sources matching `source_filter`.
+        
+        With a jena-text index the source and entity matches are answered
+        by `text:query` index lookups; otherwise they fall back to
+        CONTAINS filters evaluated over every source and concept.
+        """
+        normalized_source = source_filter.lower().strip()
+        normalized_terms = [
+            normalized
+            for normalized in (term.lower().strip() for term in entity_terms)
+            if normalized
+        ]
 
-        sparql = f"""
-        SELECT ?concept ?label ?definitionText ?sourceTitle ?sourceUrl ?chunkText ?linkType
-        WHERE {{
-            ?source a syn:Source ;
-                    syn:sourceTitle ?sourceTitle .
-            OPTIONAL {{ ?source syn:sourceUrl ?sourceUrl }}
-            FILTER(CONTAINS(LCASE(?sourceTitle), "{source_term}"))
+        prefix = ""
+        entity_match = ""
+        entity_filter = ""
+        if context.fuseki_store.has_text_index:
+            prefix = "PREFIX text: <http://jena.apache.org/text#>"
+            source_match = self._SOURCE_MATCH_TEXT
+            bindings = {"sourceQuery": self._lucene_phrase_query([normalized_source])}
+            if normalized_terms:
+                entity_match = self._ENTITY_MATCH_TEXT
+                bindings["entityQuery"] = self._lucene_phrase_query(normalized_terms)
+        else:
+            source_match = self._SOURCE_MATCH_CONTAINS
+            bindings = {"sourceTerm": normalized_source}
+            # Legacy CONTAINS fallback: one disjunct per term, inlined
+            entity_filters: list[str] = []
+            for normalized in normalized_terms:
+                escaped = escape_literal(normalized)
+                entity_filters.append(f'CONTAINS(LCASE(?label), "{escaped}")')
+                entity_filters.append(
+                    f'CONTAINS(LCASE(COALESCE(?definitionText, "")), "{escaped}")'
+                )
+            if entity_filters:
+                entity_filter = f"FILTER({' || '.join(entity_filters)})"
 
-            ?chunk syn:derivedFrom ?source .
-            {{
-                ?concept syn:definedIn ?chunk .
-                BIND("defined" AS ?linkType)
-            }}
-            UNION
-            {{
-                ?concept syn:mentionedIn ?chunk .
-                BIND("mentioned" AS ?linkType)
-            }}
-
-            ?concept a syn:Concept ;
-                     syn:label ?label .
-            OPTIONAL {{
-                ?concept syn:hasDefinition ?def .
-                ?def syn:definitionText ?definitionText .
-            }}
-            OPTIONAL {{ ?chunk syn:chunkText ?chunkText }}
-            {entity_filter_clause}
-        }}
-        ORDER BY ?label
-        LIMIT {max(limit * 6, 100)}
-        """
+        sparql = self._SPARQL_SOURCE_RECALL.format(
+            prefix=prefix,
+            source_match=source_match,
+            entity_match=entity_match,
+            entity_filter=entity_filter,
+            limit=max(limit * 6, 100),
+            max_chars=DISPLAY_TEXT_CHARS,
+        )
 
         rows = await context.fuseki_store.query(
             user_id=context.user_id,
             sparql=sparql,
+            initial_bindings=bindings,
         )
         if not rows:
             return []
 
-        concepts: dict[str, dict[str, Any]] = {}
+        concepts: dict[str, GraphConcept] = {}
         for row in rows:
             concept_uri = row.get("concept")
             if not concept_uri:
                 continue
 
-            concept = concepts.setdefault(
-                concept_uri,
-                {
-                    "uri": concept_uri,
-                    "entity": row.get("label", "Unknown"),
-                    "details": {
+            concept = concepts.get(concept_uri)
+            if concept is None:
+                concept = concepts[concept_uri] = GraphConcept(
+                    uri=concept_uri,
+                    entity=row.get("label", "Unknown"),
+                    details={
                         "label": row.get("label"),
                         "definitionText": row.get("definitionText"),
                         "sourceTitle": row.get("sourceTitle"),
                         "sourceUrl": row.get("sourceUrl"),
                     },
-                    "relationships": [],
-                    "chunk_texts": [],
-                },
-            )
+                    relationships=[],
+                    chunk_texts=[],
+                )
 
-            if row.get("definitionText") and not concept["details"].get("definitionText"):
-                concept["details"]["definitionText"] = row.get("definitionText")
-            if row.get("sourceTitle") and not concept["details"].get("sourceTitle"):
-                concept["details"]["sourceTitle"] = row.get("sourceTitle")
-            if row.get("sourceUrl") and not concept["details"].get("sourceUrl"):
-                concept["details"]["sourceUrl"] = row.get("sourceUrl")
+            details = concept.details
+            if row.get("definitionText") and not details.get("definitionText"):
+                details["definitionText"] = row.get("definitionText")
+            if row.get("sourceTitle") and not details.get("sourceTitle"):
+                details["sourceTitle"] = row.get("sourceTitle")
+            if row.get("sourceUrl") and not details.get("sourceUrl"):
+                details["sourceUrl"] = row.get("sourceUrl")
 
             chunk_text = row.get("chunkText", "")
             if chunk_text:
-                concept["chunk_texts"].append(
+                concept.chunk_texts.append(
                     {
                         "text": chunk_text,
                         "source_title": row.get("sourceTitle", ""),
@@ -556,112 +1281,89 @@ class QueryAgent:
 
         results = list(concepts.values())[:limit]
         for concept in results:
-            concept["chunk_texts"].sort(
-                key=lambda chunk: 0 if chunk["link_type"] == "defined" else 1
-            )
+            concept.chunk_texts = self._cap_chunk_texts(concept.chunk_texts)
         return results
 
-    async def _fetch_concept_chunks(
+    async def _fetch_concept_chunks_batch(
         self,
         context: AgentContext,
-        concept_uri: str,
-        max_chunks: int = 5,
-    ) -> list[dict]:
+        concept_uris: list[str],
+        max_chunks_per_concept: int = MAX_CHUNKS_PER_CONCEPT,
+    ) -> dict[str, list[dict]]:
         """
-        Fetch the actual chunk text linked to a concept via definedIn
+        Fetch the actual chunk text linked to concepts via definedIn
         and mentionedIn. This bridges the gap between structured graph
         data and rich textual evidence for the synthesizer.
+        
+        All concepts are resolved in a single SPARQL query using VALUES;
+        rows are bucketed per concept and capped in Python.
+        
+        Returns:
+            Mapping of concept URI to its chunks, "defined" chunks first
         """
+        unique_uris = list(dict.fromkeys(concept_uris))
+        if not unique_uris:
+            return {}
+        
         try:
-            sparql = f"""
-            SELECT ?chunkText ?sourceTitle ?sourceUrl ?linkType
-            WHERE {{
-                {{
-                    <{concept_uri}> syn:definedIn ?chunk .
-                    ?chunk syn:chunkText ?chunkText .
-                    BIND("defined" AS ?linkType)
-                }}
-                UNION
-                {{
-                    <{concept_uri}> syn:mentionedIn ?chunk .
-                    ?chunk syn:chunkText ?chunkText .
-                    BIND("mentioned" AS ?linkType)
-                }}
-                OPTIONAL {{
-                    ?chunk syn:derivedFrom ?source .
-                    ?source syn:sourceTitle ?sourceTitle .
-                    ?source syn:sourceUrl ?sourceUrl .
-                }}
-            }}
-            LIMIT {max_chunks}
-            """
+            # Over-fetch so one heavily-linked concept does not starve the rest
+            limit = max_chunks_per_concept * len(unique_uris) * 4
             
             results = await context.fuseki_store.query(
                 user_id=context.user_id,
-                sparql=sparql,
+                sparql=self._SPARQL_FETCH_CHUNKS.format(
+                    limit=limit, max_chars=DISPLAY_TEXT_CHARS
+                ),
+                initial_bindings={"concept": [IRI(uri) for uri in unique_uris]},
             )
             
-            chunks = []
+            chunks_by_concept: dict[str, list[dict]] = {uri: [] for uri in unique_uris}
             for r in results:
-                chunks.append({
+                bucket = chunks_by_concept.get(r.get("concept"))
+                if bucket is None:
+                    continue
+                bucket.append({
                     "text": r.get("chunkText", ""),
                     "source_title": r.get("sourceTitle", ""),
                     "source_url": r.get("sourceUrl", ""),
                     "link_type": r.get("linkType", "mentioned"),
                 })
             
-            # Sort so "defined" chunks come first (more relevant)
-            chunks.sort(key=lambda c: 0 if c["link_type"] == "defined" else 1)
+            # Sort so "defined" chunks come first (more relevant), then cap
+            for uri, chunks in chunks_by_concept.items():
+                chunks.sort(key=lambda c: 0 if c["link_type"] == "defined" else 1)
+                chunks_by_concept[uri] = chunks[:max_chunks_per_concept]
             
-            return chunks
+            return chunks_by_concept
             
         except Exception as e:
             logger.warning("Failed to fetch concept chunks", error=str(e))
-            return []
+            return {}
     
-    async def _query_inventory(self, context: AgentContext) -> list[dict]:
+    async def _query_inventory(self, context: AgentContext) -> list[GraphConcept]:
         """Query all concepts for inventory/overview requests."""
         try:
-            # SPARQL to get all concepts with definitions
-            sparql = """
-            SELECT DISTINCT ?label ?definitionText ?sourceTitle
-            WHERE {
-                ?concept a syn:Concept .
-                ?concept syn:label ?label .
-                OPTIONAL {
-                    ?concept syn:hasDefinition ?def .
-                    ?def syn:definitionText ?definitionText .
-                }
-                OPTIONAL {
-                    ?concept syn:definedIn ?chunk .
-                    ?chunk syn:derivedFrom ?source .
-                    ?source syn:sourceTitle ?sourceTitle .
-                }
-            }
-            ORDER BY ?label
-            LIMIT 50
-            """
-            
             query_results = await context.fuseki_store.query(
                 user_id=context.user_id,
-                sparql=sparql,
+                sparql=self._SPARQL_INVENTORY,
             )
             
             logger.info("Inventory query complete", result_count=len(query_results))
             
             # Format results - FusekiStore.query() already extracts values from bindings
-            results = []
-            for r in query_results:
-                results.append({
-                    "entity": r.get("label", "Unknown"),
-                    "details": {
+            return [
+                GraphConcept(
+                    uri="",
+                    entity=r.get("label", "Unknown"),
+                    details={
                         "definitionText": r.get("definitionText"),
                         "sourceTitle": r.get("sourceTitle"),
                     },
-                    "relationships": [],
-                })
-            
-            return results
+                    relationships=[],
+                    chunk_texts=[],
+                )
+                for r in query_results
+            ]
             
         except Exception as e:
             logger.error("Inventory query failed", error=str(e))
@@ -673,25 +1375,33 @@ class QueryAgent:
         context: AgentContext,
         document_ids: Optional[list[str]] = None,
         top_k: int = 5,
+        query_vector: Optional[list[float]] = None,
     ) -> list[dict]:
-        """Query the vector store for similar content."""
+        """
+        Query the vector store for similar content.
+
+        If `query_vector` is supplied it is used as-is; otherwise the query
+        is embedded here.
+        """
         try:
             if document_ids == []:
                 logger.info("Vector query skipped: constrained source scope has no documents")
                 return []
 
-            # Generate query embedding
-            query_vector = await context.embedding_generator.generate_single(query)
+            # Generate query embedding unless the caller already has one
+            if query_vector is None:
+                query_vector = await context.embedding_generator.generate_single(query)
             
-            # Search
-            results = await context.qdrant_store.search(
+            # Search (batched with concurrent searches)
+            results = await self._search_coalescer.submit(
                 query_vector=query_vector,
                 user_id=context.user_id,
                 limit=top_k,
                 document_ids=document_ids,
+                payload_fields=_VECTOR_PAYLOAD_FIELDS,
             )
             
-            logger.info("Vector search results", count=len(results), results=results)
+            logger.debug("Vector search results", count=len(results), results=results)
             
             return results
             
@@ -699,6 +1409,46 @@ class QueryAgent:
             logger.error("Vector query failed", error=str(e))
             return []
     
+    async def _strategy_vector_search(
+        self,
+        query: str,
+        context: AgentContext,
+        embedding_task: Optional["asyncio.Future[list[float]]"],
+        doc_scope_task: Optional["asyncio.Task[Optional[list[str]]]"],
+        speculative_vector: Optional["asyncio.Task[list[dict]]"],
+    ) -> list[dict]:
+        """Run a strategy's vector search, reusing a speculative one if started."""
+        if speculative_vector is not None:
+            return await speculative_vector
+        return await self._query_vector(
+            query,
+            context,
+            document_ids=await self._await_document_scope(doc_scope_task),
+            query_vector=await self._await_query_vector(embedding_task),
+        )
+
+    async def _await_query_vector(
+        self,
+        embedding_task: Optional["asyncio.Future[list[float]]"],
+    ) -> Optional[list[float]]:
+        """Await the pre-computed query embedding, or None if unavailable."""
+        if embedding_task is None:
+            return None
+        try:
+            return await embedding_task
+        except Exception as e:
+            logger.warning("Query embedding failed", error=str(e))
+            return None
+
+    @staticmethod
+    async def _await_document_scope(
+        doc_scope_task: Optional["asyncio.Task[Optional[list[str]]]"],
+    ) -> Optional[list[str]]:
+        """Await the concurrently resolved document scope (None = unscoped)."""
+        if doc_scope_task is None:
+            return None
+        return await doc_scope_task
+
     async def _enrich_with_graph(
         self,
         vector_results: list[dict],
@@ -706,100 +1456,53 @@ class QueryAgent:
         intent: IntentClassification,
     ) -> list[dict]:
         """Enrich vector results with graph data."""
-        enrichments = []
+        # Concepts mentioned in the top 3 results, at most 2 per result
+        candidates = list(dict.fromkeys(
+            concept
+            for result in vector_results[:3]
+            for concept in result.get("payload", {}).get("concepts", [])[:2]
+        ))
+        if not candidates:
+            return []
         
-        # Extract concepts mentioned in vector results
-        for result in vector_results[:3]:  # Limit to top 3
-            concepts = result.get("payload", {}).get("concepts", [])
-            
-            for concept in concepts[:2]:  # Limit concepts per result
-                try:
-                    concept_uri = await context.fuseki_store.concept_exists(
-                        context.user_id, concept
-                    )
-                    if concept_uri:
-                        details = await context.fuseki_store.get_concept_with_definition(
-                            context.user_id, concept_uri
-                        )
-                        if details:
-                            enrichments.append({
-                                "concept": concept,
-                                "details": details,
-                            })
-                except Exception:
-                    pass
+        # Resolve every candidate and fetch its definition in one round-trip
+        try:
+            details_by_label = await context.fuseki_store.get_concepts_with_definitions_batch(
+                context.user_id, candidates
+            )
+        except Exception as e:
+            logger.warning("Graph enrichment failed", error=str(e))
+            return []
         
-        return enrichments
+        return [
+            {"concept": concept, "details": details}
+            for concept in candidates
+            if (details := details_by_label.get(concept.lower().strip()))
+        ]
     
     def _extract_sources_from_retrieval(
         self,
         retrieval_results: dict,
     ) -> list[dict]:
         """Extract source information from retrieval results."""
-        sources = []
         source = retrieval_results.get("source", "")
         results = retrieval_results.get("results", [])
         
         if source == "vector":
-            for r in results:
-                payload = r.get("payload", {})
-                sources.append({
-                    "title": payload.get("source_title", ""),
-                    "url": payload.get("source_url", ""),
-                    "type": payload.get("source_type", ""),
-                    "text": payload.get("text", "")[:200],
-                    "timestamp": payload.get("timestamp_start_ms"),
-                })
-        elif source == "graph":
-            for r in results:
-                details = r.get("details", {})
-                sources.append({
-                    "title": details.get("sourceTitle", "") or r.get("entity", ""),
-                    "url": details.get("sourceUrl", ""),
-                    "type": "graph",
-                    "text": details.get("definitionText", "")[:200] if details.get("definitionText") else "",
-                })
-        elif source == "graph_and_vector":
-            graph = results.get("graph", [])
-            vector = results.get("vector", [])
-            for r in graph:
-                details = r.get("details", {})
-                sources.append({
-                    "title": details.get("sourceTitle", "") or r.get("entity", ""),
-                    "url": details.get("sourceUrl", ""),
-                    "type": "graph",
-                    "text": details.get("definitionText", "")[:200] if details.get("definitionText") else "",
-                })
-            for r in vector:
-                payload = r.get("payload", {})
-                sources.append({
-                    "title": payload.get("source_title", ""),
-                    "url": payload.get("source_url", ""),
-                    "type": payload.get("source_type", ""),
-                    "text": payload.get("text", "")[:200],
-                    "timestamp": payload.get("timestamp_start_ms"),
-                })
-        elif source == "hybrid":
-            vector = results.get("vector", [])
-            graph = results.get("graph", [])
-            for r in vector:
-                payload = r.get("payload", {})
-                sources.append({
-                    "title": payload.get("source_title", ""),
-                    "url": payload.get("source_url", ""),
-                    "type": payload.get("source_type", ""),
-                    "text": payload.get("text", "")[:200],
-                })
-            for r in graph:
-                details = r.get("details", {})
-                sources.append({
-                    "title": details.get("sourceTitle", "") or r.get("entity", ""),
-                    "url": details.get("sourceUrl", ""),
-                    "type": "graph",
-                    "text": details.get("definitionText", "")[:200] if details.get("definitionText") else "",
-                })
-        
-        return sources
+            return [_payload_to_source(r.get("payload", {})) for r in results]
+        if source == "graph":
+            return [_graph_detail_to_source(r) for r in results]
+        if source == "graph_and_vector":
+            return [
+                *(_graph_detail_to_source(r) for r in results.get("graph", [])),
+                *(_payload_to_source(r.get("payload", {})) for r in results.get("vector", [])),
+            ]
+        if source == "hybrid":
+            return [
+                *(_payload_to_source(r.get("payload", {})) for r in results.get("vector", [])),
+                *(_graph_detail_to_source(r) for r in results.get("graph", [])),
+            ]
+        return []
     
     def _enrich_citations(
         self,
@@ -817,10 +1520,23 @@ class QueryAgent:
         if not sources or not response.citations:
             return response
         
-        # Map citations to sources by index
+        # Index sources once so each citation is matched with O(1) lookups:
+        # by URL, then by (case-insensitive) title, then by position
+        src_by_url: dict[str, dict] = {}
+        src_by_title: dict[str, dict] = {}
+        for src in sources:
+            if src.get("url"):
+                src_by_url.setdefault(src["url"], src)
+            if src.get("title"):
+                src_by_title.setdefault(src["title"].lower(), src)
+        
         for i, citation in enumerate(response.citations):
-            if i < len(sources):
-                src = sources[i]
+            src = (
+                (citation.url and src_by_url.get(citation.url))
+                or (citation.title and src_by_title.get(citation.title.lower()))
+                or (sources[i] if i < len(sources) else None)
+            )
+            if src:
                 # Only replace if LLM didn't provide a good title
                 if not citation.title or citation.title == "Unknown" or len(citation.title) < 3:
                     citation.title = src.get("title") or citation.title
@@ -833,123 +1549,253 @@ class QueryAgent:
         
         return response
     
+    @staticmethod
+    def _render_concept(r: GraphConcept, fields: FieldSelection = _DEFAULT_FIELDS) -> str:
+        """Render one graph concept (definition, relationships, passages)."""
+        parts = ["\n### Concept: ", r.entity or "Unknown", "\n"]
+        details = r.details
+        if details:
+            definition = details.get("definitionText")
+            if definition:
+                parts += ("Definition: ", definition, "\n")
+            source_title = details.get("sourceTitle")
+            if source_title:
+                parts += ("Source: ", source_title, "\n")
+        
+        relationships = r.relationships
+        if relationships and fields.relationships:
+            parts.append("Relationships:\n")
+            for rel in relationships[:fields.relationships]:
+                parts += (
+                    "  - ", rel.get("relationType", "?"),
+                    " → ", rel.get("relatedLabel", "?"), "\n",
+                )
+        
+        # Include chunk text from the graph for richer context
+        chunk_texts = r.chunk_texts
+        if chunk_texts and fields.chunks:
+            parts.append("\nRelevant passages from your knowledge base:\n")
+            for ct in chunk_texts[:fields.chunks]:
+                parts += ("\n[", ct["link_label"], "] ", ct["display_text"], "\n")
+                source_title = ct.get("source_title")
+                if source_title:
+                    parts += ("  — Source: ", source_title, "\n")
+        return "".join(parts)
+
+    @staticmethod
+    def _cut_block(buf: io.StringIO, blocks: list[str]) -> None:
+        """Move the text buffered so far into `blocks` as one block."""
+        if buf.tell():
+            blocks.append(buf.getvalue())
+            buf.seek(0)
+            buf.truncate()
+
     def _format_synthesis_input(
         self,
         query: str,
         intent: IntentClassification,
         retrieval_results: dict,
     ) -> str:
-        """Format input for the response synthesizer."""
-        parts = [
-            f"## User Query\n{query}",
-            f"\n## Intent Classification\n- Type: {intent.intent.value}\n- Entities: {', '.join(intent.entities)}\n- Confidence: {intent.confidence}",
+        """
+        Format input for the response synthesizer as one string.
+        
+        Expects results prepared by `_prepare_display` (see `_execute_strategy`).
+        """
+        return "".join(
+            self._synthesis_blocks(query, intent, retrieval_results)
+        )
+
+    def _synthesis_message(
+        self,
+        query: str,
+        intent: IntentClassification,
+        retrieval_results: dict,
+    ) -> list[dict]:
+        """
+        Build the synthesizer input as a user message of text blocks.
+        
+        Each graph concept is its own content block holding the prepared
+        `rendered` string, so large passages are sent without first being
+        copied into a single prompt string.
+        """
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "input_text", "text": block}
+                    for block in self._synthesis_blocks(
+                        query, intent, retrieval_results
+                    )
+                ],
+            }
         ]
+
+    def _synthesis_blocks(
+        self,
+        query: str,
+        intent: IntentClassification,
+        retrieval_results: dict,
+    ) -> list[str]:
+        """
+        Format input for the response synthesizer as consecutive blocks.
+        
+        Expects results prepared by `_prepare_display` (see `_execute_strategy`).
+        """
+        fields = _select_fields_for_intent(intent)
+        blocks: list[str] = []
+        buf = io.StringIO()
+        w = buf.write
+        w("## User Query\n")
+        w(query)
+        w("\n\n## Intent Classification\n- Type: ")
+        w(intent.intent.value)
+        w("\n- Entities: ")
+        w(", ".join(intent.entities))
+        w(f"\n- Confidence: {intent.confidence}\n")
         
         source = retrieval_results.get("source", "llm_knowledge")
         results = retrieval_results.get("results", [])
         
         if source == "graph":
-            parts.append("\n## Graph Results")
+            w("\n## Graph Results\n")
             for r in results:
-                parts.append(f"\n### Concept: {r.get('entity', 'Unknown')}")
-                details = r.get("details", {})
-                if details:
-                    if details.get("definitionText"):
-                        parts.append(f"Definition: {details['definitionText']}")
-                    if details.get("sourceTitle"):
-                        parts.append(f"Source: {details['sourceTitle']}")
-                
-                relationships = r.get("relationships", [])
-                if relationships:
-                    parts.append("Relationships:")
-                    for rel in relationships[:5]:
-                        parts.append(f"  - {rel.get('relationType', '?')} → {rel.get('relatedLabel', '?')}")
-                
-                # Include chunk text from the graph for richer context
-                chunk_texts = r.get("chunk_texts", [])
-                if chunk_texts:
-                    parts.append("\nRelevant passages from your knowledge base:")
-                    for ct in chunk_texts[:3]:
-                        link_label = "Defines" if ct.get("link_type") == "defined" else "Mentions"
-                        parts.append(f"\n[{link_label}] {ct.get('text', '')[:500]}")
-                        if ct.get("source_title"):
-                            parts.append(f"  — Source: {ct['source_title']}")
+                self._cut_block(buf, blocks)
+                blocks.append(r.rendered)
         
         elif source == "vector":
-            parts.append("\n## Vector Results")
-            for i, r in enumerate(results, 1):
+            w("\n## Vector Results\n")
+            for i, r in enumerate(results[:fields.vectors], 1):
                 payload = r.get("payload", {})
-                parts.append(f"\n### Result {i} (score: {r.get('score', 0):.2f})")
-                parts.append(f"Text: {payload.get('text', '')[:500]}...")
-                if payload.get("source_title"):
-                    parts.append(f"Source: {payload['source_title']}")
-                if payload.get("source_url"):
-                    parts.append(f"URL: {payload['source_url']}")
+                w(f"\n### Result {i} (score: {r.get('score', 0):.2f})\n")
+                w(f"Text: {r['display_text']}...\n")
+                source_title = payload.get("source_title")
+                if source_title:
+                    w(f"Source: {source_title}\n")
+                source_url = payload.get("source_url")
+                if source_url:
+                    w(f"URL: {source_url}\n")
         
         elif source == "graph_and_vector":
-            parts.append("\n## Knowledge Graph Results")
+            w("\n## Knowledge Graph Results\n")
             graph = results.get("graph", [])
             vector = results.get("vector", [])
             
             for r in graph:
-                parts.append(f"\n### Concept: {r.get('entity', 'Unknown')}")
-                details = r.get("details", {})
-                if details:
-                    if details.get("definitionText"):
-                        parts.append(f"Definition: {details['definitionText']}")
-                    if details.get("sourceTitle"):
-                        parts.append(f"Source: {details['sourceTitle']}")
-                relationships = r.get("relationships", [])
-                if relationships:
-                    parts.append("Relationships:")
-                    for rel in relationships[:5]:
-                        parts.append(f"  - {rel.get('relationType', '?')} → {rel.get('relatedLabel', '?')}")
-                
-                chunk_texts = r.get("chunk_texts", [])
-                if chunk_texts:
-                    parts.append("\nRelevant passages from your knowledge base:")
-                    for ct in chunk_texts[:3]:
-                        link_label = "Defines" if ct.get("link_type") == "defined" else "Mentions"
-                        parts.append(f"\n[{link_label}] {ct.get('text', '')[:500]}")
-                        if ct.get("source_title"):
-                            parts.append(f"  — Source: {ct['source_title']}")
+                self._cut_block(buf, blocks)
+                blocks.append(r.rendered)
             
             if vector:
-                parts.append("\n## Related Content from Notes")
-                for i, r in enumerate(vector, 1):
+                w("\n## Related Content from Notes\n")
+                for i, r in enumerate(vector[:fields.vectors], 1):
                     payload = r.get("payload", {})
-                    parts.append(f"\n### Excerpt {i} (score: {r.get('score', 0):.2f})")
-                    parts.append(f"Text: {payload.get('text', '')[:500]}...")
-                    if payload.get("source_title"):
-                        parts.append(f"Source: {payload['source_title']}")
+                    w(f"\n### Excerpt {i} (score: {r.get('score', 0):.2f})\n")
+                    w(f"Text: {r['display_text']}...\n")
+                    source_title = payload.get("source_title")
+                    if source_title:
+                        w(f"Source: {source_title}\n")
         
         elif source == "hybrid":
-            parts.append("\n## Combined Results")
+            w("\n## Combined Results\n")
             graph = results.get("graph", [])
             vector = results.get("vector", [])
             
             if graph:
-                parts.append("\n### From Knowledge Graph:")
+                w("\n### From Knowledge Graph:\n")
                 for r in graph:
-                    details = r.get("details", {}) or {}
-                    parts.append(f"- {r.get('entity', 'Unknown')}: {details.get('definitionText', 'No definition')[:200]}")
-                    chunk_texts = r.get("chunk_texts", [])
-                    for ct in chunk_texts[:2]:
-                        parts.append(f"  Passage: {ct.get('text', '')[:300]}")
+                    details = r.details or {}
+                    w(f"- {r.entity or 'Unknown'}: {details.get('display_definition', 'No definition')}\n")
+                    for ct in r.chunk_texts[:2]:
+                        w(f"  Passage: {ct['display_text'][:300]}\n")
             
             if vector:
-                parts.append("\n### From Vector Search:")
+                w("\n### From Vector Search:\n")
                 for r in vector[:3]:
-                    payload = r.get("payload", {})
-                    parts.append(f"- {payload.get('text', '')[:200]}...")
+                    w(f"- {r['display_text'][:DISPLAY_SNIPPET_CHARS]}...\n")
         
         elif source == "llm_knowledge":
-            parts.append("\n## No Results from Personal Knowledge Base")
-            parts.append("Please answer based on general knowledge and indicate that this is not from the user's notes.")
+            w("\n## No Results from Personal Knowledge Base\n")
+            w("Please answer based on general knowledge and indicate that this is not from the user's notes.\n")
         
-        parts.append(f"\n## Retrieval Metadata\n- Source: {source}\n- Fallback Chain: {' → '.join(retrieval_results.get('fallback_chain', []))}")
+        w("\n## Retrieval Metadata\n- Source: ")
+        w(source)
+        w("\n- Fallback Chain: ")
+        w(" → ".join(retrieval_results.get("fallback_chain", [])))
+        self._cut_block(buf, blocks)
         
-        return "\n".join(parts)
+        return blocks
+    
+    async def _probe_response_cache(
+        self,
+        user_id: str,
+        query: str,
+        session: Any,
+    ) -> tuple[Optional[list[float]], Optional[QueryResponse], bool]:
+        """
+        Embed the query and look it up in the semantic response cache.
+        
+        Entries are keyed by the query alone, so only a conversation's
+        first turn may use the cache: a follow-up such as "what is it?"
+        depends on earlier turns the key does not capture. On a hit the
+        question/answer turn is appended to the session so follow-up
+        queries still see it in the conversation history.
+        
+        Returns:
+            (query_vector, cached_response, cacheable); the first two may be
+            None, and cacheable says whether this turn's answer may be stored
+        """
+        if self._response_cache is None:
+            return None, None, False
+
+        async def has_history() -> bool:
+            try:
+                return bool(await session.get_items(limit=1))
+            except Exception as e:
+                logger.warning("Failed to read session history", error=str(e))
+                return True
+
+        embedding, history = await asyncio.gather(
+            self._embedding_batcher.generate_single(query),
+            has_history(),
+            return_exceptions=True,
+        )
+        if isinstance(embedding, asyncio.CancelledError):
+            raise embedding
+        if isinstance(embedding, Exception):
+            logger.warning("Query embedding failed", error=str(embedding))
+            return None, None, False
+        query_vector = embedding
+        if history:
+            return query_vector, None, False
+
+        cached = await self._response_cache.lookup(user_id, query_vector)
+        if cached is not None:
+            try:
+                await session.add_items([
+                    {"role": "user", "content": query},
+                    {"role": "assistant", "content": cached.answer},
+                ])
+            except Exception as e:
+                logger.warning("Failed to record cached turn", error=str(e))
+        return query_vector, cached, True
+
+    def _cache_response(
+        self,
+        user_id: str,
+        query_vector: Optional[list[float]],
+        intent: IntentClassification,
+        response: QueryResponse,
+    ) -> None:
+        """Store a grounded response in the semantic cache without blocking the caller."""
+        if self._response_cache is None or query_vector is None:
+            return
+        # Only cache answers grounded in the user's knowledge base; greetings
+        # and general-knowledge replies depend on conversation context.
+        if intent.intent == IntentType.GENERAL or not response.citations:
+            return
+
+        _spawn_background(
+            self._response_cache.put(user_id, query_vector, response)
+        )
     
     async def query(
         self,
@@ -978,60 +1824,67 @@ class QueryAgent:
         # Create context
         context = self._create_context(user_id)
         
-        # Get session for conversation history
+        # Get session for conversation history; its first DB round-trip
+        # happens inside the runner, so warm the pool meanwhile
         session = await get_session(session_id, user_id)
+        _spawn_background(warm_session_engine())
+        speculative = None
         
         try:
-            # Step 1: Classify intent
-            intent_result = await Runner.run(
-                self.intent_classifier,
-                query,
-                context=context,
+            # Step 0: Reuse the answer to a near-duplicate query if cached
+            query_vector, cached, cacheable = await self._probe_response_cache(
+                user_id, query, session
             )
-            intent: IntentClassification = intent_result.final_output
+            if cached is not None:
+                return cached
             
-            logger.info(
-                "Intent classified",
-                intent=intent.intent.value,
-                entities=intent.entities,
-                confidence=intent.confidence,
-            )
-            
-            # Step 2: Select strategy
-            strategy = self._select_strategy(intent)
-            logger.info("Strategy selected", strategy=strategy.value)
-            
-            # Step 3: Execute retrieval
-            retrieval_results = await self._execute_strategy(
-                strategy, query, context, intent
-            )
-            
-            retrieval_source = retrieval_results.get("source")
-            raw_results = retrieval_results.get("results", [])
-            if isinstance(raw_results, dict):
-                result_count = sum(
-                    len(v) for v in raw_results.values() if isinstance(v, list)
+            intent = self._fast_intent(query)
+            if intent is not None:
+                # Steps 1-3: Fast-path intent, strategy, retrieval
+                retrieval_results = await self._retrieve(
+                    query, context, intent, query_vector
+                )
+                
+                # Step 4: Synthesize response with session for history
+                synthesis_input = self._synthesis_message(
+                    query, intent, retrieval_results
+                )
+                
+                response_result = await Runner.run(
+                    self.synthesizer,
+                    synthesis_input,
+                    context=context,
+                    session=session,
                 )
             else:
-                result_count = len(raw_results)
-            
-            logger.info(
-                "Retrieval complete",
-                source=retrieval_source,
-                result_count=result_count,
-            )
-            
-            # Step 4: Synthesize response with session for history
-            synthesis_input = self._format_synthesis_input(
-                query, intent, retrieval_results
-            )
-            
-            response_result = await Runner.run(
-                self.synthesizer,
-                synthesis_input,
-                context=context,
-                session=session,
-            )
+                # Steps 1-4 in one run: the orchestrator classifies the query
+                # by calling retrieve_knowledge, then answers from its output.
+                # The likely vector search runs while it classifies.
+                capture: dict = {}
+                speculative = self._start_speculative_vector(
+                    query, context, query_vector
+                )
+                response_result = await Runner.run(
+                    self._orchestrator_for(
+                        query,
+                        query_vector,
+                        capture,
+                        speculative_vector=speculative,
+                    ),
+                    query,
+                    context=context,
+                    session=session,
+                )
+                self._remember_intent(query, capture.get("intent"))
+                intent = capture.get("intent") or IntentClassification(
+                    intent=IntentType.GENERAL,
+                    requires_personal_knowledge=False,
+                )
+                retrieval_results = capture.get("retrieval") or {
+                    "source": "llm_knowledge",
+                    "results": [],
+                    "fallback_chain": [],
+                }
             
             response: QueryResponse = response_result.final_output
             
@@ -1053,24 +1906,19 @@ class QueryAgent:
                 confidence=response.confidence,
             )
             
+            if cacheable:
+                self._cache_response(user_id, query_vector, intent, response)
+            
             return response
             
         except Exception as e:
             logger.error("Query failed", error=str(e))
             # Return a fallback response
-            return QueryResponse(
-                answer=f"I apologize, but I encountered an error while processing your query. Please try again.",
-                citations=[],
-                concepts_referenced=[],
-                confidence=0.0,
-                source_type="error",
-                retrieval_metadata=RetrievalMetadata(
-                    retrieval_source="error",
-                    fallback_chain=[],
-                    has_citations=False,
-                    confidence=0.0,
-                ),
-            )
+            return _error_response()
+        finally:
+            # Drop a speculative search the chosen strategy did not use
+            if speculative is not None:
+                speculative.cancel()
     
     async def query_stream(
         self,
@@ -1099,46 +1947,70 @@ class QueryAgent:
         # Create context
         context = self._create_context(user_id)
         
-        # Get session
+        # Get session and warm the pool for its history load
         session = await get_session(session_id, user_id)
+        _spawn_background(warm_session_engine())
+        speculative = None
         
         try:
-            # Step 1: Classify intent (non-streaming)
-            intent_result = await Runner.run(
-                self.intent_classifier,
-                query,
-                context=context,
+            # Step 0: Reuse the answer to a near-duplicate query if cached
+            query_vector, cached, cacheable = await self._probe_response_cache(
+                user_id, query, session
             )
-            intent: IntentClassification = intent_result.final_output
-            
-            # Step 2: Select strategy
-            strategy = self._select_strategy(intent)
+            if cached is not None:
+                yield cached.answer
+                return
             
-            # Step 3: Execute retrieval
-            retrieval_results = await self._execute_strategy(
-                strategy, query, context, intent
-            )
-            
-            # Step 4: Stream synthesis response
-            synthesis_input = self._format_synthesis_input(
-                query, intent, retrieval_results
-            )
+            intent = self._fast_intent(query)
+            capture: dict = {}
+            if intent is not None:
+                # Steps 1-3: Fast-path intent, strategy, retrieval
+                retrieval_results = await self._retrieve(
+                    query, context, intent, query_vector
+                )
+                
+                # Step 4: Stream synthesis of the retrieved context
+                stream_input = self._synthesis_message(
+                    query, intent, retrieval_results
+                )
+                orchestrator = self.orchestrator.clone(output_type=None)
+            else:
+                # Orchestrator classifies via retrieve_knowledge and streams
+                # its answer in the same run
+                stream_input = query
+                speculative = self._start_speculative_vector(
+                    query, context, query_vector
+                )
+                orchestrator = self._orchestrator_for(
+                    query,
+                    query_vector,
+                    capture,
+                    output_type=None,
+                    speculative_vector=speculative,
+                )
             
             # Use streaming runner
             async with Runner.run_streamed(
-                self.orchestrator,  # Use orchestrator for streaming
-                synthesis_input,
+                orchestrator,
+                stream_input,
                 context=context,
                 session=session,
             ) as stream:
                 async for event in stream.stream_events():
-                    # Yield text delta events
-                    if hasattr(event, 'data') and hasattr(event.data, 'delta'):
+                    # Yield answer text only, not tool-call argument deltas
+                    if event.type == "raw_response_event" and isinstance(
+                        event.data, ResponseTextDeltaEvent
+                    ):
                         yield event.data.delta
             
+            self._remember_intent(query, capture.get("intent"))
+            
         except Exception as e:
             logger.error("Streaming query failed", error=str(e))
             yield f"Error: {str(e)}"
+        finally:
+            if speculative is not None:
+                speculative.cancel()
     
     async def close(self):
         """Close underlying connections."""
@@ -0,0 +1,214 @@
+"""
+Semantic response cache for the query agent.
+
+Stores synthesized QueryResponses in a dedicated Qdrant collection keyed by
+the query embedding, so near-duplicate questions ("what is X?" vs "tell me
+about X") can skip intent classification, retrieval and synthesis.
+"""
+
+import time
+import uuid
+from typing import Optional
+
+import structlog
+from qdrant_client import models
+from qdrant_client.http.exceptions import UnexpectedResponse
+
+from config.settings import get_settings
+from synaptiq.storage.qdrant import QdrantStore
+
+from .schemas import QueryResponse
+
+logger = structlog.get_logger(__name__)
+
+# Collections already created in this process
+_ensured_collections: set[str] = set()
+
+
+class SemanticResponseCache:
+    """
+    Qdrant-backed cache of query responses.
+
+    Entries are scoped by `user_id` payload (like the chunk collection) and
+    expire via an `expires_at` payload filter. Lookups and writes never
+    raise; a cache failure just means a miss.
+    """
+
+    def __init__(
+        self,
+        qdrant_store: QdrantStore,
+        ttl: Optional[int] = None,
+        threshold: Optional[float] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            qdrant_store: Vector store whose client and dimensions are reused
+            ttl: Seconds an entry stays valid (default from settings)
+            threshold: Minimum cosine similarity for a hit (default from settings)
+        """
+        settings = get_settings()
+        self.qdrant = qdrant_store
+        self.ttl = ttl if ttl is not None else settings.response_cache_ttl_seconds
+        self.threshold = (
+            threshold
+            if threshold is not None
+            else settings.response_cache_similarity_threshold
+        )
+        self.collection_name = f"{qdrant_store.collection_name}_response_cache"
+
+    async def _ensure_collection(self) -> None:
+        """Create the cache collection and its payload indexes once per process."""
+        if self.collection_name in _ensured_collections:
+            return
+
+        client = self.qdrant.client
+        if not await client.collection_exists(self.collection_name):
+            try:
+                await client.create_collection(
+                    collection_name=self.collection_name,
+                    vectors_config=models.VectorParams(
+                        size=self.qdrant.dimensions,
+                        distance=models.Distance.COSINE,
+                    ),
+                )
+            except UnexpectedResponse as e:
+                # Another worker may have created it concurrently
+                if "already exists" not in str(e).lower():
+                    raise
+
+            for field_name, schema_type in (
+                ("user_id", models.PayloadSchemaType.KEYWORD),
+                ("expires_at", models.PayloadSchemaType.FLOAT),
+            ):
+                try:
+                    await client.create_payload_index(
+                        collection_name=self.collection_name,
+                        field_name=field_name,
+                        field_schema=schema_type,
+                    )
+                except UnexpectedResponse as e:
+                    if "already exists" not in str(e).lower():
+                        logger.warning(
+                            "Failed to create payload index",
+                            collection=self.collection_name,
+                            field=field_name,
+                            error=str(e),
+                        )
+
+            logger.info("Response cache collection created", collection=self.collection_name)
+
+        _ensured_collections.add(self.collection_name)
+
+    async def lookup(
+        self,
+        user_id: str,
+        query_vector: list[float],
+    ) -> Optional[QueryResponse]:
+        """
+        Return a cached response for a semantically equivalent query.
+
+        Args:
+            user_id: User identifier
+            query_vector: Embedding of the incoming query
+
+        Returns:
+            Cached QueryResponse, or None on a miss
+        """
+        try:
+            await self._ensure_collection()
+            results = await self.qdrant.client.query_points(
+                collection_name=self.collection_name,
+                query=query_vector,
+                query_filter=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key="user_id",
+                            match=models.MatchValue(value=user_id),
+                        ),
+                        models.FieldCondition(
+                            key="expires_at",
+                            range=models.Range(gt=time.time()),
+                        ),
+                    ]
+                ),
+                limit=1,
+                score_threshold=self.threshold,
+                with_payload=True,
+            )
+            points = results.points if hasattr(results, "points") else results
+            if not points:
+                return None
+
+            hit = points[0]
+            logger.info("Response cache hit", user_id=user_id, score=hit.score)
+            return QueryResponse.model_validate_json(hit.payload["response_json"])
+
+        except Exception as e:
+            logger.warning("Response cache lookup failed", error=str(e))
+            return None
+
+    async def put(
+        self,
+        user_id: str,
+        query_vector: list[float],
+        response: QueryResponse,
+    ) -> None:
+        """
+        Store a response for later near-duplicate queries.
+
+        Args:
+            user_id: User identifier
+            query_vector: Embedding of the query that produced the response
+            response: Final response returned to the user
+        """
+        now = time.time()
+        try:
+            await self._ensure_collection()
+            await self.qdrant.client.upsert(
+                collection_name=self.collection_name,
+                points=[
+                    models.PointStruct(
+                        id=str(uuid.uuid4()),
+                        vector=query_vector,
+                        payload={
+                            "user_id": user_id,
+                            "response_json": response.model_dump_json(),
+                            "timestamp": now,
+                            "expires_at": now + self.ttl,
+                        },
+                    )
+                ],
+            )
+        except Exception as e:
+            logger.warning("Response cache write failed", error=str(e))
+
+    async def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached response for a user (e.g. after new ingestion)."""
+        try:
+            await self.qdrant.client.delete(
+                collection_name=self.collection_name,
+                points_selector=models.FilterSelector(
+                    filter=models.Filter(
+                        must=[
+                            models.FieldCondition(
+                                key="user_id",
+                                match=models.MatchValue(value=user_id),
+                            )
+                        ]
+                    )
+                ),
+            )
+        except Exception as e:
+            logger.warning("Response cache invalidation failed", error=str(e))
+
+
+async def invalidate_response_cache(qdrant_store: QdrantStore, user_id: str) -> None:
+    """
+    Drop cached answers for a user whose knowledge base just changed.
+
+    Call after every ingestion and every deletion (source, note, artifacts,
+    account), so answers never quote or cite content that is gone.
+    """
+    await SemanticResponseCache(qdrant_store).invalidate_user(user_id)
@@ -4,7 +4,18 @@ Pydantic schemas for agent structured outputs.
 
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Config for models parsed from LLM output on every query. Assignments
+# (e.g. attaching retrieval_metadata) are trusted and not re-validated,
+# unknown keys from the model are dropped, and the validator is built on
+# first use instead of at import.
+_LLM_OUTPUT_CONFIG = ConfigDict(
+    extra="ignore",
+    validate_assignment=False,
+    defer_build=True,
+)
 
 
 class IntentType(str, Enum):
@@ -20,7 +31,9 @@ class IntentType(str, Enum):
 
 
 class IntentClassification(BaseModel):
-    """Structured output from intent classifier agent."""
+    """Query intent, from the rule-based fast path or the orchestrator's retrieval tool call."""
+
+    model_config = _LLM_OUTPUT_CONFIG
     
     intent: IntentType = Field(
         description="The classified intent type"
@@ -61,6 +74,8 @@ class RetrievalStrategy(str, Enum):
 
 class Citation(BaseModel):
     """A citation reference for the response."""
+
+    model_config = _LLM_OUTPUT_CONFIG
     
     id: int = Field(description="Citation number [1], [2], etc.")
     title: str = Field(description="Source title")
@@ -74,6 +89,8 @@ class Citation(BaseModel):
 
 class RetrievalMetadata(BaseModel):
     """Metadata about the retrieval process."""
+
+    model_config = _LLM_OUTPUT_CONFIG
     
     retrieval_source: str = Field(
         description="Primary source: 'graph', 'vector', or 'llm_knowledge'"
@@ -96,6 +113,8 @@ class RetrievalMetadata(BaseModel):
 
 class QueryResponse(BaseModel):
     """Final response from the query agent."""
+
+    model_config = _LLM_OUTPUT_CONFIG
     
     answer: str = Field(description="The synthesized answer text")
     citations: list[Citation] = Field(
@@ -131,7 +150,7 @@ class VectorSearchResult(BaseModel):
     source_title: Optional[str] = None
     source_url: Optional[str] = None
     source_type: Optional[str] = None
-    timestamp_start: Optional[int] = None
+    timestamp_start_ms: Optional[int] = None
 
 
 class GraphSearchResult(BaseModel):
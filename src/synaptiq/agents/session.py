@@ -5,15 +5,61 @@ Uses SQLAlchemy sessions from the OpenAI Agents SDK for persistent
 conversation history in PostgreSQL.
 """
 
+import functools
 from typing import Optional
 import structlog
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 
+from synaptiq.core.cache import MISSING, TTLCache
+
 logger = structlog.get_logger(__name__)
 
-# Global engine cache
-_engine: Optional[AsyncEngine] = None
+# Engines created by _engine_for, kept so close_session_engine can
+# dispose every pool
+_engines: list[AsyncEngine] = []
+
+# session_id is "<user_id>:<session_id>"; a "C"-collated index lets
+# list_user_sessions range-scan one user's prefix. Also created by migration
+# 005, which only applies once the SDK has created agent_sessions.
+_SESSION_PREFIX_INDEX_DDL = """
+CREATE INDEX IF NOT EXISTS ix_agent_sessions_session_id_c
+ON agent_sessions (session_id COLLATE "C")
+"""
+
+# SQLAlchemySession objects keyed by "user_id:session_id". They hold no
+# conversation state of their own, so one per conversation is reused.
+_session_cache = TTLCache(maxsize=1024, ttl=3600)
+
+# Engines whose agent_sessions/agent_messages tables are known to exist.
+# Added only after creation succeeds; sessions on these engines skip the
+# table-existence DDL check
+_tables_ready: set[AsyncEngine] = set()
+
+
+@functools.cache
+def _engine_for(postgres_url: str) -> AsyncEngine:
+    """Create the engine for a URL; cached, so each URL gets one pool."""
+    from config.settings import get_settings
+    settings = get_settings()
+    
+    # Every concurrent query holds a connection while it loads and
+    # saves history, so size the pool for that. LIFO reuse keeps a
+    # small set of connections warm; pre-ping and recycle catch
+    # connections the server or a proxy has dropped.
+    engine = create_async_engine(
+        postgres_url,
+        echo=False,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_use_lifo=True,
+    )
+    _engines.append(engine)
+    
+    logger.info("Created session engine", url=postgres_url.split("@")[-1])
+    return engine
 
 
 def create_session_engine(postgres_url: Optional[str] = None) -> AsyncEngine:
@@ -24,26 +70,31 @@ def create_session_engine(postgres_url: Optional[str] = None) -> AsyncEngine:
         postgres_url: PostgreSQL connection URL (uses settings if not provided)
         
     Returns:
-        AsyncEngine instance
+        AsyncEngine instance, shared by every caller using the same URL
     """
-    global _engine
-    
-    if _engine is None:
-        if postgres_url is None:
-            from config.settings import get_settings
-            settings = get_settings()
-            postgres_url = settings.postgres_url
-        
-        _engine = create_async_engine(
-            postgres_url,
-            echo=False,
-            pool_size=5,
-            max_overflow=10,
-        )
-        
-        logger.info("Created session engine", url=postgres_url.split("@")[-1])
+    if postgres_url is None:
+        from config.settings import get_settings
+        postgres_url = get_settings().postgres_url
+    return _engine_for(postgres_url)
+
+
+async def warm_session_engine() -> None:
+    """
+    Open a pooled connection ahead of a session's first query.
     
-    return _engine
+    Meant to run concurrently with retrieval, so the connect (and TLS)
+    handshake on a cold pool overlaps other work instead of delaying the
+    history load. Does nothing when the pool already has an idle
+    connection; failures are logged and left to the session itself.
+    """
+    engine = create_session_engine()
+    if engine.pool.checkedin():
+        return
+    try:
+        async with engine.connect():
+            pass
+    except Exception as e:
+        logger.warning("Session engine warmup failed", error=str(e))
 
 
 async def get_session(session_id: str, user_id: str):
@@ -51,7 +102,8 @@ async def get_session(session_id: str, user_id: str):
     Get or create a session for a user conversation.
     
     Sessions are scoped by combining user_id and session_id to ensure
-    multi-tenant isolation. Sessions persist indefinitely.
+    multi-tenant isolation. Sessions persist indefinitely; the session
+    object for a conversation is cached and reused across queries.
     
     Args:
         session_id: Conversation session identifier
@@ -60,18 +112,26 @@ async def get_session(session_id: str, user_id: str):
     Returns:
         SQLAlchemySession instance
     """
+    # Combine user_id and session_id for multi-tenant isolation
+    full_session_id = f"{user_id}:{session_id}"
+    
+    session = _session_cache.get(full_session_id)
+    if session is not MISSING:
+        return session
+    
     from agents.extensions.memory import SQLAlchemySession
     
     engine = create_session_engine()
     
-    # Combine user_id and session_id for multi-tenant isolation
-    full_session_id = f"{user_id}:{session_id}"
-    
+    tables_ready = engine in _tables_ready
     session = SQLAlchemySession(
         full_session_id,
         engine=engine,
-        create_tables=True,
+        create_tables=not tables_ready,
     )
+    if not tables_ready:
+        await _ensure_tables(engine, session)
+    _session_cache.set(full_session_id, session)
     
     logger.debug(
         "Got session",
@@ -83,6 +143,28 @@ async def get_session(session_id: str, user_id: str):
     return session
 
 
+async def _ensure_tables(engine: AsyncEngine, session) -> None:
+    """
+    Create the session tables through `session` and record the engine as ready.
+    
+    The first operation on a create_tables=True session creates the tables,
+    so a one-row read does it here; the per-user listing index is added
+    right after. Until both succeed every new session
+    keeps create_tables=True; a failure is logged and retried by the next
+    session (or by this one on its first real operation).
+    """
+    from sqlalchemy import text
+    
+    try:
+        await session.get_items(limit=1)
+        async with engine.begin() as conn:
+            await conn.execute(text(_SESSION_PREFIX_INDEX_DDL))
+    except Exception as e:
+        logger.warning("Session table setup failed", error=str(e))
+        return
+    _tables_ready.add(engine)
+
+
 async def list_user_sessions(user_id: str) -> list[str]:
     """
     List all session IDs for a user.
@@ -97,25 +179,26 @@ async def list_user_sessions(user_id: str) -> list[str]:
     
     engine = create_session_engine()
     
-    async with engine.begin() as conn:
-        # Query the sessions table for this user's sessions
+    # Range over "<user_id>:" .. "<user_id>;" (';' follows ':') in byte
+    # order, which matches exactly the prefix and can use the "C"-collated
+    # index from migration 005; the prefix is stripped in SQL
+    prefix = f"{user_id}:"
+    
+    async with engine.connect() as conn:
         result = await conn.execute(
             text(
                 """
-                SELECT DISTINCT session_id 
-                FROM agent_sessions 
-                WHERE session_id LIKE :pattern
-                ORDER BY session_id
+                SELECT substring(session_id FROM :start)
+                FROM agent_sessions
+                WHERE session_id COLLATE "C" >= :lo
+                  AND session_id COLLATE "C" < :hi
+                ORDER BY session_id COLLATE "C"
                 """
             ),
-            {"pattern": f"{user_id}:%"},
+            {"start": len(prefix) + 1, "lo": prefix, "hi": f"{user_id};"},
         )
         
-        rows = result.fetchall()
-        
-    # Strip user_id prefix from session IDs
-    prefix = f"{user_id}:"
-    return [row[0][len(prefix):] for row in rows if row[0].startswith(prefix)]
+        return list(result.scalars())
 
 
 async def delete_session(session_id: str, user_id: str) -> bool:
@@ -133,6 +216,7 @@ async def delete_session(session_id: str, user_id: str) -> bool:
     
     engine = create_session_engine()
     full_session_id = f"{user_id}:{session_id}"
+    _session_cache.pop(full_session_id)
     
     async with engine.begin() as conn:
         result = await conn.execute(
@@ -153,10 +237,14 @@ async def delete_session(session_id: str, user_id: str) -> bool:
 
 
 async def close_session_engine() -> None:
-    """Close the session engine connection pool."""
-    global _engine
-    
-    if _engine is not None:
-        await _engine.dispose()
-        _engine = None
+    """Close the session engine connection pools."""
+    if _engines:
+        engines = list(_engines)
+        _engines.clear()
+        _engine_for.cache_clear()
+        for engine in engines:
+            await engine.dispose()
+        # Cached sessions are bound to the disposed engines
+        _session_cache.clear()
+        _tables_ready.clear()
         logger.info("Closed session engine")
@@ -5,13 +5,18 @@ This agent generates and executes SPARQL queries against the user's
 knowledge graph based on natural language requests.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from agents import Agent
 
+from config.settings import get_settings
+from synaptiq.ontology.namespaces import get_sparql_prefixes
+
 from .context import AgentContext
 from .prompts import SPARQL_AGENT_SYSTEM_PROMPT
+from .model_config import prompt_cache_settings
 from .tools import (
     execute_sparql,
     get_concept_details,
@@ -24,8 +29,9 @@ if TYPE_CHECKING:
     pass
 
 
+@lru_cache(maxsize=1)
 def load_ontology_schema() -> str:
-    """Load the synaptiq ontology TTL file."""
+    """Load the synaptiq ontology TTL file (read from disk once per process)."""
     ontology_path = Path(__file__).parent.parent / "ontology" / "synaptiq.ttl"
     
     if ontology_path.exists():
@@ -34,12 +40,22 @@ def load_ontology_schema() -> str:
     return "# Ontology not found"
 
 
+@lru_cache(maxsize=1)
 def get_prefixes() -> str:
-    """Get SPARQL PREFIX declarations."""
-    from synaptiq.ontology.namespaces import get_sparql_prefixes
+    """Get SPARQL PREFIX declarations (built once per process)."""
     return get_sparql_prefixes()
 
 
+@lru_cache(maxsize=8)
+def _render_instructions(ontology_schema: str, prefixes: str) -> str:
+    """Format the system prompt with ontology context, once per schema."""
+    return SPARQL_AGENT_SYSTEM_PROMPT.format(
+        ontology_schema=ontology_schema,
+        prefixes=prefixes,
+    )
+
+
+@lru_cache(maxsize=8)
 def create_sparql_agent(
     ontology_schema: str | None = None,
     prefixes: str | None = None,
@@ -47,6 +63,9 @@ def create_sparql_agent(
     """
     Create the SPARQL agent with ontology context.
     
+    Agents hold no per-run state, so one instance per schema/prefixes pair
+    is built and shared by every QueryAgent.
+    
     Args:
         ontology_schema: TTL ontology content (loads from file if not provided)
         prefixes: SPARQL prefixes (generates if not provided)
@@ -60,16 +79,13 @@ def create_sparql_agent(
     if prefixes is None:
         prefixes = get_prefixes()
     
-    # Format the system prompt with ontology context
-    instructions = SPARQL_AGENT_SYSTEM_PROMPT.format(
-        ontology_schema=ontology_schema,
-        prefixes=prefixes,
-    )
-    
+    instructions = _render_instructions(ontology_schema, prefixes)
+    model = get_settings().sparql_agent_model
     return Agent[AgentContext](
         name="SPARQL Agent",
         instructions=instructions,
-        model="gpt-5.2-Codex",
+        model=model,
+        model_settings=prompt_cache_settings(model, "sparql", instructions),
         tools=[
             execute_sparql,
             get_concept_details,
@@ -4,17 +4,96 @@ Function tools for agent retrieval.
 These tools are used by agents to query the knowledge graph and vector store.
 """
 
+import logging
 from typing import Optional, Any
 import structlog
 
 from agents import function_tool, RunContextWrapper
 
+from config.settings import get_settings
+
 from .context import AgentContext
 from .schemas import VectorSearchResult, GraphSearchResult, SparqlQueryResult
+from synaptiq.core.cache import MISSING, TTLCache
 from synaptiq.ontology.namespaces import expand_synonyms
 
 logger = structlog.get_logger(__name__)
 
+# Chunk payload keys vector_search returns; the rest are not fetched
+_VECTOR_PAYLOAD_FIELDS = [
+    "text",
+    "source_title",
+    "source_url",
+    "source_type",
+    "timestamp_start_ms",
+]
+
+# Per-call tool logs are DEBUG unless VERBOSE_TOOL_LOGGING is set; with the
+# filtering logger a disabled level returns before building the event
+_TOOL_LOG_LEVEL = logging.INFO if get_settings().verbose_tool_logging else logging.DEBUG
+
+# Results of the structured graph tools, keyed by (user_id, tool, args).
+# Agents often repeat a lookup within a conversation; entries expire after
+# 30s and are dropped early when the user's graph is written.
+_tool_results = TTLCache(maxsize=1024, ttl=30)
+
+# Direct and one-hop paths between two concepts; ?labelA and ?labelB are
+# bound per call so the query text never changes
+_SPARQL_CONCEPT_PATH = """
+SELECT ?relation ?intermediate ?relation2
+WHERE {
+    {
+        # Direct relationship
+        ?conceptA syn:label ?labelA .
+        ?conceptB syn:label ?labelB .
+        ?conceptA ?relation ?conceptB .
+        FILTER(?relation IN (
+            syn:isA, syn:partOf, syn:prerequisiteFor,
+            syn:relatedTo, syn:oppositeOf, syn:usedIn
+        ))
+        BIND("direct" AS ?intermediate)
+        BIND(?relation AS ?relation2)
+    } UNION {
+        # One-hop indirect relationship
+        ?conceptA syn:label ?labelA .
+        ?conceptB syn:label ?labelB .
+        ?conceptA ?relation ?intermediateNode .
+        ?intermediateNode a syn:Concept .
+        ?intermediateNode syn:label ?intermediate .
+        ?intermediateNode ?relation2 ?conceptB .
+        FILTER(?relation IN (
+            syn:isA, syn:partOf, syn:prerequisiteFor,
+            syn:relatedTo, syn:oppositeOf, syn:usedIn
+        ))
+        FILTER(?relation2 IN (
+            syn:isA, syn:partOf, syn:prerequisiteFor,
+            syn:relatedTo, syn:oppositeOf, syn:usedIn
+        ))
+    }
+}
+LIMIT 10
+"""
+
+# Concepts defined or mentioned in chunks of sources whose title contains
+# ?sourceSubstr (bound per call). SPARQL cannot bind LIMIT, so it is
+# formatted in as an int.
+_SPARQL_CONCEPTS_FROM_SOURCE = """
+SELECT DISTINCT ?conceptLabel ?definitionText ?sourceTitle ?sourceUrl
+WHERE {{
+    ?source syn:sourceTitle ?sourceTitle .
+    FILTER(CONTAINS(LCASE(?sourceTitle), ?sourceSubstr))
+    ?chunk syn:derivedFrom ?source .
+    ?concept syn:definedIn|syn:mentionedIn ?chunk .
+    ?concept syn:label ?conceptLabel .
+    OPTIONAL {{
+        ?concept syn:hasDefinition ?def .
+        ?def syn:definitionText ?definitionText .
+    }}
+    OPTIONAL {{ ?source syn:sourceUrl ?sourceUrl }}
+}}
+LIMIT {limit}
+"""
+
 
 @function_tool
 async def vector_search(
@@ -38,42 +117,46 @@ async def vector_search(
     """
     agent_ctx = ctx.context
     
-    logger.info(
+    logger.log(
+        _TOOL_LOG_LEVEL,
         "Vector search",
-        query=query[:50],
+        query=query,
         user_id=agent_ctx.user_id,
         top_k=top_k,
         source_type=source_type,
     )
     
     try:
-        # Generate query embedding
-        query_vector = await agent_ctx.embedding_generator.generate_single(query)
+        async with agent_ctx.tool_limit:
+            # Generate query embedding
+            query_vector = await agent_ctx.embedding_generator.generate_single(query)
         
-        # Search with user isolation
-        results = await agent_ctx.qdrant_store.search(
-            query_vector=query_vector,
-            user_id=agent_ctx.user_id,
-            limit=top_k,
-            source_type=source_type,
-            has_definition=has_definition,
-        )
+            # Search with user isolation
+            results = await agent_ctx.qdrant_store.search(
+                query_vector=query_vector,
+                user_id=agent_ctx.user_id,
+                limit=top_k,
+                source_type=source_type,
+                has_definition=has_definition,
+                payload_fields=_VECTOR_PAYLOAD_FIELDS,
+            )
         
         # Format results
-        formatted = []
-        for r in results:
-            payload = r.get("payload", {})
-            formatted.append({
+        formatted = [
+            {
                 "chunk_id": r["id"],
                 "text": payload.get("text", ""),
                 "score": r["score"],
                 "source_title": payload.get("source_title"),
                 "source_url": payload.get("source_url"),
                 "source_type": payload.get("source_type"),
-                "timestamp_start": payload.get("timestamp_start"),
-            })
+                "timestamp_start_ms": payload.get("timestamp_start_ms"),
+            }
+            for r in results
+            for payload in (r.get("payload") or {},)
+        ]
         
-        logger.info("Vector search complete", result_count=len(formatted))
+        logger.log(_TOOL_LOG_LEVEL, "Vector search complete", result_count=len(formatted))
         return formatted
         
     except Exception as e:
@@ -103,20 +186,23 @@ async def execute_sparql(
     # Replace placeholder with actual user_id
     query = sparql_query.replace("{USER_ID}", agent_ctx.user_id)
     
-    logger.info(
+    logger.log(
+        _TOOL_LOG_LEVEL,
         "Execute SPARQL",
         user_id=agent_ctx.user_id,
-        query_preview=query[:100],
+        query=query,
     )
     
     try:
-        results = await agent_ctx.fuseki_store.query(
-            user_id=agent_ctx.user_id,
-            sparql=query,
-            include_ontology=True,
-        )
+        async with agent_ctx.tool_limit:
+            results = await agent_ctx.fuseki_store.query(
+                user_id=agent_ctx.user_id,
+                sparql=query,
+                include_ontology=True,
+                cache=True,
+            )
         
-        logger.info("SPARQL query complete", result_count=len(results))
+        logger.log(_TOOL_LOG_LEVEL, "SPARQL query complete", result_count=len(results))
         
         return {
             "query": query,
@@ -151,57 +237,54 @@ async def get_concept_details(
     """
     agent_ctx = ctx.context
     
-    logger.info(
+    logger.log(
+        _TOOL_LOG_LEVEL,
         "Get concept details",
         concept_label=concept_label,
         user_id=agent_ctx.user_id,
     )
     
+    cache_key = (agent_ctx.user_id, "get_concept_details", concept_label.lower().strip())
+    cached = _tool_results.get(cache_key)
+    if cached is not MISSING:
+        return cached
+    
     try:
-        # Try the original term and all its synonyms
-        concept_uri = None
+        # Resolve the original term or any synonym, with its definition and
+        # relationships, in one query
         search_terms = expand_synonyms(concept_label)
-        
-        for term in search_terms:
-            concept_uri = await agent_ctx.fuseki_store.concept_exists(
+        async with agent_ctx.tool_limit:
+            bundle = await agent_ctx.fuseki_store.get_concept_bundle(
                 agent_ctx.user_id,
-                term,
+                search_terms,
             )
-            if concept_uri:
-                break
         
-        if not concept_uri:
-            # Fallback to fuzzy search
-            for term in search_terms:
-                similar = await agent_ctx.fuseki_store.find_similar_concepts(
-                    agent_ctx.user_id, term, limit=3
-                )
-                if similar:
-                    concept_uri = similar[0].get("concept")
-                    break
+            if bundle is None:
+                # Fallback to fuzzy search
+                for term in search_terms:
+                    similar = await agent_ctx.fuseki_store.find_similar_concepts(
+                        agent_ctx.user_id, term, limit=3
+                    )
+                    if similar:
+                        bundle = await agent_ctx.fuseki_store.get_concept_bundle(
+                            agent_ctx.user_id,
+                            concept_uri=similar[0].get("concept"),
+                        )
+                        break
         
-        if not concept_uri:
-            logger.info("Concept not found", concept_label=concept_label)
+        if bundle is None:
+            logger.log(_TOOL_LOG_LEVEL, "Concept not found", concept_label=concept_label)
+            _tool_results.set(cache_key, None)
             return None
         
-        # Get concept with definition
-        details = await agent_ctx.fuseki_store.get_concept_with_definition(
-            agent_ctx.user_id,
-            concept_uri,
-        )
-        
-        # Get relationships
-        relationships = await agent_ctx.fuseki_store.get_concept_relationships(
-            agent_ctx.user_id,
-            concept_uri,
-        )
-        
-        return {
-            "uri": concept_uri,
+        result = {
+            "uri": bundle["uri"],
             "label": concept_label,
-            "details": details,
-            "relationships": relationships,
+            "details": bundle["details"],
+            "relationships": bundle["relationships"],
         }
+        _tool_results.set(cache_key, result)
+        return result
         
     except Exception as e:
         logger.error("Get concept details failed", error=str(e))
@@ -228,57 +311,32 @@ async def find_concept_path(
     """
     agent_ctx = ctx.context
     
-    logger.info(
+    logger.log(
+        _TOOL_LOG_LEVEL,
         "Find concept path",
         concept_a=concept_a,
         concept_b=concept_b,
         user_id=agent_ctx.user_id,
     )
     
+    label_a = concept_a.lower()
+    label_b = concept_b.lower()
+    cache_key = (agent_ctx.user_id, "find_concept_path", label_a, label_b)
+    cached = _tool_results.get(cache_key)
+    if cached is not MISSING:
+        return cached
+    
     try:
-        # Build path-finding SPARQL
-        # This finds direct and one-hop indirect relationships
-        sparql = f"""
-        SELECT ?relation ?intermediate ?relation2
-        WHERE {{
-            {{
-                # Direct relationship
-                ?conceptA syn:label "{concept_a.lower()}" .
-                ?conceptB syn:label "{concept_b.lower()}" .
-                ?conceptA ?relation ?conceptB .
-                FILTER(?relation IN (
-                    syn:isA, syn:partOf, syn:prerequisiteFor,
-                    syn:relatedTo, syn:oppositeOf, syn:usedIn
-                ))
-                BIND("direct" AS ?intermediate)
-                BIND(?relation AS ?relation2)
-            }} UNION {{
-                # One-hop indirect relationship
-                ?conceptA syn:label "{concept_a.lower()}" .
-                ?conceptB syn:label "{concept_b.lower()}" .
-                ?conceptA ?relation ?intermediateNode .
-                ?intermediateNode a syn:Concept .
-                ?intermediateNode syn:label ?intermediate .
-                ?intermediateNode ?relation2 ?conceptB .
-                FILTER(?relation IN (
-                    syn:isA, syn:partOf, syn:prerequisiteFor,
-                    syn:relatedTo, syn:oppositeOf, syn:usedIn
-                ))
-                FILTER(?relation2 IN (
-                    syn:isA, syn:partOf, syn:prerequisiteFor,
-                    syn:relatedTo, syn:oppositeOf, syn:usedIn
-                ))
-            }}
-        }}
-        LIMIT 10
-        """
-        
-        results = await agent_ctx.fuseki_store.query(
-            user_id=agent_ctx.user_id,
-            sparql=sparql,
-        )
+        async with agent_ctx.tool_limit:
+            results = await agent_ctx.fuseki_store.query(
+                user_id=agent_ctx.user_id,
+                sparql=_SPARQL_CONCEPT_PATH,
+                initial_bindings={"labelA": label_a, "labelB": label_b},
+                cache=True,
+            )
+        _tool_results.set(cache_key, results)
         
-        logger.info("Find concept path complete", result_count=len(results))
+        logger.log(_TOOL_LOG_LEVEL, "Find concept path complete", result_count=len(results))
         return results
         
     except Exception as e:
@@ -304,36 +362,34 @@ async def get_concepts_from_source(
     """
     agent_ctx = ctx.context
     
-    logger.info(
+    logger.log(
+        _TOOL_LOG_LEVEL,
         "Get concepts from source",
         source_name=source_name,
         user_id=agent_ctx.user_id,
     )
     
+    source_substr = source_name.lower().strip()
+    cache_key = (agent_ctx.user_id, "get_concepts_from_source", source_substr, int(limit))
+    cached = _tool_results.get(cache_key)
+    if cached is not MISSING:
+        return cached
+    
     try:
-        sparql = f"""
-        SELECT DISTINCT ?conceptLabel ?definitionText ?sourceTitle ?sourceUrl
-        WHERE {{
-            ?source syn:sourceTitle ?sourceTitle .
-            FILTER(CONTAINS(LCASE(?sourceTitle), "{source_name.lower()}"))
-            ?chunk syn:derivedFrom ?source .
-            ?concept syn:definedIn|syn:mentionedIn ?chunk .
-            ?concept syn:label ?conceptLabel .
-            OPTIONAL {{
-                ?concept syn:hasDefinition ?def .
-                ?def syn:definitionText ?definitionText .
-            }}
-            OPTIONAL {{ ?source syn:sourceUrl ?sourceUrl }}
-        }}
-        LIMIT {limit}
-        """
+        async with agent_ctx.tool_limit:
+            results = await agent_ctx.fuseki_store.query(
+                user_id=agent_ctx.user_id,
+                sparql=_SPARQL_CONCEPTS_FROM_SOURCE.format(limit=int(limit)),
+                initial_bindings={"sourceSubstr": source_substr},
+                cache=True,
+            )
+        _tool_results.set(cache_key, results)
         
-        results = await agent_ctx.fuseki_store.query(
-            user_id=agent_ctx.user_id,
-            sparql=sparql,
+        logger.log(
+            _TOOL_LOG_LEVEL,
+            "Get concepts from source complete",
+            result_count=len(results),
         )
-        
-        logger.info("Get concepts from source complete", result_count=len(results))
         return results
         
     except Exception as e:
@@ -366,19 +422,25 @@ async def find_similar_concepts(
         all_results = []
         seen_uris = set()
         
-        for term in search_terms:
-            results = await agent_ctx.fuseki_store.find_similar_concepts(
-                user_id=agent_ctx.user_id,
-                label=term,
-                limit=limit,
-            )
-            for r in results:
-                uri = r.get("concept")
-                if uri and uri not in seen_uris:
-                    seen_uris.add(uri)
-                    all_results.append(r)
+        async with agent_ctx.tool_limit:
+            for term in search_terms:
+                results = await agent_ctx.fuseki_store.find_similar_concepts(
+                    user_id=agent_ctx.user_id,
+                    label=term,
+                    limit=limit,
+                )
+                for r in results:
+                    uri = r.get("concept")
+                    if uri and uri not in seen_uris:
+                        seen_uris.add(uri)
+                        all_results.append(r)
         
-        logger.info("Find similar concepts complete", label=label, count=len(all_results))
+        logger.log(
+            _TOOL_LOG_LEVEL,
+            "Find similar concepts complete",
+            label=label,
+            count=len(all_results),
+        )
         return all_results[:limit]
         
     except Exception as e:
@@ -2,20 +2,23 @@
 FastAPI application factory and configuration.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional
 
+import orjson
 import structlog
-from fastapi import FastAPI, Query, Request, WebSocket, status
+from fastapi import FastAPI, Query, Request, Response, WebSocket, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from config.settings import get_settings
-from synaptiq.api.dependencies import cleanup_resources
+from synaptiq.api.dependencies import cleanup_resources, init_resources
 from synaptiq.api.routes import auth, ingest, jobs, notes, search, sources, chat, user, graph
 from synaptiq.api.middleware.auth import AuthMiddleware
+from synaptiq.api.routes.auth import close_oauth_http_client
 from synaptiq.api.websocket import manager as ws_manager, websocket_endpoint
 from synaptiq.core.exceptions import SynaptiqError
+from synaptiq.core.logging_config import configure_logging
 from synaptiq.infrastructure.database import close_db
 
 logger = structlog.get_logger(__name__)
@@ -29,6 +32,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     settings = get_settings()
     logger.info("Configuration loaded", log_level=settings.log_level)
     
+    # Build shared stores before serving requests
+    await init_resources(app)
+    logger.info("Shared resources initialized")
+    
     # Start WebSocket pub/sub listener
     await ws_manager.start_pubsub_listener()
     logger.info("WebSocket pub/sub listener started")
@@ -38,12 +45,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Shutdown
     logger.info("Shutting down Synaptiq Data Engine API")
     
-    # Stop WebSocket pub/sub listener
-    await ws_manager.stop_pubsub_listener()
-    logger.info("WebSocket pub/sub listener stopped")
-    
-    await cleanup_resources()
-    await close_db()
+    # Independent teardown steps run concurrently; one failing does not
+    # stop the others
+    results = await asyncio.gather(
+        ws_manager.stop_pubsub_listener(),
+        cleanup_resources(app),
+        close_db(),
+        close_oauth_http_client(),
+        return_exceptions=True,
+    )
+    steps = ("pubsub_listener", "resources", "database", "oauth_http_client")
+    for step, result in zip(steps, results):
+        if isinstance(result, BaseException):
+            logger.error("Shutdown step failed", step=step, error=str(result))
+    logger.info("Shutdown complete")
 
 
 def create_app() -> FastAPI:
@@ -54,6 +69,7 @@ def create_app() -> FastAPI:
         Configured FastAPI application
     """
     settings = get_settings()
+    configure_logging(settings.log_level)
 
     app = FastAPI(
         title="Synaptiq Data Engine",
@@ -110,13 +126,15 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
     )
 
-    # CORS middleware
+    # CORS middleware: explicit allowlists, with preflights cached by the
+    # browser for cors_max_age_seconds
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # Configure for production
+        allow_origins=settings.allowed_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=settings.cors_methods,
+        allow_headers=settings.cors_headers,
+        max_age=settings.cors_max_age_seconds,
     )
     
     # Auth middleware - validates JWT and attaches user to request
@@ -127,7 +145,7 @@ def create_app() -> FastAPI:
     async def synaptiq_error_handler(
         request: Request,
         exc: SynaptiqError,
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle Synaptiq-specific errors."""
         logger.error(
             "SynaptiqError",
@@ -135,32 +153,34 @@ def create_app() -> FastAPI:
             message=exc.message,
             details=exc.details,
         )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
+        return Response(
+            orjson.dumps({
                 "error": type(exc).__name__,
                 "message": exc.message,
                 "details": exc.details,
-            },
+            }),
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            media_type="application/json",
         )
 
     @app.exception_handler(Exception)
     async def general_exception_handler(
         request: Request,
         exc: Exception,
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle unexpected errors."""
         logger.error(
             "Unhandled exception",
             error_type=type(exc).__name__,
             message=str(exc),
         )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
+        return Response(
+            orjson.dumps({
                 "error": "InternalServerError",
                 "message": "An unexpected error occurred",
-            },
+            }),
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            media_type="application/json",
         )
 
     # Include routers
@@ -1,106 +1,102 @@
 """
 FastAPI dependency injection for shared resources.
+
+Stores and clients are built once in the application lifespan
+(`init_resources`) and kept on `app.state`; the dependencies below just
+hand out those instances.
 """
 
-from typing import AsyncGenerator
+import asyncio
+
+import structlog
+from fastapi import FastAPI, Request
 
+from synaptiq.agents import warm_query_embedder
+from synaptiq.ontology.graph_manager import GraphManager
 from synaptiq.processors.embedder import EmbeddingGenerator
 from synaptiq.storage.fuseki import FusekiStore
 from synaptiq.storage.mongodb import MongoDBStore
 from synaptiq.storage.qdrant import QdrantStore
 
+logger = structlog.get_logger(__name__)
 
-# Singleton instances
-_qdrant_store: QdrantStore | None = None
-_mongodb_store: MongoDBStore | None = None
-_embedder: EmbeddingGenerator | None = None
-_fuseki_store: FusekiStore | None = None
 
-
-async def get_qdrant() -> AsyncGenerator[QdrantStore, None]:
+async def init_resources(app: FastAPI) -> None:
     """
-    Dependency for Qdrant store.
-    Uses a singleton pattern for connection reuse.
+    Build the shared stores and attach them to `app.state`.
+
+    Runs once at startup, before any request is served, so collections and
+    indexes are ensured up front, embedding API connections are open, and
+    first requests pay no setup cost.
     """
-    global _qdrant_store
-    if _qdrant_store is None:
-        _qdrant_store = QdrantStore()
-        await _qdrant_store.ensure_collection()
-    yield _qdrant_store
+    qdrant = QdrantStore()
+    await qdrant.ensure_collection()
 
+    mongodb = MongoDBStore()
+    await mongodb.ensure_indexes()
 
-async def get_mongodb() -> AsyncGenerator[MongoDBStore, None]:
-    """
-    Dependency for MongoDB store.
-    Uses a singleton pattern for connection reuse.
-    """
-    global _mongodb_store
-    if _mongodb_store is None:
-        _mongodb_store = MongoDBStore()
-        await _mongodb_store.ensure_indexes()
-    yield _mongodb_store
+    fuseki = FusekiStore()
 
+    # The search routes and the chat agents use separate embedders
+    embedder = EmbeddingGenerator()
+    await asyncio.gather(embedder.warmup(), warm_query_embedder())
 
-async def get_embedder() -> AsyncGenerator[EmbeddingGenerator, None]:
-    """
-    Dependency for embedding generator.
-    Uses a singleton pattern for client reuse.
-    """
-    global _embedder
-    if _embedder is None:
-        _embedder = EmbeddingGenerator()
-    yield _embedder
+    app.state.qdrant = qdrant
+    app.state.mongodb = mongodb
+    app.state.embedder = embedder
+    app.state.fuseki = fuseki
+    # Share the Fuseki client instead of opening a second one
+    app.state.graph_manager = GraphManager(fuseki_store=fuseki)
 
 
-async def get_fuseki() -> AsyncGenerator[FusekiStore, None]:
-    """
-    Dependency for Fuseki store.
-    Uses a singleton pattern for connection reuse.
-    """
-    global _fuseki_store
-    if _fuseki_store is None:
-        _fuseki_store = FusekiStore()
-    yield _fuseki_store
+async def get_qdrant(request: Request) -> QdrantStore:
+    """Dependency for the shared Qdrant store."""
+    return request.app.state.qdrant
 
 
-from synaptiq.ontology.graph_manager import GraphManager
+async def get_mongodb(request: Request) -> MongoDBStore:
+    """Dependency for the shared MongoDB store."""
+    return request.app.state.mongodb
 
-# ... singletons
-_graph_manager: GraphManager | None = None
 
+async def get_embedder(request: Request) -> EmbeddingGenerator:
+    """Dependency for the shared embedding generator."""
+    return request.app.state.embedder
 
-# ... functions
 
-async def get_graph_manager() -> AsyncGenerator[GraphManager, None]:
-    """
-    Dependency for graph manager.
-    Uses a singleton pattern.
-    """
-    global _graph_manager
-    if _graph_manager is None:
-        _graph_manager = GraphManager()
-        # await _graph_manager.initialize() # Check if init is needed
-    yield _graph_manager
-
-async def cleanup_resources() -> None:
-    """Cleanup all singleton resources on shutdown."""
-    global _qdrant_store, _mongodb_store, _graph_manager, _fuseki_store
-
-    if _qdrant_store is not None:
-        await _qdrant_store.close()
-        _qdrant_store = None
-
-    if _mongodb_store is not None:
-        await _mongodb_store.close()
-        _mongodb_store = None
-        
-    if _graph_manager is not None:
-        await _graph_manager.close()
-        _graph_manager = None
-    
-    if _fuseki_store is not None:
-        await _fuseki_store.close()
-        _fuseki_store = None
+async def get_fuseki(request: Request) -> FusekiStore:
+    """Dependency for the shared Fuseki store."""
+    return request.app.state.fuseki
+
+
+async def get_graph_manager(request: Request) -> GraphManager:
+    """Dependency for the shared graph manager."""
+    return request.app.state.graph_manager
+
 
+async def cleanup_resources(app: FastAPI) -> None:
+    """Close all shared resources concurrently on shutdown."""
+    state = app.state
 
+    # The graph manager shares the Fuseki client, so it is closed once here
+    stores = [
+        store
+        for store in (
+            getattr(state, "qdrant", None),
+            getattr(state, "mongodb", None),
+            getattr(state, "fuseki", None),
+        )
+        if store is not None
+    ]
+    state.qdrant = state.mongodb = state.fuseki = state.graph_manager = None
 
+    results = await asyncio.gather(
+        *(store.close() for store in stores), return_exceptions=True
+    )
+    for store, result in zip(stores, results):
+        if isinstance(result, BaseException):
+            logger.warning(
+                "Failed to close store",
+                store=type(store).__name__,
+                error=str(result),
+            )
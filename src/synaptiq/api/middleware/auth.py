@@ -11,67 +11,166 @@ from typing import Optional
 
 import structlog
 from fastapi import Depends, HTTPException, Request, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
+from fastapi.security import HTTPBearer
+from starlette.datastructures import State
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from synaptiq.core.cache import MISSING
 from synaptiq.domain.models import User
-from synaptiq.infrastructure.database import get_async_session, get_session_factory
+from synaptiq.infrastructure.database import get_readonly_session_factory
 from synaptiq.services.auth_service import AuthService
 
 logger = structlog.get_logger(__name__)
 
-# HTTP Bearer scheme for extracting JWT from Authorization header
-http_bearer = HTTPBearer(auto_error=False)
+
+class _RequestStateBearer(HTTPBearer):
+    """
+    Bearer scheme that returns the token AuthMiddleware already parsed.
+
+    Declared as a security scheme so OpenAPI still documents bearer auth,
+    but the Authorization header is not parsed a second time. Without the
+    middleware (e.g. an app or test client that does not install it) the
+    header is parsed as usual.
+    """
+
+    async def __call__(self, request: Request) -> Optional[str]:  # type: ignore[override]
+        token = getattr(request.state, "token", MISSING)
+        if token is not MISSING:
+            return token
+        credentials = await super().__call__(request)
+        return credentials.credentials if credentials else None
+
+
+# HTTP Bearer scheme for the JWT from the Authorization header
+http_bearer = _RequestStateBearer(auto_error=False)
+
+# Paths that never read the user; probes and docs skip token validation
+_PUBLIC_PATHS = frozenset({
+    "/",
+    "/health",
+    "/docs",
+    "/docs/oauth2-redirect",
+    "/redoc",
+    "/openapi.json",
+    "/ws/status",
+})
+
+# Shared 401 details for the dependencies; each raise builds its own
+# HTTPException so no traceback or context is kept between requests.
+_AUTH_REQUIRED_DETAIL = {
+    "message": "Authentication required",
+    "code": "not_authenticated",
+}
+_INVALID_TOKEN_DETAIL = {
+    "message": "Invalid or expired token",
+    "code": "invalid_token",
+}
+_NOT_AUTHENTICATED_DETAIL = {
+    "message": "Not authenticated",
+    "code": "not_authenticated",
+}
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
+# Authorization scheme prefix, compared case-insensitively (RFC 7235)
+_BEARER_PREFIX = b"bearer "
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+
+def _bearer_token(scope: Scope) -> Optional[str]:
+    """
+    Extract the token from an `Authorization: Bearer <token>` header.
+    
+    Scans the raw ASGI header list (names are lowercase bytes) instead of
+    building a Starlette Headers object, and decodes only the token.
+    """
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            if (
+                len(value) > _BEARER_PREFIX_LEN
+                and value[:_BEARER_PREFIX_LEN].lower() == _BEARER_PREFIX
+            ):
+                return value[_BEARER_PREFIX_LEN:].strip().decode("latin-1") or None
+            return None
+    return None
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """
     Middleware that validates JWT tokens and attaches user to request state.
     
-    This middleware runs for all requests and attempts to extract and validate
-    the JWT token from the Authorization header. If valid, the user is attached
-    to `request.state.user`.
+    This middleware runs for all HTTP requests and attempts to extract and
+    validate the JWT token from the Authorization header. If valid, the user
+    is attached to `request.state.user`.
     
     Routes can then use `get_current_user` or `get_current_user_optional`
-    dependencies to access the authenticated user.
+    dependencies to access the authenticated user. Those dependencies read
+    `request.state.user` directly, so the middleware must be installed.
+    `request.state.auth_checked` records that the token was already
+    verified, so a rejected token is not verified a second time. If
+    verification itself fails (database or cache outage), the error is kept
+    on `request.state.auth_error` and re-raised by the dependencies, so
+    protected routes fail with a 5xx instead of a misleading 401.
+    
+    Written as a plain ASGI middleware rather than a BaseHTTPMiddleware, so
+    requests are not wrapped in an extra task and a pair of memory streams.
     """
     
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and attach user if authenticated."""
-        # Initialize user as None
-        request.state.user = None
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Extract token from Authorization header
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]  # Remove "Bearer " prefix
-            
-            # Validate token and get user
-            session_factory = get_session_factory()
-            async with session_factory() as session:
+        # Always define these, so dependencies can read them directly.
+        # `request.state` is a view over scope["state"].
+        state = State(scope.setdefault("state", {}))
+        state.user = None
+        state.user_id = None
+        state.auth_checked = False
+        state.token = None
+        state.auth_error = None
+        
+        if scope["path"] not in _PUBLIC_PATHS:
+            # Extract token from Authorization header
+            token = state.token = _bearer_token(scope)
+            if token:
+                # Validate token and get user
                 try:
-                    auth_service = AuthService(session)
-                    user = await auth_service.verify_access_token(token)
-                    if user:
-                        request.state.user = user
-                        request.state.user_id = user.id
+                    user = await _verify_token(token)
                 except Exception as e:
                     logger.warning("Auth middleware error", error=str(e))
+                    state.auth_error = e
+                else:
+                    _attach_user(state, user)
         
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
+
+
+def _attach_user(state: State, user: Optional[User]) -> None:
+    """Record a verification outcome on the request (at most once per request)."""
+    state.auth_checked = True
+    if user:
+        state.user = user
+        state.user_id = user.id
+
+
+async def _verify_token(token: str) -> Optional[User]:
+    """
+    Verify an access token, opening a database session only to read the user.
+    
+    Dependencies use this instead of a `get_async_session` dependency so that
+    requests without credentials (or with a cached token) never check out a
+    pooled connection.
+    """
+    return await AuthService.authenticate(token, get_readonly_session_factory())
 
 
 async def get_current_user(
     request: Request,
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
-    session: AsyncSession = Depends(get_async_session),
+    token: Optional[str] = Depends(http_bearer),
 ) -> User:
     """
     FastAPI dependency that requires a valid JWT token.
@@ -86,56 +185,50 @@ async def get_current_user(
     
     Args:
         request: FastAPI request object
-        credentials: HTTP Bearer credentials from Authorization header
-        session: Database session
+        token: Bearer token parsed from the Authorization header
         
     Returns:
         Authenticated User object
         
     Raises:
         HTTPException: If not authenticated or token is invalid
+        Exception: The middleware's verification error, if it could not run
     """
     # First check if middleware already attached user
-    user = getattr(request.state, "user", None)
+    user = request.state.user
     if user:
         return user
     
     # If no credentials provided
-    if not credentials:
+    if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={
-                "message": "Authentication required",
-                "code": "not_authenticated",
-            },
-            headers={"WWW-Authenticate": "Bearer"},
+            detail=_AUTH_REQUIRED_DETAIL,
+            headers=_BEARER_CHALLENGE,
         )
     
-    # Validate token
-    auth_service = AuthService(session)
-    user = await auth_service.verify_access_token(credentials.credentials)
+    # Verification could not run (e.g. database outage); not a bad token
+    if request.state.auth_error is not None:
+        raise request.state.auth_error
+    
+    # Validate token, unless the middleware already tried and rejected it
+    if not request.state.auth_checked:
+        user = await _verify_token(token)
+        _attach_user(request.state, user)
     
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={
-                "message": "Invalid or expired token",
-                "code": "invalid_token",
-            },
-            headers={"WWW-Authenticate": "Bearer"},
+            detail=_INVALID_TOKEN_DETAIL,
+            headers=_BEARER_CHALLENGE,
         )
     
-    # Store user in request state for other dependencies
-    request.state.user = user
-    request.state.user_id = user.id
-    
     return user
 
 
 async def get_current_user_optional(
     request: Request,
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
-    session: AsyncSession = Depends(get_async_session),
+    token: Optional[str] = Depends(http_bearer),
 ) -> Optional[User]:
     """
     FastAPI dependency that optionally authenticates.
@@ -152,28 +245,28 @@ async def get_current_user_optional(
     
     Args:
         request: FastAPI request object
-        credentials: HTTP Bearer credentials (may be None)
-        session: Database session
+        token: Bearer token parsed from the Authorization header (may be None)
         
     Returns:
         User if authenticated, None otherwise
     """
     # Check if middleware already attached user
-    user = getattr(request.state, "user", None)
+    user = request.state.user
     if user:
         return user
     
     # If no credentials, return None (anonymous access)
-    if not credentials:
+    if not token:
         return None
     
-    # Try to validate token
-    auth_service = AuthService(session)
-    user = await auth_service.verify_access_token(credentials.credentials)
+    # Verification could not run (e.g. database outage); not a bad token
+    if request.state.auth_error is not None:
+        raise request.state.auth_error
     
-    if user:
-        request.state.user = user
-        request.state.user_id = user.id
+    # Try to validate token, unless the middleware already rejected it
+    if not request.state.auth_checked:
+        user = await _verify_token(token)
+        _attach_user(request.state, user)
     
     return user
 
@@ -194,11 +287,11 @@ def get_user_id(request: Request) -> str:
         ...
     ```
     """
-    user_id = getattr(request.state, "user_id", None)
+    user_id = request.state.user_id
     if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={"message": "Not authenticated", "code": "not_authenticated"},
+            detail=_NOT_AUTHENTICATED_DETAIL,
         )
     return user_id
 
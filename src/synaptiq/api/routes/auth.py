@@ -11,15 +11,18 @@ Provides endpoints for:
 - Current user info
 """
 
+import asyncio
 from datetime import datetime, timedelta, timezone
-import json
-from typing import Any, Literal, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Literal, Mapping, Optional, get_args
 from urllib.parse import urlencode
 from uuid import uuid4
 
 import httpx
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from jose import JWTError, jwt
 from pydantic import BaseModel, EmailStr, Field
@@ -34,6 +37,17 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1/auth", tags=["auth"])
 
+# Shared client for provider token/profile calls, so OAuth callbacks reuse
+# pooled TLS connections instead of handshaking with the provider each time
+_oauth_http_client: Optional[httpx.AsyncClient] = None
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); use it when present
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
 
 # =============================================================================
 # REQUEST/RESPONSE SCHEMAS
@@ -127,34 +141,72 @@ def get_client_info(request: Request) -> tuple[Optional[str], Optional[str]]:
     # Get IP from X-Forwarded-For if behind proxy
     forwarded_for = request.headers.get("x-forwarded-for")
     if forwarded_for:
-        ip_address = forwarded_for.split(",")[0].strip()
+        ip_address = forwarded_for.partition(",")[0].strip()
     else:
         ip_address = request.client.host if request.client else None
     
     return user_agent, ip_address
 
 
+async def get_auth_service(
+    session: AsyncSession = Depends(get_async_session),
+) -> AuthService:
+    """
+    Dependency providing an AuthService bound to the request's session.
+
+    FastAPI caches dependency results per request, so every consumer in
+    one request shares a single service and session.
+    """
+    return AuthService(session)
+
+
+def _user_fields(user) -> dict[str, Any]:
+    """UserResponse fields for a User, as a plain dict."""
+    return {
+        "id": user.id,
+        "email": user.email,
+        "name": user.name,
+        "avatar_url": user.avatar_url,
+        "graph_uri": user.graph_uri,
+        "is_verified": user.is_verified,
+        "created_at": user.created_at.isoformat(),
+    }
+
+
+def _json_response(content: dict[str, Any]) -> Response:
+    """Serialize trusted response fields with orjson, skipping the response_model pass."""
+    return Response(orjson.dumps(content), media_type="application/json")
+
+
 def user_to_response(user) -> UserResponse:
-    """Convert User model to response schema."""
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        name=user.name,
-        avatar_url=user.avatar_url,
-        graph_uri=user.graph_uri,
-        is_verified=user.is_verified,
-        created_at=user.created_at.isoformat(),
-    )
+    """
+    Convert User model to response schema.
+
+    Fields come from a trusted database row, so validation is skipped.
+    """
+    return UserResponse.model_construct(**_user_fields(user))
+
+
+def tokens_to_response(token_pair) -> TokenResponse:
+    """Convert a service TokenPair to response schema (trusted, unvalidated)."""
+    return TokenResponse.model_construct(**token_pair.to_dict())
 
 
 OAuthProvider = Literal["google", "github"]
 OAuthMode = Literal["login", "signup"]
 
+_OAUTH_PROVIDERS: frozenset[str] = frozenset(get_args(OAuthProvider))
+_OAUTH_MODES: frozenset[str] = frozenset(get_args(OAuthMode))
+
 
 def _validate_oauth_provider(provider: str) -> OAuthProvider:
     """Validate provider path param and normalize casing."""
+    # Common case: the path already holds the canonical name
+    if provider in _OAUTH_PROVIDERS:
+        return provider  # type: ignore[return-value]
+
     normalized = provider.lower().strip()
-    if normalized not in {"google", "github"}:
+    if normalized not in _OAUTH_PROVIDERS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -193,22 +245,28 @@ def _resolve_frontend_origin(origin: Optional[str]) -> str:
     return requested_origin
 
 
-def _oauth_provider_config(provider: OAuthProvider) -> dict[str, str]:
-    """Get OAuth endpoint and credential configuration for a provider."""
+@lru_cache(maxsize=2)
+def _oauth_provider_config(provider: OAuthProvider) -> Mapping[str, str]:
+    """
+    Get OAuth endpoint and credential configuration for a provider.
+
+    Settings are loaded once per process, so the mapping is built once per
+    provider and returned as a read-only view.
+    """
     settings = get_settings()
 
     if provider == "google":
-        return {
+        return MappingProxyType({
             "client_id": settings.google_oauth_client_id or "",
             "client_secret": settings.google_oauth_client_secret or "",
             "authorize_url": "https://accounts.google.com/o/oauth2/v2/auth",
             "token_url": "https://oauth2.googleapis.com/token",
             "userinfo_url": "https://openidconnect.googleapis.com/v1/userinfo",
             "scope": "openid email profile",
-        }
+        })
 
     if provider == "github":
-        return {
+        return MappingProxyType({
             "client_id": settings.github_oauth_client_id or "",
             "client_secret": settings.github_oauth_client_secret or "",
             "authorize_url": "https://github.com/login/oauth/authorize",
@@ -216,7 +274,7 @@ def _oauth_provider_config(provider: OAuthProvider) -> dict[str, str]:
             "userinfo_url": "https://api.github.com/user",
             "emails_url": "https://api.github.com/user/emails",
             "scope": "read:user user:email",
-        }
+        })
 
     raise HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
@@ -235,8 +293,12 @@ def _build_oauth_callback_url(request: Request, provider: OAuthProvider) -> str:
     return str(request.url_for("oauth_callback", provider=provider))
 
 
-def _build_oauth_state(provider: OAuthProvider, mode: OAuthMode, origin: str) -> str:
-    """Create a short-lived signed OAuth state token for CSRF protection."""
+async def _build_oauth_state(provider: OAuthProvider, mode: OAuthMode, origin: str) -> str:
+    """
+    Create a short-lived signed OAuth state token for CSRF protection.
+
+    Signing runs in a worker thread so login bursts do not stall the event loop.
+    """
     settings = get_settings()
     expires_at = datetime.now(timezone.utc) + timedelta(minutes=10)
 
@@ -250,19 +312,23 @@ def _build_oauth_state(provider: OAuthProvider, mode: OAuthMode, origin: str) ->
         "exp": expires_at,
     }
 
-    return jwt.encode(
+    return await asyncio.to_thread(
+        jwt.encode,
         payload,
         settings.jwt_secret_key,
         algorithm=settings.jwt_algorithm,
     )
 
 
-def _decode_oauth_state(state_token: str, expected_provider: OAuthProvider) -> dict[str, Any]:
-    """Validate and decode OAuth state token."""
+async def _decode_oauth_state(
+    state_token: str, expected_provider: OAuthProvider
+) -> dict[str, Any]:
+    """Validate and decode OAuth state token (verified in a worker thread)."""
     settings = get_settings()
 
     try:
-        payload = jwt.decode(
+        payload = await asyncio.to_thread(
+            jwt.decode,
             state_token,
             settings.jwt_secret_key,
             algorithms=[settings.jwt_algorithm],
@@ -276,7 +342,7 @@ def _decode_oauth_state(state_token: str, expected_provider: OAuthProvider) -> d
         raise ValueError("state_provider_mismatch")
 
     mode = payload.get("mode")
-    if mode not in {"login", "signup"}:
+    if mode not in _OAUTH_MODES:
         raise ValueError("invalid_state_mode")
 
     origin = payload.get("origin")
@@ -286,34 +352,15 @@ def _decode_oauth_state(state_token: str, expected_provider: OAuthProvider) -> d
     return payload
 
 
-def _json_for_script(value: Any) -> str:
+def _json_for_script(value: Any) -> bytes:
     """Serialize JSON safely for embedding in inline script blocks."""
-    return json.dumps(value).replace("</", "<\\/")
-
-
-def _oauth_popup_response(
-    *,
-    origin: str,
-    fallback_path: str,
-    payload: Optional[dict[str, Any]] = None,
-    error: Optional[dict[str, str]] = None,
-) -> HTMLResponse:
-    """
-    Return an HTML page for OAuth popup completion.
+    return orjson.dumps(value).replace(b"</", b"<\\/")
 
-    The page posts a message to the opener window and closes itself.
-    If no opener exists, it redirects to the frontend auth page.
-    """
-    message: dict[str, Any] = {
-        "type": "synaptiq_oauth_result",
-        "status": "error" if error else "success",
-    }
-    if payload:
-        message["payload"] = payload
-    if error:
-        message["error"] = error
 
-    html = f"""<!doctype html>
+# Popup page as bytes, split around `__POPUP__`: the JSON object holding
+# the target origin, the message and the fallback path goes in between
+_OAUTH_POPUP_HEAD, _OAUTH_POPUP_TAIL = (
+    b"""<!doctype html>
 <html lang="en">
   <head>
     <meta charset="utf-8" />
@@ -322,34 +369,62 @@ def _oauth_popup_response(
   </head>
   <body>
     <script>
-      (function() {{
-        var targetOrigin = {_json_for_script(origin)};
-        var message = {_json_for_script(message)};
+      (function() {
+        var popup = __POPUP__;
+        var targetOrigin = popup.origin;
+        var message = popup.message;
 
-        try {{
-          if (window.opener && !window.opener.closed) {{
+        try {
+          if (window.opener && !window.opener.closed) {
             window.opener.postMessage(message, targetOrigin);
             window.close();
             return;
-          }}
-        }} catch (e) {{
+          }
+        } catch (e) {
           // Fall through to redirect.
-        }}
+        }
 
-        var redirectUrl = new URL({_json_for_script(fallback_path)}, targetOrigin);
-        if (message.status === "error" && message.error && message.error.code) {{
+        var redirectUrl = new URL(popup.fallback, targetOrigin);
+        if (message.status === "error" && message.error && message.error.code) {
           redirectUrl.searchParams.set("oauth_error", message.error.code);
-        }} else {{
+        } else {
           redirectUrl.searchParams.set("oauth", "success");
-        }}
+        }
         window.location.replace(redirectUrl.toString());
-      }})();
+      })();
     </script>
   </body>
 </html>
 """
+).split(b"__POPUP__")
+
+
+def _oauth_popup_response(
+    *,
+    origin: str,
+    fallback_path: str,
+    payload: Optional[dict[str, Any]] = None,
+    error: Optional[dict[str, str]] = None,
+) -> HTMLResponse:
+    """
+    Return an HTML page for OAuth popup completion.
+
+    The page posts a message to the opener window and closes itself.
+    If no opener exists, it redirects to the frontend auth page.
+    """
+    message: dict[str, Any] = {
+        "type": "synaptiq_oauth_result",
+        "status": "error" if error else "success",
+    }
+    if payload:
+        message["payload"] = payload
+    if error:
+        message["error"] = error
 
-    return HTMLResponse(content=html)
+    popup = _json_for_script(
+        {"origin": origin, "message": message, "fallback": fallback_path}
+    )
+    return HTMLResponse(content=_OAUTH_POPUP_HEAD + popup + _OAUTH_POPUP_TAIL)
 
 
 def _oauth_fallback_path(mode: OAuthMode) -> str:
@@ -357,7 +432,7 @@ def _oauth_fallback_path(mode: OAuthMode) -> str:
     return "/signup" if mode == "signup" else "/login"
 
 
-def _ensure_oauth_provider_configured(provider: OAuthProvider) -> dict[str, str]:
+def _ensure_oauth_provider_configured(provider: OAuthProvider) -> Mapping[str, str]:
     """Ensure OAuth client credentials are configured."""
     config = _oauth_provider_config(provider)
     if not config.get("client_id") or not config.get("client_secret"):
@@ -371,6 +446,48 @@ def _ensure_oauth_provider_configured(provider: OAuthProvider) -> dict[str, str]
     return config
 
 
+def _get_oauth_http_client() -> httpx.AsyncClient:
+    """Get the shared OAuth HTTP client, creating it on first use."""
+    global _oauth_http_client
+    if _oauth_http_client is None or _oauth_http_client.is_closed:
+        _oauth_http_client = httpx.AsyncClient(
+            http2=HAS_HTTP2,
+            timeout=15.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _oauth_http_client
+
+
+async def close_oauth_http_client() -> None:
+    """Close the shared OAuth HTTP client (application shutdown)."""
+    global _oauth_http_client
+    if _oauth_http_client is not None:
+        client, _oauth_http_client = _oauth_http_client, None
+        await client.aclose()
+
+
+@lru_cache(maxsize=2)
+def _oauth_authorize_prefix(provider: OAuthProvider) -> str:
+    """
+    Authorize URL plus the encoded parameters that never change for a provider.
+
+    Only `redirect_uri` and `state` vary per request; they are encoded
+    separately and appended to this prefix.
+    """
+    config = _oauth_provider_config(provider)
+    params: dict[str, str] = {
+        "client_id": config["client_id"],
+        "response_type": "code",
+        "scope": config["scope"],
+    }
+    if provider == "google":
+        params["access_type"] = "online"
+        params["prompt"] = "select_account"
+    else:
+        params["allow_signup"] = "true"
+    return f"{config['authorize_url']}?{urlencode(params)}&"
+
+
 def _pick_verified_github_email(email_rows: list[dict[str, Any]]) -> Optional[str]:
     """Pick the best verified email from GitHub email rows."""
     verified_rows = [row for row in email_rows if row.get("verified")]
@@ -387,36 +504,36 @@ async def _fetch_google_identity(
     *,
     code: str,
     redirect_uri: str,
-    config: dict[str, str],
+    config: Mapping[str, str],
 ) -> dict[str, Optional[str]]:
     """Exchange Google code and return normalized identity profile."""
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        token_res = await client.post(
-            config["token_url"],
-            data={
-                "code": code,
-                "client_id": config["client_id"],
-                "client_secret": config["client_secret"],
-                "redirect_uri": redirect_uri,
-                "grant_type": "authorization_code",
-            },
-        )
-        if token_res.status_code >= 400:
-            raise AuthError("Google OAuth token exchange failed", code="oauth_token_exchange_failed")
+    client = _get_oauth_http_client()
+    token_res = await client.post(
+        config["token_url"],
+        data={
+            "code": code,
+            "client_id": config["client_id"],
+            "client_secret": config["client_secret"],
+            "redirect_uri": redirect_uri,
+            "grant_type": "authorization_code",
+        },
+    )
+    if token_res.status_code >= 400:
+        raise AuthError("Google OAuth token exchange failed", code="oauth_token_exchange_failed")
 
-        token_data = token_res.json()
-        access_token = token_data.get("access_token")
-        if not access_token:
-            raise AuthError("Google OAuth did not return an access token", code="oauth_token_missing")
+    token_data = orjson.loads(token_res.content)
+    access_token = token_data.get("access_token")
+    if not access_token:
+        raise AuthError("Google OAuth did not return an access token", code="oauth_token_missing")
 
-        profile_res = await client.get(
-            config["userinfo_url"],
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-        if profile_res.status_code >= 400:
-            raise AuthError("Failed to fetch Google user profile", code="oauth_profile_fetch_failed")
+    profile_res = await client.get(
+        config["userinfo_url"],
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    if profile_res.status_code >= 400:
+        raise AuthError("Failed to fetch Google user profile", code="oauth_profile_fetch_failed")
 
-        profile = profile_res.json()
+    profile = orjson.loads(profile_res.content)
 
     email = profile.get("email")
     email_verified = bool(profile.get("email_verified"))
@@ -440,67 +557,76 @@ async def _fetch_github_identity(
     *,
     code: str,
     redirect_uri: str,
-    config: dict[str, str],
+    config: Mapping[str, str],
 ) -> dict[str, Optional[str]]:
     """Exchange GitHub code and return normalized identity profile."""
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        token_res = await client.post(
-            config["token_url"],
-            headers={"Accept": "application/json"},
-            data={
-                "code": code,
-                "client_id": config["client_id"],
-                "client_secret": config["client_secret"],
-                "redirect_uri": redirect_uri,
-            },
+    client = _get_oauth_http_client()
+    token_res = await client.post(
+        config["token_url"],
+        headers={"Accept": "application/json"},
+        data={
+            "code": code,
+            "client_id": config["client_id"],
+            "client_secret": config["client_secret"],
+            "redirect_uri": redirect_uri,
+        },
+    )
+    if token_res.status_code >= 400:
+        raise AuthError("GitHub OAuth token exchange failed", code="oauth_token_exchange_failed")
+
+    token_data = orjson.loads(token_res.content)
+    access_token = token_data.get("access_token")
+    if not access_token:
+        raise AuthError("GitHub OAuth did not return an access token", code="oauth_token_missing")
+
+    base_headers = {
+        "Authorization": f"Bearer {access_token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    # GitHub often omits the profile email, so fetch the email list
+    # alongside the profile rather than after it; it is only read when needed
+    user_res, emails_res = await asyncio.gather(
+        client.get(config["userinfo_url"], headers=base_headers),
+        client.get(config["emails_url"], headers=base_headers),
+        return_exceptions=True,
+    )
+    if isinstance(user_res, BaseException):
+        raise user_res
+    if user_res.status_code >= 400:
+        raise AuthError("Failed to fetch GitHub user profile", code="oauth_profile_fetch_failed")
+
+    user_data = orjson.loads(user_res.content)
+    oauth_id = user_data.get("id")
+    if oauth_id is None:
+        raise AuthError("GitHub profile missing user identifier", code="oauth_profile_invalid")
+
+    email = user_data.get("email")
+    normalized_email: Optional[str] = None
+    if isinstance(email, str) and email.strip():
+        normalized_email = email.lower().strip()
+    else:
+        if isinstance(emails_res, BaseException):
+            raise emails_res
+        if emails_res.status_code >= 400:
+            raise AuthError("Unable to fetch GitHub email addresses", code="oauth_profile_invalid")
+        email_rows = orjson.loads(emails_res.content)
+        if not isinstance(email_rows, list):
+            raise AuthError("Invalid GitHub email response", code="oauth_profile_invalid")
+        normalized_email = _pick_verified_github_email(email_rows)
+
+    if not normalized_email:
+        raise AuthError(
+            "GitHub account must have a verified email address",
+            code="oauth_email_not_verified",
         )
-        if token_res.status_code >= 400:
-            raise AuthError("GitHub OAuth token exchange failed", code="oauth_token_exchange_failed")
 
-        token_data = token_res.json()
-        access_token = token_data.get("access_token")
-        if not access_token:
-            raise AuthError("GitHub OAuth did not return an access token", code="oauth_token_missing")
-
-        base_headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-        }
-        user_res = await client.get(config["userinfo_url"], headers=base_headers)
-        if user_res.status_code >= 400:
-            raise AuthError("Failed to fetch GitHub user profile", code="oauth_profile_fetch_failed")
-
-        user_data = user_res.json()
-        oauth_id = user_data.get("id")
-        if oauth_id is None:
-            raise AuthError("GitHub profile missing user identifier", code="oauth_profile_invalid")
-
-        email = user_data.get("email")
-        normalized_email: Optional[str] = None
-        if isinstance(email, str) and email.strip():
-            normalized_email = email.lower().strip()
-        else:
-            emails_res = await client.get(config["emails_url"], headers=base_headers)
-            if emails_res.status_code >= 400:
-                raise AuthError("Unable to fetch GitHub email addresses", code="oauth_profile_invalid")
-            email_rows = emails_res.json()
-            if not isinstance(email_rows, list):
-                raise AuthError("Invalid GitHub email response", code="oauth_profile_invalid")
-            normalized_email = _pick_verified_github_email(email_rows)
-
-        if not normalized_email:
-            raise AuthError(
-                "GitHub account must have a verified email address",
-                code="oauth_email_not_verified",
-            )
-
-        return {
-            "oauth_id": str(oauth_id),
-            "email": normalized_email,
-            "name": user_data.get("name") or user_data.get("login"),
-            "avatar_url": user_data.get("avatar_url"),
-        }
+    return {
+        "oauth_id": str(oauth_id),
+        "email": normalized_email,
+        "name": user_data.get("name") or user_data.get("login"),
+        "avatar_url": user_data.get("avatar_url"),
+    }
 
 
 async def _fetch_oauth_identity(
@@ -508,7 +634,7 @@ async def _fetch_oauth_identity(
     provider: OAuthProvider,
     code: str,
     redirect_uri: str,
-    config: dict[str, str],
+    config: Mapping[str, str],
 ) -> dict[str, Optional[str]]:
     """Fetch normalized OAuth identity profile for the given provider."""
     if provider == "google":
@@ -533,7 +659,8 @@ async def _fetch_oauth_identity(
 async def signup(
     request: Request,
     body: SignupRequest,
-    session: AsyncSession = Depends(get_async_session),
+    background: BackgroundTasks,
+    auth_service: AuthService = Depends(get_auth_service),
 ):
     """
     Create a new user account with email and password.
@@ -543,8 +670,6 @@ async def signup(
     """
     user_agent, ip_address = get_client_info(request)
     
-    auth_service = AuthService(session)
-    
     try:
         user, token_pair = await auth_service.signup(
             email=body.email,
@@ -554,13 +679,14 @@ async def signup(
             ip_address=ip_address,
         )
         
-        # Trigger async graph provisioning for the new user
-        onboard_user_task.delay(user.id)
-        logger.info("Triggered graph provisioning", user_id=user.id)
+        # Provision the new user's graph; the broker publish is blocking,
+        # so it runs in the threadpool after the response is sent
+        background.add_task(onboard_user_task.delay, user.id)
+        logger.info("Scheduled graph provisioning", user_id=user.id)
         
-        return AuthResponse(
+        return AuthResponse.model_construct(
             user=user_to_response(user),
-            tokens=TokenResponse(**token_pair.to_dict()),
+            tokens=tokens_to_response(token_pair),
         )
         
     except AuthError as e:
@@ -582,7 +708,7 @@ async def signup(
 async def login(
     request: Request,
     body: LoginRequest,
-    session: AsyncSession = Depends(get_async_session),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
     """
     Authenticate with email and password.
@@ -591,8 +717,6 @@ async def login(
     """
     user_agent, ip_address = get_client_info(request)
     
-    auth_service = AuthService(session)
-    
     try:
         user, token_pair = await auth_service.login(
             email=body.email,
@@ -601,9 +725,9 @@ async def login(
             ip_address=ip_address,
         )
         
-        return AuthResponse(
-            user=user_to_response(user),
-            tokens=TokenResponse(**token_pair.to_dict()),
+        # Returned as-is: skips the response_model pass on a hot endpoint
+        return _json_response(
+            {"user": _user_fields(user), "tokens": token_pair.to_dict()}
         )
         
     except AuthError as e:
@@ -636,24 +760,13 @@ async def oauth_start(
     """
     provider_name = _validate_oauth_provider(provider)
     resolved_origin = _resolve_frontend_origin(origin)
-    config = _ensure_oauth_provider_configured(provider_name)
+    _ensure_oauth_provider_configured(provider_name)
     callback_url = _build_oauth_callback_url(request, provider_name)
-    state_token = _build_oauth_state(provider_name, mode, resolved_origin)
-
-    params: dict[str, str] = {
-        "client_id": config["client_id"],
-        "redirect_uri": callback_url,
-        "response_type": "code",
-        "scope": config["scope"],
-        "state": state_token,
-    }
-    if provider_name == "google":
-        params["access_type"] = "online"
-        params["prompt"] = "select_account"
-    else:
-        params["allow_signup"] = "true"
+    state_token = await _build_oauth_state(provider_name, mode, resolved_origin)
 
-    authorization_url = f"{config['authorize_url']}?{urlencode(params)}"
+    authorization_url = _oauth_authorize_prefix(provider_name) + urlencode(
+        {"redirect_uri": callback_url, "state": state_token}
+    )
     return RedirectResponse(url=authorization_url, status_code=status.HTTP_302_FOUND)
 
 
@@ -665,11 +778,12 @@ async def oauth_start(
 async def oauth_callback(
     provider: str,
     request: Request,
+    background: BackgroundTasks,
     code: Optional[str] = None,
     state: Optional[str] = None,
     error: Optional[str] = None,
     error_description: Optional[str] = None,
-    session: AsyncSession = Depends(get_async_session),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
     """
     OAuth callback handler for Google/GitHub popup flow.
@@ -689,7 +803,7 @@ async def oauth_callback(
         )
 
     try:
-        state_payload = _decode_oauth_state(state, provider_name)
+        state_payload = await _decode_oauth_state(state, provider_name)
         origin = _normalize_origin(state_payload["origin"])
         mode = state_payload["mode"]
         fallback_path = _oauth_fallback_path(mode)
@@ -772,8 +886,6 @@ async def oauth_callback(
         )
 
     user_agent, ip_address = get_client_info(request)
-    auth_service = AuthService(session)
-
     try:
         user, token_pair, is_new_user = await auth_service.login_with_oauth(
             provider=provider_name,
@@ -797,12 +909,12 @@ async def oauth_callback(
         )
 
     if is_new_user:
-        onboard_user_task.delay(user.id)
-        logger.info("Triggered graph provisioning for OAuth user", user_id=user.id)
+        background.add_task(onboard_user_task.delay, user.id)
+        logger.info("Scheduled graph provisioning for OAuth user", user_id=user.id)
 
     auth_payload = {
-        "user": user_to_response(user).model_dump(),
-        "tokens": TokenResponse(**token_pair.to_dict()).model_dump(),
+        "user": _user_fields(user),
+        "tokens": token_pair.to_dict(),
     }
 
     return _oauth_popup_response(
@@ -823,7 +935,7 @@ async def oauth_callback(
 async def refresh_token(
     request: Request,
     body: RefreshRequest,
-    session: AsyncSession = Depends(get_async_session),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
     """
     Get a new access token using a refresh token.
@@ -832,8 +944,6 @@ async def refresh_token(
     """
     user_agent, ip_address = get_client_info(request)
     
-    auth_service = AuthService(session)
-    
     try:
         token_pair = await auth_service.refresh_token(
             refresh_token=body.refresh_token,
@@ -841,7 +951,7 @@ async def refresh_token(
             ip_address=ip_address,
         )
         
-        return TokenResponse(**token_pair.to_dict())
+        return _json_response(token_pair.to_dict())
         
     except AuthError as e:
         logger.warning("Token refresh failed", error=e.code)
@@ -858,7 +968,7 @@ async def refresh_token(
 )
 async def logout(
     body: RefreshRequest,
-    session: AsyncSession = Depends(get_async_session),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
     """
     Logout by invalidating the refresh token.
@@ -866,8 +976,6 @@ async def logout(
     The access token will remain valid until it expires,
     but the refresh token can no longer be used.
     """
-    auth_service = AuthService(session)
-    
     deleted = await auth_service.logout(body.refresh_token)
     
     if deleted:
@@ -883,7 +991,7 @@ async def logout(
 )
 async def forgot_password(
     body: ForgotPasswordRequest,
-    session: AsyncSession = Depends(get_async_session),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
     """
     Request a password reset email.
@@ -891,8 +999,6 @@ async def forgot_password(
     If the email exists, a reset link will be sent.
     For security, the response is the same whether the email exists or not.
     """
-    auth_service = AuthService(session)
-    
     # Note: In production, this should send an email
     # For now, we just return success regardless
     await auth_service.initiate_password_reset(body.email)
@@ -912,15 +1018,13 @@ async def forgot_password(
 )
 async def reset_password(
     body: ResetPasswordRequest,
-    session: AsyncSession = Depends(get_async_session),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
     """
     Reset password using a reset token.
     
     After successful reset, all existing sessions are invalidated.
     """
-    auth_service = AuthService(session)
-    
     try:
         await auth_service.reset_password(
             reset_token=body.token,
@@ -954,7 +1058,6 @@ async def reset_password(
 )
 async def get_current_user_info(
     request: Request,
-    session: AsyncSession = Depends(get_async_session),
 ):
     """
     Get the currently authenticated user's information.
@@ -962,7 +1065,7 @@ async def get_current_user_info(
     Requires a valid access token in the Authorization header.
     """
     # This will be populated by the auth middleware
-    user = getattr(request.state, "user", None)
+    user = request.state.user
     
     if not user:
         raise HTTPException(
@@ -971,4 +1074,4 @@ async def get_current_user_info(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return user_to_response(user)
+    return _json_response(_user_fields(user))
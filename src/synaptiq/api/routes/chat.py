@@ -12,6 +12,7 @@ All endpoints require JWT authentication.
 
 from typing import Optional
 
+import orjson
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
@@ -508,10 +509,13 @@ async def send_message_stream(
                 conversation_id=conversation_id,
                 content=body.content,
             ):
+                # Structured payloads go out as JSON (the client JSON.parses
+                # them); orjson serializes straight to bytes
+                data = event["data"]
                 yield {
                     "event": event["event"],
-                    "data": event["data"] if isinstance(event["data"], str)
-                           else str(event["data"]),
+                    "data": data if isinstance(data, str)
+                            else orjson.dumps(data).decode(),
                 }
         except ValueError as e:
             yield {
@@ -8,6 +8,7 @@ Provides endpoints for:
 - Concept CRUD operations
 """
 
+import asyncio
 import math
 from typing import Any, Optional
 
@@ -464,9 +465,10 @@ async def get_concept(
     Requires JWT authentication.
     """
     try:
-        # Get concept with definition
-        details = await graph_manager.fuseki.get_concept_with_definition(
-            user.id, concept_id
+        # Definition and relationships are independent lookups
+        details, relationships_raw = await asyncio.gather(
+            graph_manager.fuseki.get_concept_with_definition(user.id, concept_id),
+            graph_manager.fuseki.get_concept_relationships(user.id, concept_id),
         )
         
         if not details:
@@ -475,11 +477,6 @@ async def get_concept(
                 detail=f"Concept not found: {concept_id}",
             )
         
-        # Get relationships
-        relationships_raw = await graph_manager.fuseki.get_concept_relationships(
-            user.id, concept_id
-        )
-        
         # Group by relationship type
         relationships: dict[str, list[dict]] = {}
         for rel in relationships_raw:
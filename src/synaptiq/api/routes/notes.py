@@ -17,10 +17,13 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.settings import get_settings
+from synaptiq.agents.response_cache import invalidate_response_cache
+from synaptiq.api.dependencies import get_qdrant
 from synaptiq.api.middleware.auth import get_current_user
 from synaptiq.domain.models import User
 from synaptiq.infrastructure.database import get_async_session
 from synaptiq.services.notes_service import NotesService
+from synaptiq.storage.qdrant import QdrantStore
 from synaptiq.storage.s3 import S3Store
 
 logger = structlog.get_logger(__name__)
@@ -627,6 +630,7 @@ async def delete_note(
     note_id: str,
     user: User = Depends(get_current_user),
     notes_service: NotesService = Depends(get_notes_service),
+    qdrant: QdrantStore = Depends(get_qdrant),
 ) -> None:
     """Delete a note permanently."""
     deleted = await notes_service.delete_note(note_id, user.id)
@@ -636,6 +640,9 @@ async def delete_note(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Note not found: {note_id}",
         )
+    
+    # Cached answers may quote or cite the deleted note
+    await invalidate_response_cache(qdrant, user.id)
 
 
 # =============================================================================
@@ -781,6 +788,7 @@ async def delete_note_artifacts(
     note_id: str,
     user: User = Depends(get_current_user),
     knowledge_service = Depends(get_knowledge_service),
+    qdrant: QdrantStore = Depends(get_qdrant),
 ) -> None:
     """
     Delete all extracted artifacts for a note.
@@ -789,6 +797,7 @@ async def delete_note_artifacts(
     """
     try:
         await knowledge_service.delete_note_artifacts(note_id, user.id)
+        await invalidate_response_cache(qdrant, user.id)
     except Exception as e:
         logger.error("Failed to delete artifacts", note_id=note_id, error=str(e))
         raise HTTPException(
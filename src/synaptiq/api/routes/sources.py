@@ -9,6 +9,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
+from synaptiq.agents.response_cache import invalidate_response_cache
 from synaptiq.api.dependencies import get_mongodb, get_qdrant
 from synaptiq.api.middleware.auth import get_current_user
 from synaptiq.domain.models import User
@@ -176,6 +177,9 @@ async def delete_source(
     # Delete from MongoDB (source document)
     await mongodb.delete_source(source_id, user.id)
 
+    # Cached answers may quote or cite the deleted source
+    await invalidate_response_cache(qdrant, user.id)
+
 
 @router.get(
     "/stats",
@@ -398,6 +398,10 @@ def delete(source_id: str, user_id: str, confirm: bool):
             # Delete from MongoDB
             await mongo.delete_source(source_id, user_id)
 
+            # Drop cached answers that may cite the source
+            from synaptiq.agents.response_cache import invalidate_response_cache
+            await invalidate_response_cache(qdrant, user_id)
+
             console.print(f"[green]✓ Deleted source and {chunks_deleted} chunks.[/green]")
 
         except Exception as e:
@@ -0,0 +1,126 @@
+"""
+Small in-process caches for hot read paths.
+
+Caches here are per-process and bounded; they never replace the stores
+they sit in front of. Keys for user-scoped data are tuples whose first
+element is the user ID, so a write to a user's graph can drop every
+cached entry for that user with `invalidate_user_caches`.
+
+Caches shared across processes (query embeddings, SPARQL results) live in
+Redis and use `redis_cache_client`.
+"""
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# Sentinel distinguishing "not cached" from a cached None
+MISSING: Any = object()
+
+_registry: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+# Redis cache clients, one per event loop (Celery runs each task in a fresh
+# loop and a client must not cross loops)
+_redis_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class TTLCache:
+    """
+    LRU cache whose entries also expire after a fixed time-to-live.
+
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before LRU eviction
+            ttl: Seconds an entry stays valid after it is set
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        _registry.add(self)
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Return the cached value for `key`, or `default` if absent/expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key`, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove `key` if present."""
+        self._data.pop(key, None)
+
+    def clear_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every entry whose key matches `predicate`; return the count."""
+        stale = [key for key in self._data if predicate(key)]
+        for key in stale:
+            del self._data[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def invalidate_user_caches(user_id: str) -> int:
+    """
+    Drop cached entries for a user from every live TTLCache.
+
+    Only tuple keys starting with `user_id` are affected.
+
+    Returns:
+        Number of entries removed
+    """
+    def _is_user_key(key: Hashable) -> bool:
+        return isinstance(key, tuple) and bool(key) and key[0] == user_id
+
+    return sum(cache.clear_where(_is_user_key) for cache in list(_registry))
+
+
+def redis_cache_client() -> Any:
+    """
+    Get the Redis client used for caching on the running loop.
+
+    Created on first use with short timeouts: a slow cache must not cost
+    more than a miss, so callers treat any error as a miss.
+    """
+    loop = asyncio.get_running_loop()
+    client = _redis_clients.get(loop)
+    if client is None:
+        import redis.asyncio as redis_async
+
+        from config.settings import get_settings
+
+        client = _redis_clients[loop] = redis_async.from_url(
+            get_settings().redis_url,
+            socket_connect_timeout=0.25,
+            socket_timeout=0.25,
+        )
+    return client
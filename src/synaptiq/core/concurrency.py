@@ -0,0 +1,37 @@
+"""
+Process-wide concurrency limits for backend clients.
+
+Stores are created per request, so a semaphore on the instance would not
+bound total load on a backend. These limits are shared by name instead,
+with one semaphore per event loop (Celery tasks run each job in a fresh
+loop, and an asyncio.Semaphore must not cross loops).
+"""
+
+import asyncio
+import weakref
+
+_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def inflight_limit(name: str, limit: int) -> asyncio.Semaphore:
+    """
+    Get the shared semaphore capping in-flight requests to a backend.
+
+    Must be called from within a running event loop. The first caller for
+    a given name and loop fixes the limit.
+
+    Args:
+        name: Backend name, e.g. "fuseki"
+        limit: Maximum concurrent requests
+
+    Returns:
+        Semaphore shared by every caller using `name` on this loop
+    """
+    loop = asyncio.get_running_loop()
+    semaphores = _limits.setdefault(loop, {})
+    semaphore = semaphores.get(name)
+    if semaphore is None:
+        semaphore = semaphores[name] = asyncio.Semaphore(max(1, limit))
+    return semaphore
@@ -0,0 +1,56 @@
+"""
+Process-wide structlog configuration.
+
+Loggers are filtering bound loggers: a call below the configured level is
+a no-op method, so it returns before any processor runs or event dict is
+built. Output format is structlog's default, except that long string
+values are truncated before rendering, so callers can pass queries and
+texts as-is instead of slicing them on every call.
+"""
+
+import logging
+from typing import Optional
+
+import structlog
+
+# Longest string value rendered in a log line
+MAX_VALUE_CHARS = 200
+
+
+def _truncate_long_values(logger, method_name, event_dict):
+    """Processor cutting long string values to MAX_VALUE_CHARS."""
+    for key, value in event_dict.items():
+        if isinstance(value, str) and len(value) > MAX_VALUE_CHARS:
+            event_dict[key] = value[:MAX_VALUE_CHARS] + "..."
+    return event_dict
+
+
+def configure_logging(level: Optional[str] = None) -> None:
+    """
+    Apply the log level to every structlog logger in this process.
+
+    Call once at startup (API app creation, Celery worker import) before
+    any logger is used.
+
+    Args:
+        level: Level name such as "INFO" (default: LOG_LEVEL from settings)
+    """
+    if level is None:
+        from config.settings import get_settings
+
+        level = get_settings().log_level
+
+    numeric_level = logging.getLevelName(level.upper())
+    if not isinstance(numeric_level, int):
+        numeric_level = logging.INFO
+
+    # Truncate just before the renderer (the last default processor)
+    processors = list(structlog.get_config()["processors"])
+    if _truncate_long_values not in processors:
+        processors.insert(len(processors) - 1, _truncate_long_values)
+
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
+        cache_logger_on_first_use=True,
+    )
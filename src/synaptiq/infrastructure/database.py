@@ -39,6 +39,7 @@ logger = structlog.get_logger(__name__)
 # Global engine and session factory (lazy initialized)
 _engine = None
 _async_session_factory = None
+_readonly_session_factory = None
 
 
 def get_engine():
@@ -52,12 +53,18 @@ def get_engine():
     
     if _engine is None:
         settings = get_settings()
+        # Fail fast when the pool is exhausted instead of queueing for the
+        # 30s default; LIFO reuse keeps a small set of connections warm,
+        # and pre-ping/recycle drop connections the server has closed
         _engine = create_async_engine(
             settings.postgres_url,
             echo=settings.log_level == "DEBUG",
             pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
+            pool_size=settings.api_db_pool_size,
+            max_overflow=settings.api_db_max_overflow,
+            pool_timeout=settings.api_db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            pool_use_lifo=True,
         )
         logger.info(
             "Database engine created",
@@ -101,6 +108,33 @@ def get_session_factory():
     return _async_session_factory
 
 
+def get_readonly_session_factory():
+    """
+    Get or create the session factory for read-only lookups.
+    
+    Sessions share the main engine's pool, but run in READ ONLY
+    transactions (asyncpg issues this as part of its single BEGIN) and
+    never autoflush. Used on per-request hot paths such as access token
+    verification, which only read and never commit.
+    
+    Returns:
+        Session factory for creating read-only async sessions
+    """
+    global _readonly_session_factory
+    
+    if _readonly_session_factory is None:
+        engine = get_engine().execution_options(postgresql_readonly=True)
+        factory_class = async_sessionmaker if HAS_ASYNC_SESSIONMAKER else sessionmaker
+        _readonly_session_factory = factory_class(
+            engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+    
+    return _readonly_session_factory
+
+
 # Alias for backwards compatibility and convenience
 AsyncSessionLocal = property(lambda self: get_session_factory())
 
@@ -154,11 +188,12 @@ async def close_db() -> None:
     
     Call this during application shutdown.
     """
-    global _engine, _async_session_factory
+    global _engine, _async_session_factory, _readonly_session_factory
     
     if _engine is not None:
         await _engine.dispose()
         _engine = None
         _async_session_factory = None
+        _readonly_session_factory = None
         logger.info("Database connection closed")
 
@@ -7,6 +7,7 @@ utilities for the knowledge graph.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Optional
@@ -487,18 +488,22 @@ class GraphManager:
             return await self._get_root_concepts(user_id, filters=filters)
         
         # First find the concept
-        find_concept_sparql = f"""
+        find_concept_sparql = """
         SELECT ?concept ?label ?altLabel
-        WHERE {{
+        WHERE {
             ?concept a syn:Concept ;
                      syn:label ?label .
-            OPTIONAL {{ ?concept syn:altLabel ?altLabel }}
-            FILTER(LCASE(?label) = "{concept_label.lower()}")
-        }}
+            OPTIONAL { ?concept syn:altLabel ?altLabel }
+            FILTER(LCASE(?label) = ?wantedLabel)
+        }
         LIMIT 1
         """
         
-        results = await self.fuseki.query(user_id, find_concept_sparql)
+        results = await self.fuseki.query(
+            user_id,
+            find_concept_sparql,
+            initial_bindings={"wantedLabel": concept_label.lower()},
+        )
         if not results:
             logger.info("Concept not found", concept_label=concept_label, user_id=user_id)
             return {"found": False, "label": concept_label, "uri": "", "relationships": {}}
@@ -506,11 +511,11 @@ class GraphManager:
         concept_uri = results[0].get("concept")
         logger.info("Found concept", concept_label=concept_label, concept_uri=concept_uri)
         
-        # Get concept details
-        details = await self.fuseki.get_concept_with_definition(user_id, concept_uri)
-        
-        # Get relationships
-        relationships = await self.fuseki.get_concept_relationships(user_id, concept_uri)
+        # Concept details and relationships are independent lookups
+        details, relationships = await asyncio.gather(
+            self.fuseki.get_concept_with_definition(user_id, concept_uri),
+            self.fuseki.get_concept_relationships(user_id, concept_uri),
+        )
         logger.info(
             "Fetched relationships",
             concept_label=concept_label,
@@ -636,31 +641,35 @@ class GraphManager:
         Returns:
             List of concepts with their definitions
         """
-        sparql = f"""
+        sparql = """
         SELECT DISTINCT ?conceptLabel ?definitionText ?sourceTitle
-        WHERE {{
+        WHERE {
             ?source syn:sourceTitle ?sourceTitle .
-            FILTER(CONTAINS(LCASE(?sourceTitle), "{source_title_contains.lower()}"))
+            FILTER(CONTAINS(LCASE(?sourceTitle), ?titleSubstr))
             
             ?chunk syn:derivedFrom ?source .
             
-            {{
+            {
                 ?concept syn:definedIn ?chunk .
-            }} UNION {{
+            } UNION {
                 ?concept syn:mentionedIn ?chunk .
-            }}
+            }
             
             ?concept syn:label ?conceptLabel .
             
-            OPTIONAL {{
+            OPTIONAL {
                 ?concept syn:hasDefinition ?def .
                 ?def syn:definitionText ?definitionText .
-            }}
-        }}
+            }
+        }
         ORDER BY ?conceptLabel
         """
         
-        return await self.fuseki.query(user_id, sparql)
+        return await self.fuseki.query(
+            user_id,
+            sparql,
+            initial_bindings={"titleSubstr": source_title_contains.lower()},
+        )
 
     async def get_undefined_concepts(
         self,
@@ -761,7 +770,7 @@ class GraphManager:
         sparql = f"""
         SELECT ?relatedConcept ?relatedLabel ?relationType
         WHERE {{
-            ?concept syn:label "{concept_label.lower()}" .
+            ?concept syn:label ?conceptLabel .
             
             {{
                 ?concept ?relType ?relatedConcept .
@@ -781,7 +790,11 @@ class GraphManager:
         ORDER BY ?relationType ?relatedLabel
         """
         
-        return await self.fuseki.query(user_id, sparql)
+        return await self.fuseki.query(
+            user_id,
+            sparql,
+            initial_bindings={"conceptLabel": concept_label.lower()},
+        )
 
     async def close(self) -> None:
         """Close the Fuseki connection."""
@@ -15,6 +15,7 @@ in the knowledge graph, following the naming conventions:
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from uuid import uuid4
 
@@ -92,10 +93,14 @@ def get_prefixes() -> dict[str, str]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_sparql_prefixes() -> str:
     """
     Get SPARQL PREFIX declarations for all namespaces.
     
+    The declarations only depend on settings, so they are built once and
+    reused by every query.
+    
     Returns:
         String with all PREFIX declarations
     """
@@ -381,29 +386,31 @@ COMMON_SYNONYMS: dict[str, list[str]] = {
 }
 
 
-def expand_synonyms(term: str) -> list[str]:
+@lru_cache(maxsize=4096)
+def expand_synonyms(term: str) -> tuple[str, ...]:
     """
     Expand a query term into itself plus known synonyms.
     
     Used at query time so that a user asking about "CNNs" also
-    searches for "convolutional neural network", etc.
+    searches for "convolutional neural network", etc. Results are
+    memoized, so they are returned as an immutable tuple.
     
     Args:
         term: The search term to expand
         
     Returns:
-        List of terms to search for (always includes the original)
+        Unique lowercase terms to search for, the original first
     """
     normalized = term.lower().strip()
     # Strip trailing 's' for simple pluralization
     singular = normalized.rstrip("s") if len(normalized) > 3 and normalized.endswith("s") else normalized
     
-    candidates = {normalized}
+    # dict preserves insertion order while de-duplicating
+    candidates = {normalized: None}
     
-    for variant in [normalized, singular]:
-        if variant in COMMON_SYNONYMS:
-            for syn in COMMON_SYNONYMS[variant]:
-                candidates.add(syn.lower())
+    for variant in (normalized, singular):
+        for syn in COMMON_SYNONYMS.get(variant, ()):
+            candidates[syn.lower()] = None
     
-    return list(candidates)
+    return tuple(candidates)
 
@@ -3,6 +3,8 @@ Embedding generator using OpenAI's embedding models.
 """
 
 import asyncio
+import hashlib
+from array import array
 from typing import Optional
 
 import structlog
@@ -15,6 +17,8 @@ from tenacity import (
 )
 
 from config.settings import get_settings
+from synaptiq.core.cache import redis_cache_client
+from synaptiq.core.concurrency import inflight_limit
 from synaptiq.core.exceptions import ProcessingError, RateLimitError
 from synaptiq.core.schemas import Chunk, ProcessedChunk
 from synaptiq.processors.base import ChunksToProcessedProcessor
@@ -30,6 +34,7 @@ class EmbeddingGenerator(ChunksToProcessedProcessor):
     - Batch processing for efficiency
     - Automatic retry with exponential backoff
     - Rate limit handling
+    - Redis cache for single (query) embeddings
     """
 
     def __init__(
@@ -50,6 +55,8 @@ class EmbeddingGenerator(ChunksToProcessedProcessor):
         self.model = model or settings.embedding_model
         self.dimensions = dimensions or settings.embedding_dimensions
         self.batch_size = batch_size
+        self.cache_ttl = settings.embedding_cache_ttl_seconds
+        self.max_inflight = settings.embedding_max_inflight
 
         self.client = AsyncOpenAI(api_key=settings.openai_api_key)
 
@@ -60,6 +67,20 @@ class EmbeddingGenerator(ChunksToProcessedProcessor):
             batch_size=batch_size,
         )
 
+    async def warmup(self) -> None:
+        """
+        Open the API connection ahead of the first query.
+        
+        The model is remote, so the first-call cost is connection and TLS
+        setup; a model metadata lookup pays it without spending tokens.
+        Failures are only logged.
+        """
+        try:
+            await self.client.models.retrieve(self.model)
+            logger.info("Embedding client warmed", model=self.model)
+        except Exception as e:
+            logger.warning("Embedding client warmup failed", error=str(e))
+
     async def process(self, chunks: list[Chunk]) -> list[ProcessedChunk]:
         """
         Generate embeddings for all chunks.
@@ -90,7 +111,7 @@ class EmbeddingGenerator(ChunksToProcessedProcessor):
             )
 
             try:
-                embeddings = await self._generate_embeddings_batch(batch_texts)
+                embeddings = await self.generate_embeddings_batch(batch_texts)
 
                 for chunk, embedding in zip(batch_chunks, embeddings):
                     processed_chunks.append(
@@ -135,7 +156,7 @@ class EmbeddingGenerator(ChunksToProcessedProcessor):
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=60),
     )
-    async def _generate_embeddings_batch(
+    async def generate_embeddings_batch(
         self, texts: list[str]
     ) -> list[list[float]]:
         """
@@ -148,11 +169,12 @@ class EmbeddingGenerator(ChunksToProcessedProcessor):
             List of embedding vectors
         """
         try:
-            response = await self.client.embeddings.create(
-                model=self.model,
-                input=texts,
-                dimensions=self.dimensions,
-            )
+            async with inflight_limit("openai_embeddings", self.max_inflight):
+                response = await self.client.embeddings.create(
+                    model=self.model,
+                    input=texts,
+                    dimensions=self.dimensions,
+                )
 
             # Sort by index to maintain order
             embeddings_by_index = {
@@ -185,7 +207,158 @@ class EmbeddingGenerator(ChunksToProcessedProcessor):
         Returns:
             Embedding vector
         """
-        embeddings = await self._generate_embeddings_batch([text])
-        return embeddings[0]
+        key = self.cache_key(text) if self.cache_ttl > 0 else None
+        if key is not None:
+            cached = await self.cache_get(key)
+            if cached is not None:
+                return cached
+
+        embeddings = await self.generate_embeddings_batch([text])
+        embedding = embeddings[0]
+
+        if key is not None:
+            await self.cache_put(key, embedding)
+        return embedding
+
+    def cache_key(self, text: str) -> str:
+        """Key a text's embedding by model, dimensions and content hash."""
+        normalized = " ".join(text.split())
+        digest = hashlib.sha256(normalized.encode()).hexdigest()
+        return f"emb:{self.model}:{self.dimensions}:{digest}"
+
+    async def cache_get(self, key: str) -> Optional[list[float]]:
+        """Return a cached embedding, or None on a miss or cache failure."""
+        try:
+            raw = await redis_cache_client().get(key)
+        except Exception as e:
+            logger.warning("Embedding cache lookup failed", error=str(e))
+            return None
+        if not raw:
+            return None
+        vector = array("f")
+        vector.frombytes(raw)
+        return vector.tolist()
+
+    async def cache_put(self, key: str, embedding: list[float]) -> None:
+        """Store an embedding as packed float32; failures are only logged."""
+        try:
+            await redis_cache_client().set(
+                key, array("f", embedding).tobytes(), ex=self.cache_ttl
+            )
+        except Exception as e:
+            logger.warning("Embedding cache write failed", error=str(e))
+
+
+class BatchingEmbedder:
+    """
+    Coalesce concurrent single-text embeddings into batched API calls.
+    
+    `generate_single` calls made within a short window (a few
+    milliseconds), e.g. parallel tool calls from one agent or concurrent
+    requests, are sent together as one `embeddings.create` request
+    instead of one request each. Cached embeddings never join a batch,
+    and a text arriving while nothing is pending or in flight is sent at
+    once, so an idle batcher adds no latency.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbeddingGenerator,
+        window_ms: float = 10.0,
+        max_batch_size: int = 64,
+    ):
+        """
+        Initialize the batcher.
+        
+        Args:
+            embedder: Generator used for the cache and batched API calls
+            window_ms: How long to wait for more texts before flushing
+                while another batch is in flight
+            max_batch_size: Flush immediately once this many are pending
+        """
+        self.embedder = embedder
+        self.window = window_ms / 1000.0
+        self.max_batch_size = min(max_batch_size, embedder.batch_size)
+        self._pending: list[tuple[str, Optional[str], asyncio.Future]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def generate_single(self, text: str) -> list[float]:
+        """
+        Generate embedding for a single text, batched with concurrent calls.
+        
+        Drop-in replacement for `EmbeddingGenerator.generate_single`.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Embedding vector
+        """
+        embedder = self.embedder
+        key = embedder.cache_key(text) if embedder.cache_ttl > 0 else None
+        if key is not None:
+            cached = await embedder.cache_get(key)
+            if cached is not None:
+                return cached
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((text, key, future))
+
+        if len(self._pending) >= self.max_batch_size or (
+            # Nothing to coalesce with: don't wait out the window
+            self._timer is None and not self._inflight
+        ):
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Let more texts join the batch, then flush it."""
+        await asyncio.sleep(self.window)
+        self._timer = None
+        self._flush()
+
+    def _flush(self) -> None:
+        """Send every pending text in one embeddings request."""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._execute(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _execute(
+        self,
+        batch: list[tuple[str, Optional[str], asyncio.Future]],
+    ) -> None:
+        """Embed a batch and resolve each caller's future with its vector."""
+        # Identical texts in one window are embedded once
+        texts = list(dict.fromkeys(text for text, _, _ in batch))
+        try:
+            embeddings = await self.embedder.generate_embeddings_batch(texts)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_text = dict(zip(texts, embeddings))
+        logger.debug(
+            "Embedding batch flushed",
+            requested=len(batch),
+            embedded=len(texts),
+        )
 
+        cache_writes = {}
+        for text, key, future in batch:
+            embedding = by_text[text]
+            if key is not None:
+                cache_writes[key] = embedding
+            if not future.done():
+                future.set_result(embedding)
 
+        for key, embedding in cache_writes.items():
+            await self.embedder.cache_put(key, embedding)
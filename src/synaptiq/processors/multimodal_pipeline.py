@@ -435,7 +435,7 @@ class MultimodalPipeline:
             return artifacts
         
         # Generate embeddings in batch
-        embeddings = await self.embedder._generate_embeddings_batch(texts_to_embed)
+        embeddings = await self.embedder.generate_embeddings_batch(texts_to_embed)
         
         # Assign embeddings back to artifacts
         embed_idx = 0
@@ -9,21 +9,73 @@ Handles:
 - Session management
 """
 
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 from uuid import uuid4
 
 import bcrypt
 import structlog
 from jose import JWTError, jwt
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from config.settings import get_settings
+from synaptiq.core.cache import MISSING, TTLCache
 from synaptiq.domain.models import Session, User, UserSettings
 
 logger = structlog.get_logger(__name__)
 
+# Longest a verified access token or its user is served from memory
+TOKEN_CACHE_TTL_SECONDS = 60
+
+# Verified access tokens: blake2b(token) -> user_id. Entries never outlive
+# the token's own exp claim, so a cache hit is as good as re-verifying.
+_verified_tokens = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+# Active users by (user_id, "auth_user"); dropped once a change to the user
+# (update, logout everywhere, deletion) commits. The cache is per process:
+# other workers keep serving their copy for up to TOKEN_CACHE_TTL_SECONDS.
+_active_users = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+
+# Shortest plausible JWT (header.payload.signature); anything shorter or
+# without exactly three segments is rejected before decoding
+_MIN_JWT_LENGTH = 20
+
+
+def _looks_like_jwt(token: str) -> bool:
+    """Cheap structural check so scanner junk skips hashing and decoding."""
+    return len(token) >= _MIN_JWT_LENGTH and token.count(".") == 2
+
+
+def _token_key(token: str) -> bytes:
+    """Cache key for a token, so raw tokens are never held in memory."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """Make the next request for this user re-read it from the database."""
+    _active_users.pop((user_id, "auth_user"))
+
+
+def invalidate_cached_user_on_commit(session: AsyncSession, user_id: str) -> None:
+    """
+    Drop this process's cached user once `session` commits.
+    
+    Dropping it earlier would let a concurrent request re-cache the old row
+    before the change is committed. Other worker processes still serve
+    their cached copy for up to TOKEN_CACHE_TTL_SECONDS.
+    """
+    event.listen(
+        session.sync_session,
+        "after_commit",
+        lambda _session: invalidate_cached_user(user_id),
+        once=True,
+    )
+
 
 class TokenPair:
     """Access and refresh token pair."""
@@ -172,7 +224,8 @@ class AuthService:
         
         return token, expire
     
-    def decode_token(self, token: str) -> Optional[dict]:
+    @staticmethod
+    def decode_token(token: str) -> Optional[dict]:
         """
         Decode and validate a JWT token.
         
@@ -183,10 +236,11 @@ class AuthService:
             Decoded payload or None if invalid
         """
         try:
+            settings = get_settings()
             payload = jwt.decode(
                 token,
-                self.settings.jwt_secret_key,
-                algorithms=[self.settings.jwt_algorithm],
+                settings.jwt_secret_key,
+                algorithms=[settings.jwt_algorithm],
             )
             return payload
         except JWTError as e:
@@ -525,6 +579,7 @@ class AuthService:
             user.avatar_url = avatar_url.strip()
         if not user.is_verified:
             user.is_verified = True
+        invalidate_cached_user_on_commit(self.session, user.id)
 
         token_pair = await self._create_token_pair(user, user_agent, ip_address)
 
@@ -659,37 +714,104 @@ class AuthService:
         count = len(sessions)
         for session in sessions:
             await self.session.delete(session)
+        invalidate_cached_user_on_commit(self.session, user_id)
         
         logger.info("User logged out from all devices", user_id=user_id, sessions=count)
         
         return count
     
+    @staticmethod
+    def _verified_user_id(token: str) -> Optional[str]:
+        """Return the user ID an access token names, verifying it on a cache miss."""
+        if not _looks_like_jwt(token):
+            return None
+        
+        key = _token_key(token)
+        user_id = _verified_tokens.get(key)
+        if user_id is not MISSING:
+            return user_id
+        
+        payload = AuthService.decode_token(token)
+        if not payload:
+            return None
+        
+        if payload.get("type") != "access":
+            return None
+        
+        user_id = payload.get("sub")
+        if not user_id:
+            return None
+        
+        ttl = min(TOKEN_CACHE_TTL_SECONDS, payload.get("exp", 0) - time.time())
+        if ttl > 0:
+            _verified_tokens.set(key, user_id, ttl=ttl)
+        return user_id
+    
+    @staticmethod
+    async def _load_active_user(session: AsyncSession, user_id: str) -> Optional[User]:
+        """Read an active user and cache it for later requests."""
+        # One row, no relationships: the user outlives this session in the
+        # cache, so a lazy load would otherwise be a hidden per-request query
+        result = await session.execute(
+            select(User).options(raiseload("*")).where(User.id == user_id)
+        )
+        user = result.scalar_one_or_none()
+        if not user or not user.is_active:
+            return None
+        
+        _active_users.set((user_id, "auth_user"), user)
+        return user
+    
     async def verify_access_token(self, token: str) -> Optional[User]:
         """
         Verify an access token and return the associated user.
         
+        Verified tokens and active users are cached for up to
+        TOKEN_CACHE_TTL_SECONDS (never past the token's expiry).
+        
         Args:
             token: JWT access token
             
         Returns:
             User if token is valid, None otherwise
         """
-        payload = self.decode_token(token)
-        if not payload:
+        user_id = self._verified_user_id(token)
+        if not user_id:
             return None
         
-        if payload.get("type") != "access":
-            return None
+        user = _active_users.get((user_id, "auth_user"))
+        if user is not MISSING:
+            return user
+        return await self._load_active_user(self.session, user_id)
+    
+    @staticmethod
+    async def authenticate(
+        token: str,
+        session_factory: Callable[[], AsyncSession],
+    ) -> Optional[User]:
+        """
+        Verify an access token without a service instance or open session.
         
-        user_id = payload.get("sub")
+        Used on every authenticated request. A session is opened from
+        `session_factory` only when the user row must be read.
+        
+        Args:
+            token: JWT access token
+            session_factory: Factory returning a new AsyncSession
+            
+        Returns:
+            User if token is valid, None otherwise
+        """
+        user_id = AuthService._verified_user_id(token)
         if not user_id:
             return None
         
-        user = await self.get_user_by_id(user_id)
-        if not user or not user.is_active:
-            return None
+        user = _active_users.get((user_id, "auth_user"))
+        if user is not MISSING:
+            return user
         
-        return user
+        async with session_factory() as session:
+            return await AuthService._load_active_user(session, user_id)
     
     # =========================================================================
     # Password Reset
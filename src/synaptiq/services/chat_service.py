@@ -399,15 +399,17 @@ class ChatService:
                 session_id=conversation_id,
             )
             
+            # Serialize nested models in one pass
+            dumped = response.model_dump(include={"citations", "retrieval_metadata"})
+            
             # Save assistant message
             assistant_message = await self._save_message(
                 conversation_id=conversation_id,
                 role="assistant",
                 content=response.answer,
-                citations=[c.model_dump() for c in response.citations],
+                citations=dumped["citations"],
                 concepts_referenced=response.concepts_referenced,
-                retrieval_metadata=response.retrieval_metadata.model_dump()
-                    if response.retrieval_metadata else None,
+                retrieval_metadata=dumped["retrieval_metadata"],
                 confidence=response.confidence,
                 source_type=response.source_type,
             )
@@ -607,16 +609,16 @@ class ChatService:
             query=user_message.content,
             session_id=conversation_id,
         )
+        dumped = response.model_dump(include={"citations", "retrieval_metadata"})
         
         # Save new assistant message
         new_message = await self._save_message(
             conversation_id=conversation_id,
             role="assistant",
             content=response.answer,
-            citations=[c.model_dump() for c in response.citations],
+            citations=dumped["citations"],
             concepts_referenced=response.concepts_referenced,
-            retrieval_metadata=response.retrieval_metadata.model_dump()
-                if response.retrieval_metadata else None,
+            retrieval_metadata=dumped["retrieval_metadata"],
             confidence=response.confidence,
             source_type=response.source_type,
         )
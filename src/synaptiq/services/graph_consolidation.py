@@ -21,6 +21,7 @@ from synaptiq.ontology.namespaces import (
     get_sparql_prefixes,
     slugify,
 )
+from synaptiq.storage.fuseki import values_block
 
 logger = structlog.get_logger(__name__)
 
@@ -71,7 +72,11 @@ class GraphConsolidationService:
         
         # Step 4: Recompute importance scores
         await self._recompute_importance(user_id)
-        
+
+        # The steps above write through _execute_update directly, so drop
+        # cached label/scope lookups for this user once they are done
+        await self.fuseki.invalidate_user_cache(user_id)
+
         logger.info(
             "Graph consolidation complete",
             user_id=user_id,
@@ -217,11 +222,14 @@ class GraphConsolidationService:
         # Add the old label as an altLabel on the target
         add_alt = f"""
         {get_sparql_prefixes()}
-        INSERT DATA {{
+        INSERT {{
             GRAPH <{graph_uri}> {{
-                <{target_uri}> syn:altLabel "{source_label}" .
+                <{target_uri}> syn:altLabel ?altLabel .
             }}
         }}
+        WHERE {{
+            {values_block({"altLabel": source_label})}
+        }}
         """
         await self.fuseki._execute_update(add_alt)
         
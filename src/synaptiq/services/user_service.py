@@ -16,6 +16,7 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from synaptiq.domain.models import User, UserSettings
+from synaptiq.services.auth_service import invalidate_cached_user_on_commit
 from synaptiq.ontology.graph_manager import GraphManager
 from synaptiq.storage.fuseki import FusekiStore
 from synaptiq.storage.qdrant import QdrantStore
@@ -172,6 +173,7 @@ class UserService:
         await self.session.execute(
             update(User).where(User.id == user_id).values(**updates)
         )
+        invalidate_cached_user_on_commit(self.session, user_id)
         
         return await self.get_user(user_id)
     
@@ -545,11 +547,16 @@ class UserService:
             logger.error("Failed to delete user vectors", user_id=user_id, error=str(e))
             result["deleted"]["vectors"] = 0
         
+        # Cached answers live in their own collection (never raises)
+        from synaptiq.agents.response_cache import invalidate_response_cache
+        await invalidate_response_cache(self.qdrant, user_id)
+        
         try:
             # Delete from PostgreSQL (cascades to settings, sessions)
             user = await self.get_user(user_id)
             if user:
                 await self.session.delete(user)
+                invalidate_cached_user_on_commit(self.session, user_id)
                 result["deleted"]["user"] = True
                 logger.info("Deleted user record", user_id=user_id)
             else:
@@ -5,15 +5,25 @@ Provides async SPARQL client with named graph support for multi-tenant
 user knowledge graphs.
 """
 
-import json
+import hashlib
+import itertools
+import re
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 from urllib.parse import urljoin
 
 import httpx
+import orjson
 import structlog
 
 from config.settings import get_settings
+from synaptiq.core.cache import (
+    MISSING,
+    TTLCache,
+    invalidate_user_caches,
+    redis_cache_client,
+)
+from synaptiq.core.concurrency import inflight_limit
 from synaptiq.core.exceptions import StorageError
 from synaptiq.ontology.namespaces import (
     SYNAPTIQ,
@@ -25,6 +35,72 @@ from synaptiq.ontology.namespaces import (
 
 logger = structlog.get_logger(__name__)
 
+# Label -> concept URI lookups (misses included), shared by all FusekiStore
+# instances. Keyed by (user_id, query_endpoint, graph_version, label): a
+# write from any process (e.g. ingestion in a Celery worker) bumps the
+# user's graph version in Redis, so older entries are never read again.
+_concept_uri_cache = TTLCache(maxsize=4096, ttl=300)
+
+# Fuzzy label matches, keyed by (user_id, query_endpoint, graph_version,
+# label, limit); agents re-resolve the same labels within a chat
+_similar_concepts_cache = TTLCache(maxsize=2048, ttl=300)
+
+
+# Backslash, quote and line-break escapes applied in a single pass
+_LITERAL_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    '"': '\\"',
+    "\n": "\\n",
+    "\r": "\\r",
+})
+
+
+def escape_literal(value: str) -> str:
+    """Escape a string so it is safe inside a SPARQL quoted literal."""
+    return value.translate(_LITERAL_ESCAPES)
+
+
+class IRI(str):
+    """A binding value to be sent as an IRI rather than a string literal."""
+
+
+# Characters that may not appear inside an IRIREF
+_INVALID_IRI_CHARS = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+
+
+def _sparql_term(value: Any) -> str:
+    """Serialize a Python value as a SPARQL term for a VALUES block."""
+    if isinstance(value, IRI):
+        if _INVALID_IRI_CHARS.search(value):
+            raise ValueError(f"Invalid IRI for SPARQL binding: {value!r}")
+        return f"<{value}>"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return f'"{escape_literal(str(value))}"'
+
+
+def values_block(bindings: dict[str, Any]) -> str:
+    """
+    Render bindings as an inline VALUES block.
+    
+    Each variable maps to a value or a list of values; the block binds
+    every combination (a single list yields one row per value). Updates,
+    which take no initial_bindings, can place it in their WHERE clause.
+    """
+    names = list(bindings)
+    columns = [
+        value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+        for value in bindings.values()
+    ]
+    rows = " ".join(
+        "(" + " ".join(_sparql_term(term) for term in row) + ")"
+        for row in itertools.product(*columns)
+    )
+    variables = " ".join(f"?{name}" for name in names)
+    return f"VALUES ({variables}) {{ {rows} }}"
+
 
 class FusekiStore:
     """
@@ -58,6 +134,9 @@ class FusekiStore:
         self.dataset = dataset or settings.fuseki_dataset
         self.admin_user = admin_user or settings.fuseki_admin_user
         self.admin_password = admin_password or settings.fuseki_admin_password
+        self.has_text_index = settings.fuseki_text_index
+        self.result_cache_ttl = settings.fuseki_result_cache_ttl_seconds
+        self.max_inflight = settings.fuseki_max_inflight
         
         # Endpoints
         self.query_endpoint = f"{self.url}/{self.dataset}/query"
@@ -88,7 +167,7 @@ class FusekiStore:
             response = await self.client.get(self.admin_endpoint)
             
             if response.status_code == 200:
-                datasets = response.json().get("datasets", [])
+                datasets = orjson.loads(response.content).get("datasets", [])
                 dataset_names = [d.get("ds.name", "").lstrip("/") for d in datasets]
                 
                 if self.dataset in dataset_names:
@@ -185,6 +264,7 @@ class FusekiStore:
         """
         
         await self._execute_update(sparql)
+        await self.invalidate_user_cache(user_id)
         logger.info("User graph created", user_id=user_id, graph_uri=graph_uri)
         return graph_uri
 
@@ -199,6 +279,7 @@ class FusekiStore:
         
         sparql = f"DROP SILENT GRAPH <{graph_uri}>"
         await self._execute_update(sparql)
+        await self.invalidate_user_cache(user_id)
         logger.info("User graph dropped", user_id=user_id, graph_uri=graph_uri)
 
     async def user_graph_exists(self, user_id: str) -> bool:
@@ -279,6 +360,7 @@ class FusekiStore:
         """
         
         await self._execute_update(sparql)
+        await self.invalidate_user_cache(user_id)
         logger.debug("Inserted triples", user_id=user_id, count=len(triples))
         return len(triples)
 
@@ -287,16 +369,31 @@ class FusekiStore:
         user_id: str,
         sparql: str,
         include_ontology: bool = True,
+        initial_bindings: Optional[dict[str, Any]] = None,
+        cache: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Execute a SPARQL SELECT query scoped to a user's graph.
         
         Automatically injects FROM clauses for user isolation.
         
+        With `cache`, results are kept in Redis for
+        FUSEKI_RESULT_CACHE_TTL_SECONDS, keyed by the user's graph version
+        and the final query text, so any write to the graph (from any
+        process) makes earlier entries unreachable.
+        
+        `initial_bindings` lets callers keep `sparql` a constant template:
+        values are serialized and escaped here and bound through a VALUES
+        block at the start of the WHERE clause, so the engine joins them
+        first. Strings become literals; wrap a value in `IRI` to bind an
+        IRI. A list binds the variable to each of its values.
+        
         Args:
             user_id: User identifier
             sparql: SPARQL SELECT query (without FROM clause)
             include_ontology: Whether to include ontology graph for inference
+            initial_bindings: Variable name (without '?') to value(s)
+            cache: Serve repeated identical queries from the result cache
             
         Returns:
             List of result bindings
@@ -314,30 +411,102 @@ class FusekiStore:
         
         # Insert FROM clauses AFTER SELECT/CONSTRUCT/etc. and BEFORE WHERE
         # SPARQL structure: PREFIX... SELECT... FROM... WHERE...
-        import re
         
         # Pattern to find SELECT/CONSTRUCT/ASK/DESCRIBE with optional variables/expressions
-        # and insert FROM before WHERE
+        # and insert FROM before WHERE (and any bindings right after it)
+        replacement = f"{from_clauses}\n\\1"
+        if initial_bindings:
+            values = values_block(initial_bindings).replace("\\", "\\\\")
+            replacement += f"\n{values}"
         where_pattern = r"(WHERE\s*\{)"
         full_sparql = re.sub(
             where_pattern,
-            f"{from_clauses}\n\\1",
+            replacement,
             full_sparql,
             count=1,
             flags=re.IGNORECASE,
         )
         
+        cache_key = None
+        if cache and self.result_cache_ttl > 0:
+            cache_key = await self._result_cache_key(user_id, full_sparql)
+            if cache_key is not None:
+                cached = await self._result_cache_get(cache_key)
+                if cached is not None:
+                    return cached
+        
         result = await self._execute_query(full_sparql, result_format="json")
         
         # Extract bindings
         bindings = result.get("results", {}).get("bindings", [])
-        return [
+        rows = [
             {
                 var: binding[var].get("value")
                 for var in binding
             }
             for binding in bindings
         ]
+        
+        if cache_key is not None:
+            await self._result_cache_put(cache_key, rows)
+        return rows
+
+    @staticmethod
+    def _graph_version_key(user_id: str) -> str:
+        """Redis key of the counter bumped on every write to a user's graph."""
+        return f"sparql:ver:{user_id}"
+
+    async def graph_version(self, user_id: str) -> Optional[int]:
+        """
+        Current version of a user's graph, for keying cached lookups.
+        
+        Every write bumps it (see `invalidate_user_cache`), from whichever
+        process made the write, so a cache keyed by it never serves entries
+        from before another process's write. Returns None if Redis cannot be
+        read; entries cached under None only expire by TTL.
+        """
+        try:
+            version = await redis_cache_client().get(self._graph_version_key(user_id))
+        except Exception as e:
+            logger.warning("Graph version lookup failed", error=str(e))
+            return None
+        return int(version or 0)
+
+    async def _result_cache_key(self, user_id: str, full_sparql: str) -> Optional[str]:
+        """
+        Key a query's results by user, graph version and query text.
+        
+        Indentation and blank lines are ignored so re-formatted repeats
+        still hit. Returns None if the version cannot be read.
+        """
+        canonical = "\n".join(
+            line.strip() for line in full_sparql.splitlines() if line.strip()
+        )
+        digest = hashlib.sha1(
+            f"{self.query_endpoint}|{canonical}".encode()
+        ).hexdigest()
+        version = await self.graph_version(user_id)
+        if version is None:
+            return None
+        return f"sparql:{user_id}:{version}:{digest}"
+
+    async def _result_cache_get(self, key: str) -> Optional[list[dict[str, Any]]]:
+        """Return cached result rows, or None on a miss or cache failure."""
+        try:
+            raw = await redis_cache_client().get(key)
+        except Exception as e:
+            logger.warning("SPARQL cache lookup failed", error=str(e))
+            return None
+        return orjson.loads(raw) if raw else None
+
+    async def _result_cache_put(self, key: str, rows: list[dict[str, Any]]) -> None:
+        """Store result rows; failures are only logged."""
+        try:
+            await redis_cache_client().set(
+                key, orjson.dumps(rows), ex=self.result_cache_ttl
+            )
+        except Exception as e:
+            logger.warning("SPARQL cache write failed", error=str(e))
 
     async def query_raw(self, sparql: str) -> list[dict[str, Any]]:
         """
@@ -379,24 +548,92 @@ class FusekiStore:
             Concept URI if found, None otherwise
         """
         label_lower = label.lower().strip()
+        version = await self.graph_version(user_id)
+        cache_key = (user_id, self.query_endpoint, version, label_lower)
+        cached = _concept_uri_cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
         
-        sparql = f"""
+        sparql = """
         SELECT ?concept
-        WHERE {{
+        WHERE {
             ?concept a syn:Concept .
-            {{
-                ?concept syn:label "{label_lower}" .
-            }} UNION {{
-                ?concept syn:altLabel "{label_lower}" .
-            }}
-        }}
+            {
+                ?concept syn:label ?matchLabel .
+            } UNION {
+                ?concept syn:altLabel ?matchLabel .
+            }
+        }
         LIMIT 1
         """
         
-        results = await self.query(user_id, sparql)
-        if results:
-            return results[0].get("concept")
-        return None
+        results = await self.query(
+            user_id, sparql, initial_bindings={"matchLabel": label_lower}
+        )
+        concept_uri = results[0].get("concept") if results else None
+        _concept_uri_cache.set(cache_key, concept_uri)
+        return concept_uri
+
+    async def concepts_exist_batch(
+        self,
+        user_id: str,
+        labels: Iterable[str],
+    ) -> dict[str, Optional[str]]:
+        """
+        Resolve many labels to concept URIs in a single query.
+        
+        Labels already in the lookup cache are not sent to Fuseki.
+        
+        Args:
+            user_id: User identifier
+            labels: Concept labels to search for
+            
+        Returns:
+            Mapping of lowercased label to concept URI (None if not found)
+        """
+        resolved: dict[str, Optional[str]] = {}
+        missing: list[str] = []
+        version = await self.graph_version(user_id)
+        for label in labels:
+            label_lower = label.lower().strip()
+            if not label_lower or label_lower in resolved:
+                continue
+            cached = _concept_uri_cache.get(
+                (user_id, self.query_endpoint, version, label_lower)
+            )
+            if cached is MISSING:
+                missing.append(label_lower)
+                resolved[label_lower] = None
+            else:
+                resolved[label_lower] = cached
+        
+        if not missing:
+            return resolved
+        
+        sparql = """
+        SELECT ?label ?concept
+        WHERE {
+            ?concept a syn:Concept .
+            {
+                ?concept syn:label ?label .
+            } UNION {
+                ?concept syn:altLabel ?label .
+            }
+        }
+        """
+        
+        rows = await self.query(user_id, sparql, initial_bindings={"label": missing})
+        for row in rows:
+            label = row.get("label")
+            if label in resolved and resolved[label] is None:
+                resolved[label] = row.get("concept")
+        
+        for label in missing:
+            _concept_uri_cache.set(
+                (user_id, self.query_endpoint, version, label), resolved[label]
+            )
+        
+        return resolved
 
     async def find_similar_concepts(
         self,
@@ -416,6 +653,11 @@ class FusekiStore:
             List of concepts with label and uri
         """
         label_lower = label.lower().strip()
+        version = await self.graph_version(user_id)
+        cache_key = (user_id, self.query_endpoint, version, label_lower, limit)
+        cached = _similar_concepts_cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
         
         sparql = f"""
         SELECT DISTINCT ?concept ?conceptLabel ?altLabel
@@ -424,14 +666,18 @@ class FusekiStore:
                      syn:label ?conceptLabel .
             OPTIONAL {{ ?concept syn:altLabel ?altLabel }}
             FILTER(
-                CONTAINS(LCASE(?conceptLabel), "{label_lower}") ||
-                CONTAINS(LCASE(COALESCE(?altLabel, "")), "{label_lower}")
+                CONTAINS(LCASE(?conceptLabel), ?needle) ||
+                CONTAINS(LCASE(COALESCE(?altLabel, "")), ?needle)
             )
         }}
-        LIMIT {limit}
+        LIMIT {int(limit)}
         """
         
-        return await self.query(user_id, sparql)
+        results = await self.query(
+            user_id, sparql, initial_bindings={"needle": label_lower}
+        )
+        _similar_concepts_cache.set(cache_key, results)
+        return results
 
     async def get_concept_with_definition(
         self,
@@ -469,6 +715,202 @@ class FusekiStore:
         results = await self.query(user_id, sparql)
         return results[0] if results else None
 
+    async def get_concepts_with_definitions_batch(
+        self,
+        user_id: str,
+        labels: Iterable[str],
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Resolve labels to concepts and fetch their definitions in one query.
+        
+        Equivalent to `concept_exists` followed by `get_concept_with_definition`
+        for each label, in a single round-trip. Resolved URIs also warm the
+        lookup cache used by `concept_exists`.
+        
+        Args:
+            user_id: User identifier
+            labels: Concept labels to search for
+            
+        Returns:
+            Mapping of lowercased label to concept details (with `concept`,
+            `label`, `definitionText`, `sourceTitle`, `sourceUrl`); labels
+            with no matching concept are omitted
+        """
+        wanted = list(dict.fromkeys(
+            label.lower().strip() for label in labels if label and label.strip()
+        ))
+        if not wanted:
+            return {}
+        version = await self.graph_version(user_id)
+        
+        sparql = """
+        SELECT ?matchLabel ?concept ?label ?definitionText ?sourceTitle ?sourceUrl
+        WHERE {
+            ?concept a syn:Concept ;
+                     syn:label ?label .
+            {
+                ?concept syn:label ?matchLabel .
+            } UNION {
+                ?concept syn:altLabel ?matchLabel .
+            }
+            OPTIONAL {
+                ?concept syn:hasDefinition ?def .
+                ?def syn:definitionText ?definitionText .
+            }
+            OPTIONAL {
+                ?concept syn:definedIn ?chunk .
+                ?chunk syn:derivedFrom ?source .
+                ?source syn:sourceTitle ?sourceTitle .
+                ?source syn:sourceUrl ?sourceUrl .
+            }
+        }
+        """
+        
+        rows = await self.query(
+            user_id, sparql, initial_bindings={"matchLabel": wanted}
+        )
+        
+        details: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            match_label = row.pop("matchLabel", None)
+            if match_label in details:
+                continue
+            details[match_label] = row
+        
+        for label in wanted:
+            found = details.get(label)
+            _concept_uri_cache.set(
+                (user_id, self.query_endpoint, version, label),
+                found.get("concept") if found else None,
+            )
+        
+        return details
+
+    async def get_concept_bundle(
+        self,
+        user_id: str,
+        labels: Iterable[str] = (),
+        concept_uri: Optional[str] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Resolve a concept and fetch its definition and relationships at once.
+        
+        Equivalent to `concept_exists` (over each label in turn), then
+        `get_concept_with_definition` and `get_concept_relationships`, in a
+        single round-trip. Pass `concept_uri` instead of labels when the
+        concept is already resolved.
+        
+        Args:
+            user_id: User identifier
+            labels: Candidate labels in order of preference (e.g. synonyms)
+            concept_uri: Known concept URI; overrides `labels`
+            
+        Returns:
+            Dict with `uri`, `details` and `relationships`, or None if no
+            label matches a concept
+        """
+        if concept_uri is not None:
+            wanted = []
+            bindings: dict[str, Any] = {"concept": IRI(concept_uri)}
+        else:
+            wanted = list(dict.fromkeys(
+                label.lower().strip() for label in labels if label and label.strip()
+            ))
+            if not wanted:
+                return None
+            bindings = {"matchLabel": wanted}
+        version = await self.graph_version(user_id) if wanted else None
+        
+        sparql = """
+        SELECT ?matchLabel ?concept ?label ?definitionText ?sourceTitle ?sourceUrl
+               ?relationType ?relatedConcept ?relatedLabel
+        WHERE {
+            ?concept a syn:Concept .
+            {
+                ?concept syn:label ?matchLabel .
+            } UNION {
+                ?concept syn:altLabel ?matchLabel .
+            }
+            {
+                ?concept syn:label ?label .
+                OPTIONAL {
+                    ?concept syn:hasDefinition ?def .
+                    ?def syn:definitionText ?definitionText .
+                }
+                OPTIONAL {
+                    ?concept syn:definedIn ?chunk .
+                    ?chunk syn:derivedFrom ?source .
+                    ?source syn:sourceTitle ?sourceTitle .
+                    ?source syn:sourceUrl ?sourceUrl .
+                }
+            } UNION {
+                ?concept ?relationType ?relatedConcept .
+                ?relatedConcept a syn:Concept ;
+                               syn:label ?relatedLabel .
+                FILTER(?relationType IN (
+                    syn:isA, syn:partOf, syn:prerequisiteFor,
+                    syn:relatedTo, syn:oppositeOf, syn:usedIn
+                ))
+            } UNION {
+                ?relatedConcept ?relationType ?concept .
+                ?relatedConcept a syn:Concept ;
+                               syn:label ?relatedLabel .
+                FILTER(?relationType IN (
+                    syn:isA, syn:partOf, syn:prerequisiteFor,
+                    syn:relatedTo, syn:oppositeOf, syn:usedIn
+                ))
+            }
+        }
+        """
+        
+        rows = await self.query(user_id, sparql, initial_bindings=bindings)
+        
+        # Concept per matched label; the first label in preference order wins
+        uri_by_label: dict[str, str] = {}
+        for row in rows:
+            uri_by_label.setdefault(row.get("matchLabel"), row["concept"])
+        for label in wanted:
+            _concept_uri_cache.set(
+                (user_id, self.query_endpoint, version, label), uri_by_label.get(label)
+            )
+        
+        if concept_uri is None:
+            concept_uri = next(
+                (uri_by_label[label] for label in wanted if label in uri_by_label),
+                None,
+            )
+        if concept_uri is None or not rows:
+            return None
+        
+        details: Optional[dict[str, Any]] = None
+        relationships: list[dict[str, Any]] = []
+        seen_relationships: set[tuple] = set()
+        for row in rows:
+            if row["concept"] != concept_uri:
+                continue
+            if "relationType" in row:
+                # Rows repeat once per matched label; keep each edge once
+                edge = (row["relationType"], row["relatedConcept"], row["relatedLabel"])
+                if edge not in seen_relationships:
+                    seen_relationships.add(edge)
+                    relationships.append({
+                        "relationType": edge[0],
+                        "relatedConcept": edge[1],
+                        "relatedLabel": edge[2],
+                    })
+            elif details is None and "label" in row:
+                details = {
+                    key: row[key]
+                    for key in ("label", "definitionText", "sourceTitle", "sourceUrl")
+                    if key in row
+                }
+        
+        return {
+            "uri": concept_uri,
+            "details": details,
+            "relationships": relationships,
+        }
+
     async def get_concept_relationships(
         self,
         user_id: str,
@@ -571,6 +1013,7 @@ class FusekiStore:
         """
         
         await self._execute_update(sparql)
+        await self.invalidate_user_cache(user_id)
         logger.info("Concept deleted", user_id=user_id, concept_uri=concept_uri)
 
     async def _execute_query(
@@ -597,19 +1040,22 @@ class FusekiStore:
         try:
             logger.info("Executing SPARQL query", query=sparql)
             
-            response = await self.client.post(
-                self.query_endpoint,
-                data={"query": sparql},
-                headers={
-                    "Accept": accept_map.get(result_format, "application/sparql-results+json"),
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-            )
+            # Cap in-flight SPARQL requests across all stores in the process
+            async with inflight_limit("fuseki", self.max_inflight):
+                response = await self.client.post(
+                    self.query_endpoint,
+                    data={"query": sparql},
+                    headers={
+                        "Accept": accept_map.get(result_format, "application/sparql-results+json"),
+                        "Content-Type": "application/x-www-form-urlencoded",
+                    },
+                )
             
             response.raise_for_status()
             
             if result_format == "json":
-                data = response.json()
+                # orjson parses the raw bytes, skipping the text decode
+                data = orjson.loads(response.content)
                 logger.info("SPARQL results", results=data)
                 return data
                 
@@ -632,11 +1078,12 @@ class FusekiStore:
             sparql: SPARQL update string
         """
         try:
-            response = await self.client.post(
-                self.update_endpoint,
-                data={"update": sparql},
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
+            async with inflight_limit("fuseki", self.max_inflight):
+                response = await self.client.post(
+                    self.update_endpoint,
+                    data={"update": sparql},
+                    headers={"Content-Type": "application/x-www-form-urlencoded"},
+                )
             
             if response.status_code not in (200, 204):
                 logger.error(
@@ -681,6 +1128,24 @@ class FusekiStore:
         full_sparql = f"{get_sparql_prefixes()}\nWITH <{graph_uri}>\n{sparql}"
         
         await self._execute_update(full_sparql)
+        await self.invalidate_user_cache(user_id)
+
+    async def invalidate_user_cache(self, user_id: str) -> None:
+        """
+        Drop cached lookups for a user after their graph changes.
+        
+        Clears this process's lookup caches and bumps the user's graph
+        version, which retires their cached lookups and SPARQL results in
+        every process.
+        
+        Args:
+            user_id: User identifier
+        """
+        invalidate_user_caches(user_id)
+        try:
+            await redis_cache_client().incr(self._graph_version_key(user_id))
+        except Exception as e:
+            logger.warning("SPARQL cache invalidation failed", user_id=user_id, error=str(e))
 
     def _now_iso(self) -> str:
         """Get current timestamp in ISO format."""
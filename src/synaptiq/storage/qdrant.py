@@ -2,6 +2,8 @@
 Qdrant vector store for storing and searching embeddings.
 """
 
+import asyncio
+import functools
 from typing import Any, Optional
 from uuid import UUID
 
@@ -10,12 +12,57 @@ from qdrant_client import AsyncQdrantClient, models
 from qdrant_client.http.exceptions import UnexpectedResponse
 
 from config.settings import get_settings
+from synaptiq.core.concurrency import inflight_limit
 from synaptiq.core.exceptions import StorageError
 from synaptiq.core.schemas import ProcessedChunk
 
 logger = structlog.get_logger(__name__)
 
 
+def _scalar_conditions(
+    user_id: str,
+    source_type: Optional[str],
+    has_definition: Optional[bool],
+) -> list[models.FieldCondition]:
+    """Tenant and scalar payload conditions shared by every chunk search."""
+    must_conditions = [
+        models.FieldCondition(
+            key="user_id",
+            match=models.MatchValue(value=user_id),
+        )
+    ]
+    if source_type:
+        must_conditions.append(
+            models.FieldCondition(
+                key="source_type",
+                match=models.MatchValue(value=source_type),
+            )
+        )
+    if has_definition is not None:
+        must_conditions.append(
+            models.FieldCondition(
+                key="has_definition",
+                match=models.MatchValue(value=has_definition),
+            )
+        )
+    return must_conditions
+
+
+@functools.lru_cache(maxsize=256)
+def _scalar_search_filter(
+    user_id: str,
+    source_type: Optional[str],
+    has_definition: Optional[bool],
+) -> models.Filter:
+    """
+    Build a chunk search filter without list conditions.
+    
+    Cached: filters are only read when the request is serialized, so the
+    same object is safely shared by every search with these arguments.
+    """
+    return models.Filter(must=_scalar_conditions(user_id, source_type, has_definition))
+
+
 class QdrantStore:
     """
     Async Qdrant client for vector storage and search.
@@ -46,16 +93,22 @@ class QdrantStore:
         self.api_key = api_key or settings.qdrant_api_key
         self.collection_name = collection_name or settings.qdrant_collection_name
         self.dimensions = settings.embedding_dimensions
+        self.max_inflight = settings.qdrant_max_inflight
+        self.int8_quantization = settings.qdrant_int8_quantization
 
+        # gRPC sends query and point vectors as packed floats; REST has to
+        # format and parse every component as JSON text
         self.client = AsyncQdrantClient(
             url=self.url,
             api_key=self.api_key,
+            prefer_grpc=settings.qdrant_prefer_grpc,
         )
 
         logger.info(
             "QdrantStore initialized",
             url=self.url,
             collection=self.collection_name,
+            grpc=settings.qdrant_prefer_grpc,
         )
 
     async def ensure_collection(self) -> None:
@@ -71,19 +124,35 @@ class QdrantStore:
                 logger.info("Collection already exists", collection=self.collection_name)
                 return
 
-            # Create collection with vector config
+            # Create collection with vector config. INT8 scalar quantization
+            # keeps a 4x smaller copy of the vectors in RAM for the HNSW
+            # search; Qdrant rescores the top candidates with the originals.
+            quantization_config = None
+            if self.int8_quantization:
+                quantization_config = models.ScalarQuantization(
+                    scalar=models.ScalarQuantizationConfig(
+                        type=models.ScalarType.INT8,
+                        quantile=0.99,
+                        always_ram=True,
+                    )
+                )
             await self.client.create_collection(
                 collection_name=self.collection_name,
                 vectors_config=models.VectorParams(
                     size=self.dimensions,
                     distance=models.Distance.COSINE,
                 ),
+                quantization_config=quantization_config,
             )
 
             # Create payload indexes for efficient filtering
             await self._create_payload_indexes()
 
-            logger.info("Collection created", collection=self.collection_name)
+            logger.info(
+                "Collection created",
+                collection=self.collection_name,
+                int8_quantization=self.int8_quantization,
+            )
 
         except Exception as e:
             logger.error("Failed to ensure collection", error=str(e))
@@ -166,56 +235,21 @@ class QdrantStore:
                 cause=e,
             )
 
-    async def search(
-        self,
-        query_vector: list[float],
+    @staticmethod
+    def _build_search_filter(
         user_id: str,
-        limit: int = 10,
         source_type: Optional[str] = None,
         has_definition: Optional[bool] = None,
         concepts: Optional[list[str]] = None,
         document_ids: Optional[list[str]] = None,
-        score_threshold: float = 0.0,
-    ) -> list[dict[str, Any]]:
-        """
-        Search for similar chunks with filtering.
-        
-        Args:
-            query_vector: Query embedding vector
-            user_id: User ID for multi-tenant filtering (required)
-            limit: Maximum results to return
-            source_type: Filter by source type
-            has_definition: Filter for definition chunks
-            concepts: Filter by concepts (any match)
-            document_ids: Filter by source document IDs
-            score_threshold: Minimum similarity score
-            
-        Returns:
-            List of search results with payload and score
-        """
-        # Build filter conditions
-        must_conditions = [
-            models.FieldCondition(
-                key="user_id",
-                match=models.MatchValue(value=user_id),
-            )
-        ]
+    ) -> models.Filter:
+        """Build the multi-tenant payload filter used by chunk searches."""
+        if not concepts and not document_ids:
+            # Common shape (tenant plus scalar filters) is reused across calls
+            return _scalar_search_filter(user_id, source_type, has_definition)
 
-        if source_type:
-            must_conditions.append(
-                models.FieldCondition(
-                    key="source_type",
-                    match=models.MatchValue(value=source_type),
-                )
-            )
-
-        if has_definition is not None:
-            must_conditions.append(
-                models.FieldCondition(
-                    key="has_definition",
-                    match=models.MatchValue(value=has_definition),
-                )
-            )
+        # Build filter conditions
+        must_conditions = _scalar_conditions(user_id, source_type, has_definition)
 
         if document_ids:
             must_conditions.append(
@@ -236,20 +270,67 @@ class QdrantStore:
                 for concept in concepts
             ]
 
-        query_filter = models.Filter(
+        return models.Filter(
             must=must_conditions,
             should=should_conditions if should_conditions else None,
         )
 
+    @staticmethod
+    def _payload_selector(
+        payload_fields: Optional[list[str]],
+    ) -> bool | models.PayloadSelectorInclude:
+        """Return the payload selector for a search (all fields by default)."""
+        if payload_fields is None:
+            return True
+        return models.PayloadSelectorInclude(include=list(payload_fields))
+
+    async def search(
+        self,
+        query_vector: list[float],
+        user_id: str,
+        limit: int = 10,
+        source_type: Optional[str] = None,
+        has_definition: Optional[bool] = None,
+        concepts: Optional[list[str]] = None,
+        document_ids: Optional[list[str]] = None,
+        score_threshold: float = 0.0,
+        payload_fields: Optional[list[str]] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Search for similar chunks with filtering.
+        
+        Args:
+            query_vector: Query embedding vector
+            user_id: User ID for multi-tenant filtering (required)
+            limit: Maximum results to return
+            source_type: Filter by source type
+            has_definition: Filter for definition chunks
+            concepts: Filter by concepts (any match)
+            document_ids: Filter by source document IDs
+            score_threshold: Minimum similarity score
+            payload_fields: Payload keys to return (default: all)
+            
+        Returns:
+            List of search results with payload and score
+        """
+        query_filter = self._build_search_filter(
+            user_id=user_id,
+            source_type=source_type,
+            has_definition=has_definition,
+            concepts=concepts,
+            document_ids=document_ids,
+        )
+
         try:
-            results = await self.client.query_points(
-                collection_name=self.collection_name,
-                query=query_vector,
-                query_filter=query_filter,
-                limit=limit,
-                score_threshold=score_threshold,
-                with_payload=True,
-            )
+            async with inflight_limit("qdrant", self.max_inflight):
+                results = await self.client.query_points(
+                    collection_name=self.collection_name,
+                    query=query_vector,
+                    query_filter=query_filter,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    with_payload=self._payload_selector(payload_fields),
+                )
 
             # query_points returns QueryResponse object with points attribute
             points = results.points if hasattr(results, "points") else results
@@ -272,6 +353,68 @@ class QdrantStore:
                 cause=e,
             )
 
+    async def search_batch(
+        self,
+        searches: list[dict[str, Any]],
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Run several searches in a single Qdrant request.
+        
+        Args:
+            searches: Keyword arguments for each search, as accepted by
+                `search` (query_vector and user_id are required)
+            
+        Returns:
+            One result list per search, in the same order
+        """
+        if not searches:
+            return []
+
+        requests = [
+            models.QueryRequest(
+                query=params["query_vector"],
+                filter=self._build_search_filter(
+                    user_id=params["user_id"],
+                    source_type=params.get("source_type"),
+                    has_definition=params.get("has_definition"),
+                    concepts=params.get("concepts"),
+                    document_ids=params.get("document_ids"),
+                ),
+                limit=params.get("limit", 10),
+                score_threshold=params.get("score_threshold", 0.0),
+                with_payload=self._payload_selector(params.get("payload_fields")),
+            )
+            for params in searches
+        ]
+
+        try:
+            async with inflight_limit("qdrant", self.max_inflight):
+                responses = await self.client.query_batch_points(
+                    collection_name=self.collection_name,
+                    requests=requests,
+                )
+
+            return [
+                [
+                    {
+                        "id": str(hit.id),
+                        "score": hit.score,
+                        "payload": hit.payload,
+                    }
+                    for hit in response.points
+                ]
+                for response in responses
+            ]
+
+        except Exception as e:
+            logger.error("Batch search failed", error=str(e), batch_size=len(searches))
+            raise StorageError(
+                message=f"Batch search failed: {str(e)}",
+                store_type="qdrant",
+                operation="search_batch",
+                cause=e,
+            )
+
     async def delete_by_document(self, document_id: str, user_id: str) -> int:
         """
         Delete all chunks for a document.
@@ -598,14 +741,15 @@ class QdrantStore:
         query_filter = models.Filter(must=must_conditions)
         
         try:
-            results = await self.client.query_points(
-                collection_name=self.collection_name,
-                query=query_vector,
-                query_filter=query_filter,
-                limit=limit,
-                score_threshold=score_threshold,
-                with_payload=True,
-            )
+            async with inflight_limit("qdrant", self.max_inflight):
+                results = await self.client.query_points(
+                    collection_name=self.collection_name,
+                    query=query_vector,
+                    query_filter=query_filter,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    with_payload=True,
+                )
             
             points = results.points if hasattr(results, "points") else results
             
@@ -688,3 +832,104 @@ class QdrantStore:
     async def close(self) -> None:
         """Close the client connection."""
         await self.client.close()
+
+
+class QdrantBatchCoalescer:
+    """
+    Coalesce concurrent chunk searches into batched Qdrant requests.
+    
+    Searches submitted within a short window (a few milliseconds) are sent
+    together through `QdrantStore.search_batch`, so concurrent queries
+    share one round-trip instead of issuing one request each. A search
+    arriving while no batch is in flight or pending is sent at once, so an
+    idle coalescer adds no latency.
+    """
+
+    def __init__(
+        self,
+        qdrant_store: QdrantStore,
+        window_ms: float = 5.0,
+        max_batch_size: int = 64,
+    ):
+        """
+        Initialize the coalescer.
+        
+        Args:
+            qdrant_store: Store used to execute batched searches
+            window_ms: How long to wait for more searches before flushing
+                while another batch is in flight
+            max_batch_size: Flush immediately once this many are pending
+        """
+        self.qdrant = qdrant_store
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max_batch_size
+        self._pending: list[tuple[dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        query_vector: list[float],
+        user_id: str,
+        limit: int = 10,
+        document_ids: Optional[list[str]] = None,
+        **filters: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Queue a search and wait for its results.
+        
+        Accepts the same arguments as `QdrantStore.search`.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((
+            {
+                "query_vector": query_vector,
+                "user_id": user_id,
+                "limit": limit,
+                "document_ids": document_ids,
+                **filters,
+            },
+            future,
+        ))
+
+        if len(self._pending) >= self.max_batch_size or (
+            # Nothing to coalesce with: don't wait out the window
+            self._timer is None and not self._inflight
+        ):
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Let more searches join the batch, then flush it."""
+        await asyncio.sleep(self.window)
+        self._timer = None
+        self._flush()
+
+    def _flush(self) -> None:
+        """Send every pending search in one batch request."""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._execute(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _execute(
+        self,
+        batch: list[tuple[dict[str, Any], asyncio.Future]],
+    ) -> None:
+        """Run a batch and resolve each caller's future with its slice."""
+        try:
+            results = await self.qdrant.search_batch([params for params, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
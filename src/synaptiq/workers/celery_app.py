@@ -5,8 +5,10 @@ Celery application configuration.
 from celery import Celery
 
 from config.settings import get_settings
+from synaptiq.core.logging_config import configure_logging
 
 settings = get_settings()
+configure_logging(settings.log_level)
 
 # Create Celery app
 celery_app = Celery(
@@ -41,6 +43,8 @@ celery_app.conf.update(
         "synaptiq.workers.tasks.ingest_url_task": {"queue": "ingestion"},
         "synaptiq.workers.tasks.consolidate_graph_task": {"queue": "ingestion"},
         "synaptiq.workers.tasks.poll_supadata_job_task": {"queue": "polling"},
+        # New-user graph provisioning must not wait behind long ingestion jobs
+        "synaptiq.workers.tasks.onboard_user_task": {"queue": "onboarding"},
     },
     
     # Rate limiting
@@ -65,6 +69,10 @@ celery_app.conf.task_queues = {
         "exchange": "polling", 
         "routing_key": "polling",
     },
+    "onboarding": {
+        "exchange": "onboarding",
+        "routing_key": "onboarding",
+    },
     "celery": {
         "exchange": "celery",
         "routing_key": "celery",
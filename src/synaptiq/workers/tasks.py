@@ -87,6 +87,13 @@ async def _enqueue_graph_consolidation(user_id: str) -> None:
         )
 
 
+async def _invalidate_response_cache(qdrant: QdrantStore, user_id: str) -> None:
+    """Drop cached query answers for a user whose knowledge base just changed."""
+    from synaptiq.agents.response_cache import invalidate_response_cache
+
+    await invalidate_response_cache(qdrant, user_id)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # USER LIFECYCLE TASKS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -187,6 +194,7 @@ async def _delete_user_async(user_id: str) -> dict:
         # Delete vectors
         qdrant_count = await qdrant.delete_by_user(user_id)
         logger.info("Deleted user vectors", user_id=user_id, count=qdrant_count)
+        await _invalidate_response_cache(qdrant, user_id)
         
         # Delete sources
         sources_result = await mongo.sources.delete_many({"user_id": user_id})
@@ -366,6 +374,7 @@ async def _ingest_url_async(
 
         # Store chunks in Qdrant
         chunk_count = await qdrant.upsert_chunks(processed_chunks)
+        await _invalidate_response_cache(qdrant, user_id)
 
         # Save source document to MongoDB only after all processing is complete
         await mongo.save_source(document)
@@ -546,6 +555,7 @@ async def _ingest_note_async(
 
         # Store chunks in Qdrant
         chunk_count = await qdrant.upsert_chunks(processed_chunks)
+        await _invalidate_response_cache(qdrant, user_id)
 
         # Update job as completed
         await mongo.update_job(
@@ -714,6 +724,7 @@ async def _ingest_file_async(
 
         # Store chunks in Qdrant
         chunk_count = await qdrant.upsert_chunks(processed_chunks)
+        await _invalidate_response_cache(qdrant, user_id)
 
         # Update job as completed
         await mongo.update_job(